@@ -0,0 +1,137 @@
+# -*- encoding: utf-8 -*-
+
+"""
+Headless rendering benchmark.
+
+Renders frames of Round.example() through the same pipeline as main.py into an off-screen surface,
+using SDL dummy video driver so that it can run on machines without a display. Each frame scripted
+key input is fed to the round, so that sprites actually change and get redrawn.
+
+Allocations per frame are compared against a stored baseline and the process exits with non-zero status
+if they regress beyond the threshold, or if there is no baseline. Frames per second depend on the machine
+the benchmark runs on, so they are only reported, never stored or compared.
+"""
+
+# region STD lib imports
+import argparse
+import contextlib
+import itertools as it
+import json
+import os
+import sys
+import time
+import tracemalloc
+# endregion
+
+# SDL has to be told to use dummy driver before pygame gets initialized.
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+# region External imports
+import pygame
+# endregion
+
+# region Internal imports
+import main as game
+import games.caravan.logic.worker as worker
+import gui.assets.cache as asset_cache
+from gui.config import defaults
+from games.caravan.input import UserInputOptions
+# endregion
+
+
+DEFAULT_BASELINE = r"benchmark_baseline.json"
+# Input cycled through during the benchmark - move selection around, pick a card, move it and cancel.
+SCRIPTED_INPUT = [UserInputOptions.MOVE_RIGHT, UserInputOptions.MOVE_RIGHT, UserInputOptions.MOVE_LEFT,
+                  UserInputOptions.ACCEPT, UserInputOptions.MOVE_UP, UserInputOptions.MOVE_RIGHT,
+                  UserInputOptions.MOVE_DOWN, UserInputOptions.MOVE_LEFT, UserInputOptions.CANCEL]
+# Metrics that don't depend on the hardware, the only ones stored in the baseline and compared against it.
+GATED_METRICS = ("allocated_bytes_per_frame", "retained_blocks_per_frame")
+# Absolute slack for allocation comparison, so that tiny baselines don't fail on noise.
+ALLOCATION_SLACK = 1024
+
+
+def render_frames(frames: int, traced: bool = False) -> dict[str, float]:
+    """Render the frames, measure either the frame rate or (traced) allocations of each frame."""
+    screen = pygame.display.get_surface()
+    background = asset_cache.load_background(screen.get_size())
+    surface = pygame.Surface(screen.get_size()).convert()
+    surface.blit(background, (0, 0))
+    button_group, render_group, _hit_index, round_view = game.create_scene(surface, background)
+    scripted_input = it.cycle(SCRIPTED_INPUT)
+    # Not started, logic runs in step with the frames so that each of them does the same amount of work.
+    logic = worker.LogicThread(round_view.round_manager)
+
+    allocated = 0
+    if traced:
+        tracemalloc.start()
+    start_blocks = sys.getallocatedblocks()
+    start = time.perf_counter()
+    for _ in range(frames):
+        if traced:
+            tracemalloc.reset_peak()
+            before, _peak = tracemalloc.get_traced_memory()
+        logic.submit(next(scripted_input))
+        logic.tick()
+        game.update_views(button_group, round_view, logic.snapshots, 1000 / defaults.FRAMERATE)
+        render_group.draw(surface)
+        if traced:
+            _current, peak = tracemalloc.get_traced_memory()
+            allocated += peak - before
+    elapsed = time.perf_counter() - start
+    retained_blocks = sys.getallocatedblocks() - start_blocks
+    if traced:
+        tracemalloc.stop()
+        return {
+            "allocated_bytes_per_frame": allocated / frames,
+            "retained_blocks_per_frame": retained_blocks / frames
+        }
+    return {"fps": frames / elapsed}
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], threshold: float) -> list[str]:
+    """Describe every metric that has regressed beyond the threshold."""
+    regressions = []
+    for metric in GATED_METRICS:
+        if metric in baseline and results[metric] > baseline[metric] * (1 + threshold) + ALLOCATION_SLACK:
+            regressions.append(f"{metric} grew from {baseline[metric]:.1f} to {results[metric]:.1f}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless rendering benchmark of the round view.")
+    parser.add_argument("-n", "--frames", type=int, default=2000, help="number of frames to render.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="path of the stored baseline.")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed relative regression.")
+    parser.add_argument("--update-baseline", action="store_true", help="store results as the new baseline.")
+    parser.add_argument("--allow-missing-baseline", action="store_true",
+                        help="exit with zero status if there is no baseline to compare against.")
+    args = parser.parse_args()
+
+    game.init_display()
+    # round manager reports some of the input on stdout.
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        # warm up caches, so that neither of the passes measures lazy asset loading.
+        render_frames(len(SCRIPTED_INPUT))
+        results = render_frames(args.frames) | render_frames(args.frames, traced=True)
+    for metric, value in results.items():
+        print(f"{metric:<28}{value:>12.2f}")
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as baseline_file:
+            json.dump({metric: results[metric] for metric in GATED_METRICS}, baseline_file, indent=2)
+        print(f"baseline stored in {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}, run with --update-baseline to store one.")
+        sys.exit(0 if args.allow_missing_baseline else 1)
+
+    with open(args.baseline) as baseline_file:
+        regressions = compare(results, json.load(baseline_file), args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION: {regression}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
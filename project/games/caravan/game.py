@@ -1,7 +1,10 @@
 # -*- encoding: utf-8 -*-
 
+from __future__ import annotations
 
+# STD lib imports
 from enum import Enum, auto
+from typing import Optional
 
 
 class Game:
@@ -24,3 +27,9 @@ class Game:
 
     def __init__(self, stage: Stages):
         self.current_stage = stage
+
+    def next_stage(self) -> Optional[Game.Stages]:
+        """Stage that follows the current one, None after the last stage."""
+        stages = list(Game.Stages)
+        index = stages.index(self.current_stage) + 1
+        return stages[index] if index < len(stages) else None
@@ -1,5 +1,14 @@
 # -*- encoding: utf-8 -*-
 
+"""
+This module exposes the logic of the deck assembly stage of caravan via the DeckComposition object.
+"""
+
+from __future__ import annotations
+
+# Internal imports
+from games.caravan.logic.round import Card, Deck, HorizontalDirection
+
 
 class DeckComposition:
 
@@ -15,16 +24,9 @@ class DeckComposition:
         self.SELECT_CARDs[self.selection_position] = False
 
     def move_selection(self, direction: HorizontalDirection):
-        max_index = len(self.available_cards) - 1
-        match direction, self.selection_position:
-            case HorizontalDirection.LEFT, 0:
-                self.selection_position = max_index
-            case HorizontalDirection.LEFT:
-                self.selection_position -= 1
-            case HorizontalDirection.RIGHT, max_index:
-                self.selection_position = 0
-            case HorizontalDirection.RIGHT:
-                self.selection_position += 1
+        """Move selection by one card, it wraps around at both ends."""
+        step = -1 if direction is HorizontalDirection.LEFT else 1
+        self.selection_position = (self.selection_position + step) % len(self.available_cards)
 
     def accept_deck(self) -> Deck:
         return Deck([card for card, picked in zip(self.available_cards, self.SELECT_CARDs) if picked])
@@ -0,0 +1,105 @@
+# -*- encoding: utf-8 -*-
+
+"""
+This module exposes complete moves of the round.
+
+Local player drives the RoundManager step by step (select a card, move it around, accept), a remote player
+or a bot sends the whole move at once. Moves are validated against the same rules the RoundManager uses
+for highlighting, so a move is legal exactly when the card would have been highlighted as correct.
+"""
+
+from __future__ import annotations
+
+# STD lib imports
+import itertools as it
+from enum import Enum, auto
+from typing import NamedTuple
+
+# Internal imports
+from games.caravan.logic.round import Caravan, Card, PickedCardPosition, Player, RoundManager
+
+
+class Move(NamedTuple):
+    """Move of the active player, positions are absolute - as in the RoundManager's table."""
+
+    class Kind(Enum):
+        PLACE   = auto()  # place hand card on a caravan.
+        DISCARD = auto()  # discard own caravan.
+
+    kind: Move.Kind
+    hand_index: int = 0
+    player: Player.Position = Player.Position.BOTTOM
+    caravan: Caravan.Position = Caravan.Position.LEFT
+    card_index: int = 0
+    location: PickedCardPosition.Location = PickedCardPosition.Location.TOP
+
+    def position(self) -> PickedCardPosition:
+        return PickedCardPosition(self.player, self.caravan, self.card_index, self.location)
+
+
+class TurnBasedRound(RoundManager):
+    """Round manager driven by complete moves of both players, the turn passes after each move."""
+
+    def finish_turn(self) -> None:
+        self.make_active(self.active_player.other())
+
+
+def is_legal(round_manager: RoundManager, move: Move) -> bool:
+    """Check whether the active player can make the move, state of the round is left untouched."""
+    if round_manager.state is not RoundManager.State.SELECT_CARD:
+        return False
+    active_player = round_manager.table.players[round_manager.active_player]
+    caravan = round_manager.table.players[move.player].caravans[move.caravan]
+    match move.kind:
+        case Move.Kind.DISCARD:
+            return move.player is round_manager.active_player and len(caravan) > 0
+        case Move.Kind.PLACE:
+            if not 0 <= move.hand_index < len(active_player.hand):
+                return False
+            if move.location is PickedCardPosition.Location.OTHER and not 0 <= move.card_index < len(caravan):
+                return False
+            saved = round_manager.picked_card, round_manager.picked_card_position
+            round_manager.picked_card = active_player.hand.sequence[move.hand_index]
+            round_manager.picked_card_position = move.position()
+            try:
+                return round_manager.is_current_picked_card_position_correct()
+            finally:
+                round_manager.picked_card, round_manager.picked_card_position = saved
+    return False
+
+
+def play(round_manager: RoundManager, move: Move) -> bool:
+    """Validate the move and make it, round manager broadcasts deltas of the move as usual.
+
+    :return: whether the move was legal.
+    """
+    if not is_legal(round_manager, move):
+        return False
+    match move.kind:
+        case Move.Kind.DISCARD:
+            round_manager.discard_caravan(round_manager.active_player, move.caravan)
+        case Move.Kind.PLACE:
+            round_manager.selected_hand_card = round_manager.hand_selection.select(move.hand_index)
+            round_manager.pick_selected_card()
+            round_manager.picked_card_position = move.position()
+            round_manager.place_picked_card()
+    return True
+
+
+def legal_moves(round_manager: RoundManager) -> list[Move]:
+    """All the moves the active player can make."""
+    discards = (Move(Move.Kind.DISCARD, player=round_manager.active_player, caravan=position)
+                for position in Caravan.Position)
+    moves = [move for move in discards if is_legal(round_manager, move)]
+    hand = round_manager.table.players[round_manager.active_player].hand.sequence
+    for hand_index, card in enumerate(hand):
+        for player, caravan_position in it.product(Player.Position, Caravan.Position):
+            if card.type is Card.Type.VALUE:
+                candidates = [Move(Move.Kind.PLACE, hand_index, player, caravan_position)]
+            else:
+                caravan = round_manager.table.players[player].caravans[caravan_position]
+                candidates = [Move(Move.Kind.PLACE, hand_index, player, caravan_position, card_index,
+                                   PickedCardPosition.Location.OTHER)
+                              for card_index in range(len(caravan))]
+            moves.extend(move for move in candidates if is_legal(round_manager, move))
+    return moves
@@ -18,14 +18,12 @@ import random
 from collections import deque
 from collections.abc import Sized
 from enum import Enum, auto
-from typing import Iterable, Iterator, Optional, Generic, TypeVar, MutableSequence
-
-
-import pygame
+from typing import Callable, Iterable, Iterator, Optional, Generic, TypeVar, MutableSequence
 
 
 # Internal imports
-from interfaces import IDefault
+from games.caravan.input import UserInputOptions
+from interfaces import IDefault, IObservable, IObserver
 from utils.traits import Derive
 
 
@@ -182,9 +180,9 @@ class Deck(Iterable, Sized, IDefault, Derive.Debug):
     def __init__(self, cards: list[Card]) -> None:
         self.card_queue = deque(cards)
 
-    def shuffle(self) -> None:
-        """Shuffle the deck in place."""
-        random.shuffle(self.card_queue)
+    def shuffle(self, rng: Optional[random.Random] = None) -> None:
+        """Shuffle the deck in place, with the given generator for a reproducible order."""
+        (rng or random).shuffle(self.card_queue)
 
     def pop(self) -> Card:
         """Return a card from the top of the deck."""
@@ -238,6 +236,11 @@ class TwoWayIterator(Generic[T]):
         """Reset the iterator to original position."""
         self._current_position = self.__start
 
+    def select(self, index: int) -> T:
+        """Moves selection to the element with the index."""
+        self._current_position = index
+        return self.sequence[self._current_position]
+
     def next(self) -> T:
         """Moves selection forward to the next element."""
         self._current_position = self._current_position + 1 if self._current_position < len(self.sequence) - 1 else 0
@@ -385,12 +388,16 @@ class Player(IDefault, Derive.Debug):
     Player composes a Hand, Deck and three Caravans.
     """
     CARAVAN_COUNT = 3
+    HAND_SIZE = 8
 
     class Position(Enum):
         """Enumeration of possible player positions."""
         TOP = auto()
         BOTTOM = auto()
 
+        def other(self) -> Player.Position:
+            return Player.Position.TOP if self is Player.Position.BOTTOM else Player.Position.BOTTOM
+
     def __init__(self, deck: Deck, hand: Hand, caravans: Caravans) -> None:
         self.deck = deck
         self.hand = hand
@@ -398,8 +405,12 @@ class Player(IDefault, Derive.Debug):
 
     @classmethod
     def default(cls) -> Player:
-        deck = Deck.default()
-        hand_cards = [deck.pop() for _ in range(8)]
+        return cls.dealt(Deck.default())
+
+    @classmethod
+    def dealt(cls, deck: Deck) -> Player:
+        """Player whose hand is dealt from the top of the deck."""
+        hand_cards = [deck.pop() for _ in range(Player.HAND_SIZE)]
         caravans = {
             Caravan.Position.LEFT: Caravan.default(),
             Caravan.Position.MIDDLE: Caravan.default(),
@@ -407,10 +418,16 @@ class Player(IDefault, Derive.Debug):
         }
         return cls(deck, Hand(hand_cards), caravans)
 
-    def draw_from_deck(self) -> None:
-        """Draw a new card from player's deck to hand if there are any."""
+    def draw_from_deck(self) -> Optional[Card]:
+        """Draw a new card from player's deck to hand if there are any.
+
+        :return: drawn card or None if the deck is empty.
+        """
         if len(self.deck) > 0:
-            self.hand.append(self.deck.pop())
+            card = self.deck.pop()
+            self.hand.append(card)
+            return card
+        return None
 
     def discard_caravan(self, caravan_pos: Caravan.Position) -> None:
         self.caravans[caravan_pos] = Caravan.default()
@@ -435,11 +452,6 @@ class Table(IDefault, Derive.Debug):
             Player.Position.TOP: Player.default(), Player.Position.BOTTOM: Player.default()
         })
 
-    def swap_players(self) -> None:
-        """This method is a hack for the server to swap positions during communication - temp."""
-        self.players[Player.Position.BOTTOM], self.players[Player.Position.TOP] = \
-            self.players[Player.Position.TOP], self.players[Player.Position.BOTTOM]
-
 
 # endregion
 
@@ -483,8 +495,36 @@ class PickedCardPosition(Derive.Debug):
         return cls(Player.Position.BOTTOM, Caravan.Position.LEFT, 0, location)
 
 
+class RoundDelta(Derive.Debug):
+    """Single change of the round's state.
+
+    Deltas are broadcast by the RoundManager to its observers, so that they can apply the change incrementally
+    instead of rebuilding everything from scratch.
+    """
+
+    class Kind(Enum):
+        HAND_CARD_REMOVED     = auto()
+        HAND_CARD_ADDED       = auto()
+        CARAVAN_CARD_APPENDED = auto()
+        CARAVAN_CARD_APPLIED  = auto()
+        CARAVAN_DISCARDED     = auto()
+        TURN_PASSED           = auto()  # player is the one who moves next.
+
+    def __init__(self,
+                 kind: Kind,
+                 player: Player.Position,
+                 caravan: Optional[Caravan.Position] = None,
+                 card: Optional[Card] = None,
+                 index: Optional[int] = None) -> None:
+        self.kind = kind
+        self.player = player
+        self.caravan = caravan
+        self.card = card
+        self.index = index
+
+
 # URGENT: handle first 3 rounds in a special way.
-class RoundManager(IDefault, Derive.Debug):
+class RoundManager(IDefault, IObservable, Derive.Debug):
     # NOTE: All methods ASSUME THAT THEY CAN BE CALLED, and since they depend on certain configuration of the state,
     #       we must ensure is being correct before allowing for the call.
 
@@ -522,6 +562,7 @@ class RoundManager(IDefault, Derive.Debug):
         SELECT_CARD = auto()
         DISCARD_CARAVAN = auto()
         PLACE_CARD = auto()
+        CONFIRM_EXIT = auto()  # player asked to exit, the view prompts them to confirm it.
 
     class StopGame(Exception):
         """Temporary exception raised when Game should return to main menu or lobby?"""
@@ -537,12 +578,36 @@ class RoundManager(IDefault, Derive.Debug):
         self.table = table
         self.state = state
         self.turn_count = turn_count
-        self.hand_selection = TwoWayIterator(self.table.players[Player.Position.BOTTOM].hand.sequence)
+        # Player who makes the moves, local game always has them at the bottom.
+        self.active_player = Player.Position.BOTTOM
+        self.hand_selection = TwoWayIterator(self.table.players[self.active_player].hand.sequence)
         self.selected_hand_card: Optional[Card] = self.hand_selection.current
         self.discard_selection = TwoWayIterator([Caravan.Position.LEFT, Caravan.Position.MIDDLE, Caravan.Position.RIGHT])
         self.selected_discard_caravan = None
         self.picked_card = picked_card
         self.picked_card_position = picked_card_position
+        self._observers: list[IObserver] = []
+
+    # Interface implementations
+    # region IObservable
+    def attach(self, observer: IObserver) -> None:
+        self._observers.append(observer)
+
+    def detach(self, observer: IObserver) -> None:
+        self._observers.remove(observer)
+
+    def notify(self, delta: Optional[RoundDelta] = None) -> None:
+        """Broadcast the delta to all observers."""
+        for observer in self._observers:
+            observer.update(delta)
+    # endregion
+
+    def make_active(self, player: Player.Position) -> None:
+        """Pass the turn to the player, their hand becomes the one cards are selected from."""
+        self.active_player = player
+        self.hand_selection = TwoWayIterator(self.table.players[player].hand.sequence)
+        self.selected_hand_card = self.hand_selection.current if len(self.hand_selection.sequence) > 0 else None
+        self.notify(RoundDelta(RoundDelta.Kind.TURN_PASSED, player))
 
     def players(self) -> tuple[Player, Player]:
         """Return tuple of references to top player and bottom player."""
@@ -557,49 +622,40 @@ class RoundManager(IDefault, Derive.Debug):
                 self.table.players[Player.Position.BOTTOM].caravans[Caravan.Position.MIDDLE],
                 self.table.players[Player.Position.BOTTOM].caravans[Caravan.Position.RIGHT])
 
-    def handle_user_input(self, key: int) -> None:
-        match self.state:
-            case RoundManager.State.SELECT_CARD:
-                assert self.picked_card is None
-                assert self.selected_discard_caravan is None
-                match key:
-                    case pygame.K_LEFT:
-                        self.move_card_selection(HorizontalDirection.RIGHT)  # FIXME: REVERS POLARITY
-                    case pygame.K_RIGHT:
-                        self.move_card_selection(HorizontalDirection.LEFT)  # FIXME: REVERS POLARITY
-                    case pygame.K_ESCAPE:
-                        print("ESCAPE")
-                        self.cancel()
-                    case pygame.K_RETURN:
-                        print("ENTER")
-                        self.pick_selected_card()
-            case RoundManager.State.PLACE_CARD:
-                assert self.selected_discard_caravan is None
-                match key:
-                    case pygame.K_UP:
-                        self.move_picked_card(Direction.UP)
-                    case pygame.K_DOWN:
-                        self.move_picked_card(Direction.DOWN)
-                    case pygame.K_LEFT:
-                        self.move_picked_card(Direction.LEFT)
-                    case pygame.K_RIGHT:
-                        self.move_picked_card(Direction.RIGHT)
-                    case pygame.K_ESCAPE:
-                        self.cancel()
-                    case pygame.K_RETURN:
-                        if self.is_current_picked_card_position_correct():
-                            self.place_picked_card()
-            case RoundManager.State.DISCARD_CARAVAN:
-                assert self.picked_card is None
-                match key:
-                    case pygame.K_LEFT:
-                        self.move_discard_selection(HorizontalDirection.LEFT)
-                    case pygame.K_RIGHT:
-                        self.move_discard_selection(HorizontalDirection.RIGHT)
-                    case pygame.K_ESCAPE:
-                        self.cancel()
-                    case pygame.K_KP_ENTER:
-                        self.pick_selected_card()
+    # Dispatch table of user input, for each state it maps input options to their handlers.
+    INPUT_HANDLERS: dict[State, dict[UserInputOptions, Callable[[RoundManager], None]]] = {
+        State.SELECT_CARD: {
+            UserInputOptions.MOVE_LEFT: lambda self: self.move_card_selection(HorizontalDirection.RIGHT),  # FIXME: REVERS POLARITY
+            UserInputOptions.MOVE_RIGHT: lambda self: self.move_card_selection(HorizontalDirection.LEFT),  # FIXME: REVERS POLARITY
+            UserInputOptions.CANCEL: lambda self: self.cancel(),
+            UserInputOptions.ACCEPT: lambda self: self.pick_selected_card(),
+        },
+        State.PLACE_CARD: {
+            UserInputOptions.MOVE_UP: lambda self: self.move_picked_card(Direction.UP),
+            UserInputOptions.MOVE_DOWN: lambda self: self.move_picked_card(Direction.DOWN),
+            UserInputOptions.MOVE_LEFT: lambda self: self.move_picked_card(Direction.LEFT),
+            UserInputOptions.MOVE_RIGHT: lambda self: self.move_picked_card(Direction.RIGHT),
+            UserInputOptions.CANCEL: lambda self: self.cancel(),
+            UserInputOptions.ACCEPT: lambda self: (self.place_picked_card()
+                                                   if self.is_current_picked_card_position_correct() else None),
+        },
+        State.DISCARD_CARAVAN: {
+            UserInputOptions.MOVE_LEFT: lambda self: self.move_discard_selection(HorizontalDirection.LEFT),
+            UserInputOptions.MOVE_RIGHT: lambda self: self.move_discard_selection(HorizontalDirection.RIGHT),
+            UserInputOptions.CANCEL: lambda self: self.cancel(),
+            UserInputOptions.ACCEPT: lambda self: self.pick_selected_card(),
+        },
+        State.CONFIRM_EXIT: {
+            UserInputOptions.CANCEL: lambda self: self.cancel(),
+            UserInputOptions.ACCEPT: lambda self: self.exit_game(),
+        },
+    }
+
+    def handle_user_input(self, option: UserInputOptions) -> None:
+        """Perform the action bound to the input option in current state, options without one are ignored."""
+        handler = RoundManager.INPUT_HANDLERS[self.state].get(option)
+        if handler is not None:
+            handler(self)
 
     def hands(self) -> tuple[Hand, Hand]:
         """Return tuple of player hands in top player, bottom player order."""
@@ -611,19 +667,11 @@ class RoundManager(IDefault, Derive.Debug):
         print("TURN FINISHED!")
 
     def exit_game(self) -> None:
-        """Exits game, this should prompt for confirmation."""
-        while True:
-            match input("Do you want to exit? [Y/n]\n> "):
-                case "Y":
-                    raise RoundManager.StopGame()
-                case "n":
-                    self.state = RoundManager.State.SELECT_CARD
-                    return
-                case _:
-                    pass
+        """Exits game, once the player has confirmed it in CONFIRM_EXIT state."""
+        raise RoundManager.StopGame()
 
     def cancel(self) -> None:
-        """Return to card selection state, or begin process of exiting the game if already in card selection state.
+        """Return to card selection state, or ask to confirm exiting the game if already in card selection state.
 
         This method also performs all the necessary state changes.
         """
@@ -636,7 +684,9 @@ class RoundManager(IDefault, Derive.Debug):
                 self.selected_discard_caravan = None
                 self.state = RoundManager.State.SELECT_CARD
             case RoundManager.State.SELECT_CARD:
-                self.exit_game()
+                self.state = RoundManager.State.CONFIRM_EXIT
+            case RoundManager.State.CONFIRM_EXIT:
+                self.state = RoundManager.State.SELECT_CARD
 
     def change_state(self, destination_state: RoundManager.State) -> None:
         """Set state to the new value."""
@@ -669,6 +719,7 @@ class RoundManager(IDefault, Derive.Debug):
         To do this selected caravan is reset to default.
         """
         self.table.players[player].caravans[caravan] = Caravan.default()
+        self.notify(RoundDelta(RoundDelta.Kind.CARAVAN_DISCARDED, player, caravan))
         self.finish_turn()
 
     def move_discard_selection(self, direction: HorizontalDirection) -> None:
@@ -819,15 +870,35 @@ class RoundManager(IDefault, Derive.Debug):
         return is_function_card_not_on_top or (is_value_card_placed_on_top and can_value_card_be_appended)
 
     def place_picked_card(self) -> None:
+        """Place picked card on the table, replace it in hand with a new one from the deck and finish the turn."""
+        player, caravan = self.picked_card_position.player, self.picked_card_position.caravan
         match self.picked_card.type:
             case Card.Type.VALUE:
-                self.table.players[self.picked_card_position.player] \
-                    .caravans[self.picked_card_position.caravan] \
-                    .append(self.picked_card)
+                self.table.players[player].caravans[caravan].append(self.picked_card)
+                self.notify(RoundDelta(RoundDelta.Kind.CARAVAN_CARD_APPENDED, player, caravan, self.picked_card))
             case Card.Type.FUNCTION:
-                self.table.players[self.picked_card_position.player] \
-                    .caravans[self.picked_card_position.caravan] \
-                    .apply(self.picked_card, self.picked_card_position.card_index)
+                card_index = self.picked_card_position.card_index
+                self.table.players[player].caravans[caravan].apply(self.picked_card, card_index)
+                self.notify(RoundDelta(RoundDelta.Kind.CARAVAN_CARD_APPLIED, player, caravan, self.picked_card,
+                                       card_index))
+
+        active_player = self.table.players[self.active_player]
+        hand_index = self.hand_selection.index
+        active_player.hand.discard(hand_index)
+        self.notify(RoundDelta(RoundDelta.Kind.HAND_CARD_REMOVED, self.active_player, card=self.picked_card,
+                               index=hand_index))
+        # Hand.append inserts new card just before the last one.
+        drawn_index = max(len(active_player.hand) - 1, 0)
+        drawn_card = active_player.draw_from_deck()
+        if drawn_card is not None:
+            self.notify(RoundDelta(RoundDelta.Kind.HAND_CARD_ADDED, self.active_player, card=drawn_card,
+                                   index=drawn_index))
+
+        self.picked_card = None
+        self.picked_card_position = None
+        self.hand_selection.reset()
+        self.selected_hand_card = self.hand_selection.current if len(active_player.hand) > 0 else None
+        self.change_state(RoundManager.State.SELECT_CARD)
         self.finish_turn()
     # endregion
 
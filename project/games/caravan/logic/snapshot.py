@@ -0,0 +1,117 @@
+# -*- encoding: utf-8 -*-
+
+"""
+This module exposes immutable snapshots of the round's state and the double buffer they are published through.
+
+Logic side (RoundManager and everything that drives it) publishes a new snapshot after every change,
+rendering side reads the newest one whenever it draws a frame. Neither side ever waits for the other:
+snapshots are never modified once published, so handing one over is a single reference assignment.
+"""
+
+from __future__ import annotations
+
+# STD lib imports
+from typing import Generic, NamedTuple, Optional, TypeVar
+
+# Internal imports
+from games.caravan.logic.round import Card, Caravan, PickedCardPosition, Player, RoundDelta, RoundManager
+from interfaces import IObserver
+
+
+T = TypeVar("T")
+
+
+class SnapshotBuffer(Generic[T]):
+    """Lock-free double buffer of immutable snapshots, for a single writer and a single reader.
+
+    Writer fills the back slot and then flips the index of the front one, reader only ever reads the front slot.
+    Both are single assignments, so the reader always gets a complete snapshot - possibly a newer one than it
+    would expect, never a partially written one.
+    """
+
+    def __init__(self) -> None:
+        self.__slots: list[Optional[T]] = [None, None]
+        self.__front = 0
+        # Index of the last delta the reader has applied, written by the reader only.
+        self.acknowledged = -1
+
+    def publish(self, snapshot: T) -> None:
+        back = 1 - self.__front
+        self.__slots[back] = snapshot
+        self.__front = back
+
+    def read(self) -> Optional[T]:
+        return self.__slots[self.__front]
+
+    def acknowledge(self, delta_index: int) -> None:
+        """Tell the writer that deltas up to the index have been applied and don't have to be published again."""
+        self.acknowledged = delta_index
+
+
+class PickedCardSnapshot(NamedTuple):
+    """Picked card together with everything needed to display it."""
+    card: Card
+    player: Player.Position
+    caravan: Caravan.Position
+    card_index: int
+    location: PickedCardPosition.Location
+    applied_card_count: int  # number of cards applied to the card at card_index.
+    is_position_correct: bool
+
+
+class RoundSnapshot(NamedTuple):
+    """State of the round at one point in time.
+
+    Deltas are numbered, snapshot carries all the deltas that the reader hasn't acknowledged yet,
+    so that no change is lost when several snapshots are published between two reads.
+    """
+    sequence: int
+    state: RoundManager.State
+    selected_hand_index: int
+    picked: Optional[PickedCardSnapshot]
+    deltas: tuple[tuple[int, RoundDelta], ...]
+
+
+class RoundPublisher(IObserver):
+    """Records deltas of the round manager and publishes snapshots of its state into the buffer."""
+
+    def __init__(self, round_manager: RoundManager, buffer: Optional[SnapshotBuffer[RoundSnapshot]] = None) -> None:
+        self.round_manager = round_manager
+        self.buffer = buffer if buffer is not None else SnapshotBuffer()
+        self.sequence = 0
+        self.deltas: list[tuple[int, RoundDelta]] = []
+        self.__next_delta_index = 0
+        self.round_manager.attach(self)
+        self.publish()
+
+    def snapshot(self) -> RoundSnapshot:
+        manager = self.round_manager
+        picked = None
+        if manager.picked_card is not None and manager.picked_card_position is not None:
+            position = manager.picked_card_position
+            caravan = manager.table.players[position.player].caravans[position.caravan]
+            picked = PickedCardSnapshot(
+                manager.picked_card,
+                position.player,
+                position.caravan,
+                position.card_index,
+                position.location,
+                len(caravan.applied_face_cards.get(position.card_index, ())),
+                manager.is_current_picked_card_position_correct()
+            )
+        # Deltas already applied by the reader are dropped.
+        acknowledged = self.buffer.acknowledged
+        self.deltas = [entry for entry in self.deltas if entry[0] > acknowledged]
+        return RoundSnapshot(self.sequence, manager.state, manager.hand_selection.index, picked, tuple(self.deltas))
+
+    def publish(self) -> None:
+        self.sequence += 1
+        self.buffer.publish(self.snapshot())
+
+    # Interface implementations
+    # region IObserver
+    def update(self, event: Optional[RoundDelta]) -> None:
+        if event is not None:
+            self.deltas.append((self.__next_delta_index, event))
+            self.__next_delta_index += 1
+    # endregion
@@ -3,6 +3,7 @@
 import unittest
 
 import games.caravan.logic.round as round
+from games.caravan.input import UserInputOptions
 
 
 class MyTestCase(unittest.TestCase):
@@ -10,6 +11,85 @@ class MyTestCase(unittest.TestCase):
         self.assertEqual(True, False)
 
 
+class RecordingObserver:
+    def __init__(self):
+        self.deltas = []
+
+    def update(self, event):
+        self.deltas.append(event)
+
+
+class RoundDeltaTestCase(unittest.TestCase):
+    def setUp(self):
+        self.round_manager = round.RoundManager.default()
+        self.observer = RecordingObserver()
+        self.round_manager.attach(self.observer)
+
+    def test_place_value_card_on_empty_caravan(self):
+        hand = self.round_manager.table.players[round.Player.Position.BOTTOM].hand
+        index = next(index for index, card in enumerate(hand.sequence) if card.type is round.Card.Type.VALUE)
+        self.round_manager.selected_hand_card = self.round_manager.hand_selection.select(index)
+        card = self.round_manager.selected_hand_card
+        self.round_manager.pick_selected_card()
+        self.round_manager.place_picked_card()
+
+        kinds = [delta.kind for delta in self.observer.deltas]
+        self.assertEqual(kinds, [round.RoundDelta.Kind.CARAVAN_CARD_APPENDED,
+                                 round.RoundDelta.Kind.HAND_CARD_REMOVED,
+                                 round.RoundDelta.Kind.HAND_CARD_ADDED])
+        self.assertEqual(len(hand), 8)
+        appended, removed, _ = self.observer.deltas
+        self.assertIs(appended.card, card)
+        self.assertEqual(removed.index, index)
+        self.assertIs(self.round_manager.state, round.RoundManager.State.SELECT_CARD)
+
+    def test_discard_caravan(self):
+        self.round_manager.discard_caravan(round.Player.Position.TOP, round.Caravan.Position.RIGHT)
+
+        delta, = self.observer.deltas
+        self.assertIs(delta.kind, round.RoundDelta.Kind.CARAVAN_DISCARDED)
+        self.assertIs(delta.caravan, round.Caravan.Position.RIGHT)
+
+    def test_detached_observer_is_not_notified(self):
+        self.round_manager.detach(self.observer)
+        self.round_manager.discard_caravan(round.Player.Position.TOP, round.Caravan.Position.RIGHT)
+
+        self.assertEqual(self.observer.deltas, [])
+
+
+class UserInputTestCase(unittest.TestCase):
+    def setUp(self):
+        self.round_manager = round.RoundManager.default()
+
+    def test_accept_picks_selected_card(self):
+        self.round_manager.handle_user_input(UserInputOptions.ACCEPT)
+
+        self.assertIs(self.round_manager.state, round.RoundManager.State.PLACE_CARD)
+        self.assertIs(self.round_manager.picked_card, self.round_manager.selected_hand_card)
+
+    def test_cancel_returns_to_card_selection(self):
+        self.round_manager.handle_user_input(UserInputOptions.ACCEPT)
+        self.round_manager.handle_user_input(UserInputOptions.CANCEL)
+
+        self.assertIs(self.round_manager.state, round.RoundManager.State.SELECT_CARD)
+        self.assertIsNone(self.round_manager.picked_card)
+
+    def test_exit_has_to_be_confirmed(self):
+        self.round_manager.handle_user_input(UserInputOptions.CANCEL)
+        self.assertIs(self.round_manager.state, round.RoundManager.State.CONFIRM_EXIT)
+        self.round_manager.handle_user_input(UserInputOptions.CANCEL)
+        self.assertIs(self.round_manager.state, round.RoundManager.State.SELECT_CARD)
+
+        self.round_manager.handle_user_input(UserInputOptions.CANCEL)
+        with self.assertRaises(round.RoundManager.StopGame):
+            self.round_manager.handle_user_input(UserInputOptions.ACCEPT)
+
+    def test_unbound_option_is_ignored(self):
+        self.round_manager.handle_user_input(UserInputOptions.CHAT)
+
+        self.assertIs(self.round_manager.state, round.RoundManager.State.SELECT_CARD)
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,71 @@
+# -*- encoding: utf-8 -*-
+
+import unittest
+
+import games.caravan.logic.round as round
+from games.caravan.input import UserInputOptions
+from games.caravan.logic.snapshot import RoundPublisher
+from games.caravan.logic.worker import LogicThread
+
+
+class RoundPublisherTestCase(unittest.TestCase):
+    def setUp(self):
+        self.round_manager = round.RoundManager.default()
+        self.publisher = RoundPublisher(self.round_manager)
+
+    def place_selected_card(self):
+        self.round_manager.selected_hand_card = round.Card(round.Rank.FIVE, round.Suit.HEARTS)
+        self.round_manager.pick_selected_card()
+        self.round_manager.place_picked_card()
+
+    def test_initial_snapshot_is_published(self):
+        snapshot = self.publisher.buffer.read()
+
+        self.assertIs(snapshot.state, round.RoundManager.State.SELECT_CARD)
+        self.assertIsNone(snapshot.picked)
+        self.assertEqual(snapshot.deltas, ())
+
+    def test_unacknowledged_deltas_are_carried_over(self):
+        self.place_selected_card()
+        self.publisher.publish()
+        self.round_manager.discard_caravan(round.Player.Position.TOP, round.Caravan.Position.RIGHT)
+        self.publisher.publish()
+
+        indices = [index for index, _ in self.publisher.buffer.read().deltas]
+        self.assertEqual(indices, [0, 1, 2, 3])
+
+    def test_acknowledged_deltas_are_dropped(self):
+        self.place_selected_card()
+        self.publisher.publish()
+        self.publisher.buffer.acknowledge(2)
+        self.round_manager.discard_caravan(round.Player.Position.TOP, round.Caravan.Position.RIGHT)
+        self.publisher.publish()
+
+        indices = [index for index, _ in self.publisher.buffer.read().deltas]
+        self.assertEqual(indices, [3])
+
+
+class LogicThreadTestCase(unittest.TestCase):
+    def test_tick_runs_submitted_input_and_publishes(self):
+        published = []
+        logic = LogicThread(round.RoundManager.default(), on_publish=lambda: published.append(True))
+        logic.submit(UserInputOptions.ACCEPT)
+
+        self.assertTrue(logic.tick())
+        snapshot = logic.snapshots.read()
+        self.assertIs(snapshot.state, round.RoundManager.State.PLACE_CARD)
+        self.assertIsNotNone(snapshot.picked)
+        self.assertEqual(published, [True])
+        self.assertFalse(logic.tick())
+
+    def test_stop(self):
+        logic = LogicThread(round.RoundManager.default())
+        logic.start()
+        logic.stop()
+        logic.join(1)
+
+        self.assertFalse(logic.is_alive())
+
+
+if __name__ == '__main__':
+    unittest.main()
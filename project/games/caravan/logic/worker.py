@@ -0,0 +1,89 @@
+# -*- encoding: utf-8 -*-
+
+"""
+This module exposes the logic thread of the round.
+
+Everything that changes the state of the round - user input, network messages, bots - is submitted to the
+logic thread as a task. The thread runs tasks at its own tick rate, independently of the display refresh rate,
+and publishes a snapshot after each tick that ran any, so the render loop never blocks on game logic.
+"""
+
+from __future__ import annotations
+
+# STD lib imports
+import functools
+import queue
+import threading
+from typing import Callable, Optional
+
+# Internal imports
+from games.caravan.input import UserInputOptions
+from games.caravan.logic.round import RoundManager
+from games.caravan.logic.snapshot import RoundPublisher, RoundSnapshot, SnapshotBuffer
+
+
+# Ticks per second of the logic thread.
+TICK_RATE = 120
+
+
+class LogicThread(threading.Thread):
+    """Thread that owns the round manager, no other thread may touch it once started."""
+
+    def __init__(self,
+                 round_manager: RoundManager,
+                 on_publish: Optional[Callable[[], None]] = None,
+                 tick_rate: int = TICK_RATE) -> None:
+        super().__init__(name="round-logic", daemon=True)
+        self.round_manager = round_manager
+        self.publisher = RoundPublisher(round_manager)
+        self.tasks: queue.SimpleQueue[Callable[[], None]] = queue.SimpleQueue()
+        # called from the logic thread after each publish, eg. to wake up the render loop.
+        self.on_publish = on_publish
+        self.tick_interval = 1 / tick_rate
+        self.__stopped = threading.Event()
+
+    @property
+    def snapshots(self) -> SnapshotBuffer[RoundSnapshot]:
+        return self.publisher.buffer
+
+    def call(self, task: Callable[[], None]) -> None:
+        """Run the task on the logic thread, safe to call from any thread."""
+        self.tasks.put(task)
+
+    def submit(self, option: UserInputOptions) -> None:
+        self.call(functools.partial(self.round_manager.handle_user_input, option))
+
+    def tick(self, timeout: Optional[float] = None) -> bool:
+        """Run all the queued tasks, waiting up to timeout seconds for the first one, and publish a snapshot.
+
+        :return: whether any task has been run.
+        """
+        tasks = []
+        try:
+            tasks.append(self.tasks.get(timeout=timeout) if timeout else self.tasks.get_nowait())
+            while True:
+                tasks.append(self.tasks.get_nowait())
+        except queue.Empty:
+            if not tasks:
+                return False
+        for task in tasks:
+            task()
+        self.publisher.publish()
+        if self.on_publish is not None:
+            self.on_publish()
+        return True
+
+    def run(self) -> None:
+        try:
+            while not self.__stopped.is_set():
+                self.tick(self.tick_interval)
+        except RoundManager.StopGame:
+            pass
+        finally:
+            # Render loop notices that the thread is no longer alive.
+            if self.on_publish is not None:
+                self.on_publish()
+
+    def stop(self) -> None:
+        self.__stopped.set()
+        self.call(lambda: None)
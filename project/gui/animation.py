@@ -0,0 +1,168 @@
+# -*- encoding: utf-8 -*-
+
+"""
+This module exposes the animation scheduler for card sprites.
+
+All active tweens are advanced together, once per frame, by the same delta time, so animations run
+at the same speed regardless of the frame rate. Tweens are stored in parallel arrays instead of
+per-sprite callbacks and finished ones are swap-removed, so that dozens of simultaneous animations
+cost little. Each frame of a flip is drawn into the same surface, allocated when the flip starts.
+Only the sprites that are being animated are marked as dirty.
+"""
+
+from __future__ import annotations
+
+# STD lib imports
+from array import array
+from enum import IntEnum
+from typing import TYPE_CHECKING, Optional
+
+# External imports
+import pygame
+import pygame.transform
+
+# Internal imports
+import gui.config.defaults as defaults
+from gui.types import Position
+
+if TYPE_CHECKING:
+    from gui.views.caravan.round import Card
+
+
+def smoothstep(progress: float) -> float:
+    """Ease in-out curve."""
+    return progress * progress * (3 - 2 * progress)
+
+
+class Animator:
+    """Scheduler of card tweens."""
+
+    class Kind(IntEnum):
+        """Kinds of tweens."""
+        POSITION  = 0  # slide the card to a new position.
+        FLIP      = 1  # turn the card over, squeezing it horizontally, side is swapped halfway.
+        HIGHLIGHT = 2  # display the card in a different state for a while.
+
+    def __init__(self) -> None:
+        # Parallel arrays, i-th entry of each describes i-th tween.
+        self.sprites: list[Card] = []
+        self.kinds = array("B")
+        self.elapsed = array("d")
+        self.durations = array("d")
+        self.start_x = array("d")
+        self.start_y = array("d")
+        self.delta_x = array("d")
+        self.delta_y = array("d")
+        # FLIP: whether the side has been swapped already and the surface frames are drawn into.
+        self.swapped = array("B")
+        self.frames: list[Optional[pygame.Surface]] = []
+        # HIGHLIGHT: state the sprite gets back when the highlight ends.
+        self.restored: list[Optional[Card.State]] = []
+        self.__columns = (self.sprites, self.kinds, self.elapsed, self.durations, self.start_x, self.start_y,
+                          self.delta_x, self.delta_y, self.swapped, self.frames, self.restored)
+        self.__indices: dict[tuple[int, Animator.Kind], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.sprites)
+
+    @property
+    def is_active(self) -> bool:
+        return bool(self.sprites)
+
+    def index_of(self, sprite: Card, kind: Animator.Kind) -> Optional[int]:
+        """Index of the tween of the kind running for the sprite, None if there is none."""
+        return self.__indices.get((id(sprite), kind))
+
+    def __schedule(self, sprite: Card, kind: Animator.Kind, duration: float,
+                   start: Position = (0, 0), delta: Position = (0, 0),
+                   frame: Optional[pygame.Surface] = None, restored: Optional[Card.State] = None) -> None:
+        """Add the tween, replacing tween of the same kind already running for the sprite."""
+        self.cancel(sprite, kind)
+        self.__indices[id(sprite), kind] = len(self.sprites)
+        for column, value in zip(self.__columns, (sprite, kind, 0.0, max(duration, 1.0), start[0], start[1],
+                                                  delta[0], delta[1], False, frame, restored)):
+            column.append(value)
+
+    def move(self, sprite: Card, destination: Position,
+             duration: float = defaults.Animation.MOVE_DURATION.value) -> None:
+        """Slide the sprite from its current position to the destination."""
+        x, y = sprite.position
+        if (x, y) != tuple(destination):
+            self.__schedule(sprite, Animator.Kind.POSITION, duration, (x, y), (destination[0] - x, destination[1] - y))
+
+    def flip(self, sprite: Card, duration: float = defaults.Animation.FLIP_DURATION.value) -> None:
+        """Turn the sprite to its other side."""
+        # copy has the size and the pixel format of the card, so that frames can be scaled right into it.
+        self.__schedule(sprite, Animator.Kind.FLIP, duration, frame=sprite.cached_image().copy())
+
+    def highlight(self, sprite: Card, state: Card.State,
+                  duration: float = defaults.Animation.HIGHLIGHT_DURATION.value) -> None:
+        """Display the sprite in the state for the duration, then restore its current state."""
+        # previous highlight has to be undone first, so that it's not mistaken for the sprite's own state.
+        self.cancel(sprite, Animator.Kind.HIGHLIGHT)
+        self.__schedule(sprite, Animator.Kind.HIGHLIGHT, duration, restored=sprite.state)
+        sprite.update(state)
+
+    def cancel(self, sprite: Card, kind: Animator.Kind) -> None:
+        """Stop the tween of the kind running for the sprite, if there is one."""
+        self.__finish(self.index_of(sprite, kind), complete=False)
+
+    def advance(self, dt: float) -> None:
+        """Advance all the tweens by dt milliseconds."""
+        index = 0
+        while index < len(self.sprites):
+            self.elapsed[index] += dt
+            progress = min(self.elapsed[index] / self.durations[index], 1.0)
+            self.__apply(index, progress)
+            if progress >= 1.0:
+                self.__finish(index, complete=True)  # last tween takes this index, so don't move on.
+            else:
+                index += 1
+
+    def __apply(self, index: int, progress: float) -> None:
+        sprite = self.sprites[index]
+        match self.kinds[index]:
+            case Animator.Kind.POSITION:
+                eased = smoothstep(progress)
+                sprite.move_to((round(self.start_x[index] + self.delta_x[index] * eased),
+                                round(self.start_y[index] + self.delta_y[index] * eased)))
+            case Animator.Kind.FLIP:
+                if progress >= 0.5 and not self.swapped[index]:
+                    self.swapped[index] = True
+                    sprite.hidden = not sprite.hidden
+                frame = self.frames[index]
+                width, height = frame.get_size()
+                squeezed_width = max(1, round(width * abs(1 - 2 * progress)))
+                frame.fill((0, 0, 0, 0))
+                pygame.transform.scale(sprite.cached_image(), (squeezed_width, height),
+                                       frame.subsurface(((width - squeezed_width) // 2, 0, squeezed_width, height)))
+                sprite.show(frame)
+                # the same surface is shown in every frame, so it's not recognized as a change.
+                sprite.dirty = 1
+            case Animator.Kind.HIGHLIGHT:
+                pass  # state is swapped when the highlight starts and ends, frames in between don't change.
+
+    def __finish(self, index: Optional[int], complete: bool) -> None:
+        """Remove the tween by moving the last one into its place and settle the sprite in its final look.
+
+        Interrupted (not complete) slide leaves the sprite where it is.
+        """
+        if index is None:
+            return
+        sprite, kind = self.sprites[index], self.kinds[index]
+        match kind:
+            case Animator.Kind.FLIP:
+                if not self.swapped[index]:
+                    sprite.hidden = not sprite.hidden
+                sprite.update(sprite.state)
+            case Animator.Kind.HIGHLIGHT:
+                sprite.update(self.restored[index])
+
+        del self.__indices[id(sprite), kind]
+        last = len(self.sprites) - 1
+        if index != last:
+            for column in self.__columns:
+                column[index] = column[last]
+            self.__indices[id(self.sprites[index]), self.kinds[index]] = index
+        for column in self.__columns:
+            column.pop()
@@ -0,0 +1,185 @@
+# -*- encoding: utf-8 -*-
+
+"""
+This module exposes content-addressed cache of baked assets.
+
+Assets (backgrounds and card atlases) are rendered ahead of time by the baking step:
+
+    python -m gui.assets.cache
+
+Both are baked for each of the configured resolutions, card atlas holds cards of the size the layout gives
+them at that resolution, so nothing has to be scaled when they are loaded. Each file is named after the digest
+of its recipe - kind of the asset, rendering parameters and the source of the renderer module - so changing any
+of them never picks up a stale file. Game only loads matching files lazily and converts them to the display
+format, if a file hasn't been baked the asset is rendered in memory but never written to disk.
+"""
+
+from __future__ import annotations
+
+# STD lib imports
+import argparse
+import functools
+import hashlib
+import os
+from typing import Optional
+
+# External imports
+import pygame
+import pygame.image
+import pygame.transform
+import pygame.surface as surface
+
+# Internal imports
+import gui.assets.renderer as renderer
+import gui.config.defaults as defaults
+from gui.types import RGBA
+from gui.utils.layout import Layout
+
+
+RENDERER_PATH = os.path.join(os.path.dirname(__file__), "renderer.py")
+
+
+@functools.cache
+def renderer_fingerprint() -> bytes:
+    """Digest of the renderer source, baked files become stale whenever rendering code changes."""
+    with open(RENDERER_PATH, "rb") as renderer_source:
+        return hashlib.sha256(renderer_source.read()).digest()
+
+
+def asset_path(kind: str, *params) -> str:
+    """Path of the cached asset identified by its recipe."""
+    recipe = hashlib.sha256(renderer_fingerprint())
+    recipe.update(repr((kind, params)).encode())
+    return os.path.join(defaults.ASSET_CACHE_DIR, f"{kind}-{recipe.hexdigest()[:16]}.png")
+
+
+def _can_convert() -> bool:
+    # Conversion is only possible once display mode has been set.
+    return pygame.display.get_surface() is not None
+
+
+# region Backgrounds
+# Converted backgrounds keyed by their size.
+_backgrounds: dict[tuple[int, int], surface.Surface] = {}
+
+
+def background_path(size: tuple[int, int]) -> str:
+    return asset_path("background", tuple(size), defaults.Colors.BACKGROUND.value)
+
+
+def load_background(size: tuple[int, int]) -> surface.Surface:
+    """Load baked background for the resolution, render it in memory if it hasn't been baked.
+
+    Only converted backgrounds are kept, one loaded before the display mode is set gets loaded again.
+    """
+    size = tuple(size)
+    try:
+        return _backgrounds[size]
+    except KeyError:
+        pass
+    path = background_path(size)
+    image = pygame.image.load(path) if os.path.exists(path) else renderer.render_background(*size)
+    if not _can_convert():
+        return image
+    background = _backgrounds[size] = image.convert()
+    return background
+# endregion
+
+
+# region Card atlases
+# Converted card atlases keyed by their recipe and the on-screen size of their cards, filled on the main thread only.
+_card_atlases: dict[tuple, surface.Surface] = {}
+
+
+def card_atlas_path(border_colors: tuple[RGBA, ...], background_color: RGBA, size: tuple[int, int]) -> str:
+    return asset_path("cards", border_colors, background_color, tuple(size))
+
+
+def card_size(resolution: tuple[int, int]) -> tuple[int, int]:
+    """On-screen size of the cards at the resolution."""
+    return Layout(resolution).size_to_screen((defaults.Card.WIDTH.value, defaults.Card.HEIGHT.value))
+
+
+def render_card_atlas(border_colors: tuple[RGBA, ...], background_color: RGBA, size: tuple[int, int]) -> surface.Surface:
+    """Atlas of size cards, rendered at the default card size and scaled, so that it looks the same at any scale."""
+    default_size = defaults.Card.WIDTH.value, defaults.Card.HEIGHT.value
+    atlas = renderer.render_card_atlas(list(border_colors), background_color, default_size)
+    if tuple(size) == default_size:
+        return atlas
+    columns, rows = atlas.get_width() // default_size[0], atlas.get_height() // default_size[1]
+    return pygame.transform.smoothscale(atlas, (columns * size[0], rows * size[1]))
+
+
+def read_card_atlas(border_colors: tuple[RGBA, ...],
+                    background_color: RGBA,
+                    size: tuple[int, int]) -> Optional[surface.Surface]:
+    """Baked atlas of size cards, None if it hasn't been baked.
+
+    Atlas is neither converted nor cached, so it's safe to read from a background thread.
+    """
+    path = card_atlas_path(border_colors, background_color, size)
+    return pygame.image.load(path) if os.path.exists(path) else None
+
+
+def load_card_atlas(border_colors: tuple[RGBA, ...],
+                    background_color: RGBA,
+                    size: tuple[int, int],
+                    image: Optional[surface.Surface] = None) -> surface.Surface:
+    """Converted atlas of size cards, it's loaded only once. Main thread only.
+
+    image is the atlas returned by read_card_atlas, if it has been read already. Atlas that hasn't been baked
+    for the size is rendered in memory. Only converted atlases are kept, just like backgrounds.
+    """
+    key = border_colors, background_color, tuple(size)
+    try:
+        return _card_atlases[key]
+    except KeyError:
+        pass
+    if image is None:
+        image = read_card_atlas(border_colors, background_color, size)
+    if image is None:
+        image = render_card_atlas(border_colors, background_color, size)
+    if not _can_convert():
+        return image
+    atlas = _card_atlases[key] = image.convert_alpha()
+    return atlas
+# endregion
+
+
+def bake(resolutions: list[tuple[int, int]]) -> list[str]:
+    """Render the background and the default card atlas for each of the resolutions into the cache directory.
+
+    :return: paths of the written files.
+    """
+    import gui.views.caravan.round as round_view
+
+    os.makedirs(defaults.ASSET_CACHE_DIR, exist_ok=True)
+    color_scheme = round_view.CardColorScheme.default()
+    border_colors = round_view.CardSurfaceCache.atlas_border_colors(color_scheme)
+    written = []
+    for resolution in resolutions:
+        path = background_path(resolution)
+        pygame.image.save(renderer.render_background(*resolution), path)
+        written.append(path)
+
+        path = card_atlas_path(border_colors, color_scheme.background, card_size(resolution))
+        # resolutions of the same aspect ratio may share the card size.
+        if path not in written:
+            pygame.image.save(render_card_atlas(border_colors, color_scheme.background, card_size(resolution)), path)
+            written.append(path)
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bake game assets into the asset cache.")
+    parser.add_argument("-r", "--resolution", action="append", type=lambda _: tuple(map(int, _.split("x"))),
+                        help="WIDTHxHEIGHT of the background, defaults to configured resolutions.")
+    args = parser.parse_args()
+
+    pygame.font.init()
+    for path in bake(args.resolution or defaults.RESOLUTIONS):
+        print(f"baked {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,64 +2,143 @@
 
 """
 In this module reside function that where used to generate assets.
+
+Nothing gets rendered at import, assets are produced by the gui.assets.cache baking step
+(or, as a fallback, on first use).
 """
 
 # STD lib imports
 import itertools as it
-import random
+from typing import Optional
 
 # External imports
 import pygame.surface as surface
+import pygame.transform
 import pygame.draw
 
 # Internal imports
+import games.caravan.logic.round as round_logic
+import gui.controls.fonts as fonts
 import gui.utils.colors as colors
 import gui.config.defaults as defaults
-
-width = defaults.WIDTH
-height = defaults.HEIGHT
-default_background_color = defaults.Colors.BACKGROUND.value
-
-# Custom background texture
-background = surface.Surface((width, height))
-background.fill(default_background_color)
-x_margin = 20
-y_margin = 20
-border_thickness = 3
-vertical_border_length = height - 2 * y_margin
-vertical_segment_length = vertical_border_length / 3
-
-PY1 = y_margin
-PY2 = PY1 + vertical_segment_length
-PY2_EX = PY2 + x_margin
-PY3 = PY2 + vertical_segment_length
-PY3_EX = PY3 - x_margin
-PY4 = PY3 + vertical_segment_length
-
-PX1 = x_margin
-PX1_EX = x_margin * 2
-PX2 = width - x_margin
-PX2_EX = width - x_margin * 2
-
-BORDER_POINTS = [
-    (PX1, PY1), (PX2, PY1), (PX2, PY2), (PX2_EX, PY2_EX), (PX2_EX, PY3_EX), (PX2, PY3),
-    (PX2, PY4), (PX1, PY4), (PX1, PY3), (PX1_EX, PY3_EX), (PX1_EX, PY2_EX), (PX1, PY2)
-]
-
-
-pygame.draw.line(background, colors.GREY, BORDER_POINTS[-1], BORDER_POINTS[0], width=border_thickness)
-for p1, p2 in it.pairwise(BORDER_POINTS):
-    pygame.draw.line(background, colors.GREY, p1, p2, width=border_thickness)
-
-pygame.image.save(background, f"background{width}x{height}.png")
-
-
-# Background animation.
-ANIMATION_BACKGROUND = 13, 13, 0
-
-
-def generate_pixel(_) -> tuple[int, int, int]:
-    num = random.random()
-    bnum = int(num * 1000) or 1
-    return (13, 13, 0) if num > 0.03 else (13 * bnum , 13 * bnum, 13 * bnum)
-
+from gui.types import RGBA
+
+
+# region Background
+def border_points(width: int, height: int, x_margin: int = 20, y_margin: int = 20) -> list[tuple[float, float]]:
+    """Points of the table border polygon."""
+    vertical_border_length = height - 2 * y_margin
+    vertical_segment_length = vertical_border_length / 3
+
+    PY1 = y_margin
+    PY2 = PY1 + vertical_segment_length
+    PY2_EX = PY2 + x_margin
+    PY3 = PY2 + vertical_segment_length
+    PY3_EX = PY3 - x_margin
+    PY4 = PY3 + vertical_segment_length
+
+    PX1 = x_margin
+    PX1_EX = x_margin * 2
+    PX2 = width - x_margin
+    PX2_EX = width - x_margin * 2
+
+    return [
+        (PX1, PY1), (PX2, PY1), (PX2, PY2), (PX2_EX, PY2_EX), (PX2_EX, PY3_EX), (PX2, PY3),
+        (PX2, PY4), (PX1, PY4), (PX1, PY3), (PX1_EX, PY3_EX), (PX1_EX, PY2_EX), (PX1, PY2)
+    ]
+
+
+def render_background(width: int,
+                      height: int,
+                      background_color: RGBA = defaults.Colors.BACKGROUND.value,
+                      border_thickness: int = 3) -> surface.Surface:
+    """Custom background texture."""
+    background = surface.Surface((width, height))
+    background.fill(background_color)
+
+    points = border_points(width, height)
+    pygame.draw.line(background, colors.GREY, points[-1], points[0], width=border_thickness)
+    for p1, p2 in it.pairwise(points):
+        pygame.draw.line(background, colors.GREY, p1, p2, width=border_thickness)
+    return background
+# endregion
+
+
+# region Cards
+# Every distinct card face, in deck order. Atlas has a column for each of them and one more for the card back.
+CARD_FACES: list[tuple[round_logic.Rank, Optional[round_logic.Suit]]] = list(dict.fromkeys(
+    (card.rank, card.suit) for card in round_logic.DEFAULT_DECK
+))
+CARD_FACE_INDICES = {face: index for index, face in enumerate(CARD_FACES)}
+CARD_BACK_INDEX = len(CARD_FACES)
+
+
+def render_card(card: Optional[round_logic.Card],
+                border_color: RGBA,
+                background_color: RGBA,
+                size: tuple[int, int]) -> surface.Surface:
+    """Render single card, card back is rendered if card is None."""
+    width, height = size
+    image = surface.Surface(size, pygame.SRCALPHA)
+
+    # region border
+    pygame.draw.rect(
+        image,
+        border_color,
+        image.get_rect(),
+        border_radius=defaults.Card.RECT_BORDER_RADIUS.value)
+    pygame.draw.rect(
+        image,
+        background_color,
+        image.get_rect().inflate(-defaults.Card.BORDER_THICKNESS.value, -defaults.Card.BORDER_THICKNESS.value),
+        border_radius=defaults.Card.RECT_BORDER_RADIUS.value)
+    # endregion border
+
+    # region text
+    if card is not None:
+        # upper left corner
+        text = fonts.Font.default().render_cached(
+            str(card),
+            defaults.USE_AA,
+            border_color,
+            background_color
+        )
+        image.blit(
+            text,
+            image.get_rect().move(defaults.Card.TEXT_X_MARGIN.value, defaults.Card.TEXT_Y_MARGIN.value)
+        )
+        # upper right corner
+        rotated = pygame.transform.flip(text, True, True)
+        rect = image.get_rect()
+        rect.move_ip(
+            width - defaults.Card.TEXT_X_MARGIN.value - rotated.get_width(),
+            height - defaults.Card.TEXT_Y_MARGIN.value - rotated.get_height()
+        )
+        image.blit(
+            rotated,
+            rect
+        )
+    # endregion
+    return image
+
+
+def card_atlas_rect(face_index: int, row: int, size: tuple[int, int]) -> pygame.Rect:
+    """Area of the card atlas occupied by the card face in given row."""
+    width, height = size
+    return pygame.Rect(face_index * width, row * height, width, height)
+
+
+def render_card_atlas(border_colors: list[RGBA],
+                      background_color: RGBA,
+                      size: tuple[int, int]) -> surface.Surface:
+    """Render all card faces and the card back, one row for each border color."""
+    width, height = size
+    atlas = surface.Surface(((CARD_BACK_INDEX + 1) * width, len(border_colors) * height), pygame.SRCALPHA)
+    for row, border_color in enumerate(border_colors):
+        for (rank, suit), face_index in CARD_FACE_INDICES.items():
+            atlas.blit(render_card(round_logic.Card(rank, suit), border_color, background_color, size),
+                       card_atlas_rect(face_index, row, size))
+        atlas.blit(render_card(None, border_color, background_color, size),
+                   card_atlas_rect(CARD_BACK_INDEX, row, size))
+    return atlas
+# endregion
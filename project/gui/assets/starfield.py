@@ -0,0 +1,83 @@
+# -*- encoding: utf-8 -*-
+
+"""
+This module exposes the animated starfield drawn over the background.
+
+Stars are generated and animated with numpy directly in the pixels of the background surface
+(through pygame.surfarray), only the pixels of the stars that twinkle get written each frame.
+numpy is an optional dependency (see requirements-extras.txt) - without it the background simply stays static.
+"""
+
+from __future__ import annotations
+
+# STD lib imports
+from typing import Optional
+
+# External imports
+import pygame
+import pygame.surface as surface
+
+try:
+    import numpy as np
+    import pygame.surfarray as surfarray
+except ImportError:
+    np = None
+
+# Internal imports
+import gui.config.defaults as defaults
+from gui.types import RGBA
+
+
+class Starfield:
+    """Stars scattered over the free (background colored) pixels of the surface, twinkling at random."""
+
+    def __init__(self,
+                 background: surface.Surface,
+                 background_color: RGBA = defaults.Colors.BACKGROUND.value,
+                 seed: Optional[int] = defaults.Starfield.SEED.value,
+                 density: float = defaults.Starfield.DENSITY.value,
+                 twinkles_per_second: float = defaults.Starfield.TWINKLES_PER_SECOND.value,
+                 star_color: RGBA = defaults.Starfield.COLOR.value) -> None:
+        self.background = background
+        self.twinkles_per_second = twinkles_per_second
+        self.rng = np.random.default_rng(seed)
+        self.__background_color = np.array(background_color[:3], dtype=np.float32)
+        self.__color_range = np.array(star_color[:3], dtype=np.float32) - self.__background_color
+        self.__pending_twinkles = 0.0
+
+        pixels = surfarray.pixels3d(background)
+        free_x, free_y = np.nonzero(np.all(pixels == background_color[:3], axis=2))
+        chosen = self.rng.choice(len(free_x), size=int(len(free_x) * density), replace=False)
+        self.xs, self.ys = free_x[chosen], free_y[chosen]
+        self.brightness = self.rng.random(len(chosen), dtype=np.float32)
+        pixels[self.xs, self.ys] = self.__colors(self.brightness)
+        del pixels  # unlocks the surface.
+
+    @staticmethod
+    def available() -> bool:
+        return np is not None
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def __colors(self, brightness: np.ndarray) -> np.ndarray:
+        return (self.__background_color + brightness[:, np.newaxis] * self.__color_range).astype(np.uint8)
+
+    def update(self, dt: float) -> list[pygame.Rect]:
+        """Twinkle the stars due in dt milliseconds.
+
+        :return: areas of the background that have changed.
+        """
+        self.__pending_twinkles += self.twinkles_per_second * dt / 1000
+        count = int(self.__pending_twinkles)
+        if count == 0 or len(self) == 0:
+            return []
+        self.__pending_twinkles -= count
+
+        indices = self.rng.integers(0, len(self), size=count)
+        self.brightness[indices] = self.rng.random(count, dtype=np.float32)
+        xs, ys = self.xs[indices], self.ys[indices]
+        pixels = surfarray.pixels3d(self.background)
+        pixels[xs, ys] = self.__colors(self.brightness[indices])
+        del pixels
+        return [pygame.Rect(x, y, 1, 1) for x, y in zip(xs.tolist(), ys.tolist())]
@@ -0,0 +1,66 @@
+# -*- encoding: utf-8 -*-
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import pygame
+
+import gui.assets.cache as asset_cache
+import gui.config.defaults as defaults
+from gui.views.caravan.round import CardColorScheme, CardSurfaceCache
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+RESOLUTIONS = [(725, 400), (2900, 1600), (1450, 800)]
+
+
+class AssetCacheTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+        color_scheme = CardColorScheme.default()
+        cls.recipe = CardSurfaceCache.atlas_border_colors(color_scheme), color_scheme.background
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        for patcher in (mock.patch.object(defaults, "ASSET_CACHE_DIR", directory.name),
+                        mock.patch.dict(asset_cache._backgrounds, clear=True),
+                        mock.patch.dict(asset_cache._card_atlases, clear=True)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def set_mode(self):
+        pygame.display.init()
+        self.addCleanup(pygame.display.quit)
+        pygame.display.set_mode((100, 100))
+
+    def test_card_atlas_is_baked_for_each_resolution(self):
+        written = asset_cache.bake(RESOLUTIONS)
+        self.assertEqual(len(written), 2 * len(RESOLUTIONS))
+
+        self.set_mode()
+        # baked atlas is loaded as it is, nothing gets scaled.
+        with mock.patch.object(asset_cache.pygame.transform, "smoothscale", side_effect=AssertionError):
+            for resolution in RESOLUTIONS:
+                with self.subTest(resolution=resolution):
+                    size = asset_cache.card_size(resolution)
+                    atlas = asset_cache.load_card_atlas(*self.recipe, size)
+                    self.assertEqual((atlas.get_width() % size[0], atlas.get_height()), (0, 3 * size[1]))
+        self.assertEqual(asset_cache.card_size((2900, 1600)),
+                         (2 * defaults.Card.WIDTH.value, 2 * defaults.Card.HEIGHT.value))
+
+    def test_background_is_cached_only_once_converted(self):
+        pygame.display.quit()
+        unconverted = asset_cache.load_background((40, 30))
+        self.assertIsNot(asset_cache.load_background((40, 30)), unconverted)
+
+        self.set_mode()
+        converted = asset_cache.load_background((40, 30))
+        self.assertIs(asset_cache.load_background((40, 30)), converted)
+        self.assertEqual(converted.get_bitsize(), pygame.display.get_surface().get_bitsize())
+
+
+if __name__ == '__main__':
+    unittest.main()
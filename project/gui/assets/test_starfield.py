@@ -0,0 +1,50 @@
+# -*- encoding: utf-8 -*-
+
+import unittest
+
+import pygame
+
+from gui.assets.starfield import Starfield
+
+BACKGROUND_COLOR = 10, 20, 30, 255
+STAR_COLOR = 250, 250, 250, 255
+
+
+@unittest.skipUnless(Starfield.available(), "numpy is not installed")
+class StarfieldTestCase(unittest.TestCase):
+    def setUp(self):
+        self.background = pygame.Surface((100, 50))
+        self.background.fill(BACKGROUND_COLOR)
+        # table drawn over the left half, stars go only to the free pixels.
+        self.background.fill((200, 0, 0), pygame.Rect(0, 0, 50, 50))
+
+    def starfield(self, seed=7):
+        return Starfield(self.background, BACKGROUND_COLOR, seed=seed, density=0.1, twinkles_per_second=100,
+                         star_color=STAR_COLOR)
+
+    def test_stars_are_scattered_over_free_pixels_only(self):
+        starfield = self.starfield()
+
+        self.assertEqual(len(starfield), 250)
+        self.assertTrue(all(x >= 50 for x in starfield.xs.tolist()))
+        self.assertEqual(self.background.get_at((10, 10)), (200, 0, 0, 255))
+
+    def test_same_seed_gives_the_same_stars(self):
+        first = self.starfield()
+        positions = list(zip(first.xs.tolist(), first.ys.tolist()))
+        self.background.fill(BACKGROUND_COLOR, pygame.Rect(50, 0, 50, 50))
+
+        second = self.starfield()
+        self.assertEqual(list(zip(second.xs.tolist(), second.ys.tolist())), positions)
+
+    def test_twinkles_accumulate_over_frames(self):
+        starfield = self.starfield()
+
+        self.assertEqual(starfield.update(5), [])
+        rects = starfield.update(10)
+        self.assertEqual(len(rects), 1)
+        self.assertEqual(rects[0].size, (1, 1))
+        self.assertIn(rects[0].topleft, set(zip(starfield.xs.tolist(), starfield.ys.tolist())))
+
+if __name__ == '__main__':
+    unittest.main()
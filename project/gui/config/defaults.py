@@ -2,23 +2,38 @@
 
 # STD lib imports
 import enum
+import json
 
 # External imports
 import pygame
-import pygame.display as disp
 
 # Internal imports
 import gui.utils.colors as colors
-
-
-pygame.display.init()
+from games.caravan.input import UserInputOptions
 
 
 # Display.
-INFOOBJ = disp.Info()
-WIDTH, HEIGHT = 1450, 800  # INFOOBJ.current_w, INFOOBJ.current_h
+WIDTH, HEIGHT = 1450, 800  # logical size of the table, layout is scaled to fit the actual window.
+WINDOW_SIZE = 1450, 800
 FRAMERATE = 60
 FULLSCREEN = False
+HIT_GRID_CELL_SIZE = 128  # size of the spatial index cells used for mouse hit-testing.
+RESOLUTIONS = [(1450, 800), (1920, 1080), (2560, 1440), (3840, 2160)]  # resolutions assets get baked for.
+
+# Assets.
+ASSET_CACHE_DIR = r"gui/assets/cache"
+
+# User settings, each section overrides the defaults of its part of the GUI.
+CONFIG_PATH = r"gui/config/config.json"
+
+
+def settings(section: str, path: str = CONFIG_PATH) -> dict:
+    """Section of the config file, empty if there is no such section or no file at all."""
+    try:
+        with open(path) as config_file:
+            return json.load(config_file).get(section, {})
+    except FileNotFoundError:
+        return {}
 
 
 class Colors(enum.Enum):
@@ -30,6 +45,20 @@ class Colors(enum.Enum):
 FONT_PATH = r"gui/assets/fonts/upheavtt.ttf"
 FONT_SIZE = 16
 USE_AA = False
+TEXT_CACHE_SIZE = 256  # number of rendered text surfaces kept around.
+
+
+# Input.
+KEY_BINDINGS = {
+    pygame.K_LEFT:     UserInputOptions.MOVE_LEFT,
+    pygame.K_RIGHT:    UserInputOptions.MOVE_RIGHT,
+    pygame.K_UP:       UserInputOptions.MOVE_UP,
+    pygame.K_DOWN:     UserInputOptions.MOVE_DOWN,
+    pygame.K_RETURN:   UserInputOptions.ACCEPT,
+    pygame.K_KP_ENTER: UserInputOptions.ACCEPT,
+    pygame.K_ESCAPE:   UserInputOptions.CANCEL,
+    pygame.K_t:        UserInputOptions.CHAT,
+}
 
 
 class Card(enum.Enum):
@@ -48,6 +77,14 @@ class Card(enum.Enum):
     TEXT_Y_MARGIN             = 10
 
 
+class Carousel(enum.Enum):
+    """Default settings of the card carousel of the deck assembly."""
+    VISIBLE_CARDS  = 11
+    MARGIN         = 2    # cards on each side of the visible ones that have their sprites ready.
+    SPACING        = 110  # distance between left edges of neighbouring cards.
+    SELECTION_LIFT = 25   # selected card is raised by this much.
+
+
 # aesthetic: work out nice default color scheme.
 class Button(enum.Enum):
     """Default settings for buttons."""
@@ -59,3 +96,65 @@ class Button(enum.Enum):
     PRESS_BACKGROUND_COLOR   = colors.WHITE
     FONT                     = FONT_PATH
     FONT_SIZE                = FONT_SIZE
+
+
+class Chat(enum.Enum):
+    """Default settings of the chat box."""
+    DEFAULT_FOREGROUND_COLOR = colors.LIGHT_GREY
+    DEFAULT_BACKGROUND_COLOR = Colors.BACKGROUND.value
+    SELECT_FOREGROUND_COLOR  = colors.WHITE
+    SELECT_BACKGROUND_COLOR  = colors.BLUE
+    PRESS_FOREGROUND_COLOR   = colors.BLUE
+    PRESS_BACKGROUND_COLOR   = colors.WHITE
+    MAX_MESSAGES             = 1000  # messages kept in the ring buffer, the oldest ones are dropped.
+    PADDING                  = 4
+    BORDER_THICKNESS         = 2
+    SCROLL_LINES             = 3     # lines scrolled by a single step of the mouse wheel.
+    SCROLL_SPEED             = 12    # rate (per second) at which the view catches up with scroll target.
+
+
+class Animation(enum.Enum):
+    """Default durations of card animations, in milliseconds."""
+    MOVE_DURATION      = 250
+    FLIP_DURATION      = 300
+    HIGHLIGHT_DURATION = 400
+
+
+class Starfield(enum.Enum):
+    """Default settings of the animated starfield background, it requires numpy."""
+    ENABLED             = True
+    SEED                = 1337
+    DENSITY             = 0.002  # fraction of the free background pixels that hold a star.
+    TWINKLES_PER_SECOND = 240    # stars that change their brightness each second.
+    COLOR               = 230, 230, 200, 255
+
+
+class FramePacing(enum.Enum):
+    """Default settings of the adaptive frame pacing, "frame_pacing" section of the config file overrides them."""
+    ADAPTIVE      = True  # False renders at FRAMERATE at all times.
+    IDLE_TIMEOUT  = 500   # milliseconds idle loop blocks waiting for an event.
+    ACTIVE_FRAMES = 15    # frames rendered at full rate after the last activity.
+
+
+class Startup(enum.Enum):
+    """Default settings of the startup profiling."""
+    BUDGET           = 1000  # milliseconds allowed until the first frame is presented.
+    RUNS             = 3     # time to first frame is the median of this many runs.
+    REPORTED_IMPORTS = 15    # number of the slowest imports reported.
+
+
+class Scenes(enum.Enum):
+    """Default settings of the scene manager."""
+    PRELOAD = True  # read assets of the next stage in the background.
+
+
+class Profiler(enum.Enum):
+    """Default settings for the frame-time profiler."""
+    ENABLED          = False
+    CAPACITY         = 600  # frames kept in the ring buffer.
+    REFRESH_INTERVAL = 30   # frames between overlay refreshes.
+    TOGGLE_KEY       = pygame.K_F3
+    EXPORT_KEY       = pygame.K_F4
+    CSV_PATH         = r"frame_times.csv"
+    FOREGROUND_COLOR = colors.LIGHT_GREEN
+    BACKGROUND_COLOR = Colors.BACKGROUND.value
@@ -6,8 +6,6 @@ from __future__ import annotations
 This module contains buttons jo.
 """
 
-# OPTIMIZATION: Make sure to use DirtySprite, or otherwise minimize unnecessary drawing.
-
 # STD lib imports
 import functools
 from typing import Optional
@@ -84,12 +82,12 @@ class Button(pygame.sprite.DirtySprite, gui_interfaces.ISelect, gui_interfaces.I
         self.__current_color_scheme = self.__color_scheme.default_foreground, self.__color_scheme.default_background
 
         # other parts of the button.
-        self.__open_brace = self.__font_object.render("[", defaults.USE_AA, *self.__current_color_scheme)
-        self.__close_brace = self.__font_object.render("]", defaults.USE_AA, *self.__current_color_scheme)
+        self.__open_brace = self.__font_object.render_cached("[", defaults.USE_AA, *self.__current_color_scheme)
+        self.__close_brace = self.__font_object.render_cached("]", defaults.USE_AA, *self.__current_color_scheme)
         self.__render_offset = self.__open_brace.get_width()
 
         # render initial label, since text won't ever change we can store dimensions of the render surface.
-        label_surface = self.__font_object.render(self.label, defaults.USE_AA, *self.__current_color_scheme)
+        label_surface = self.__font_object.render_cached(self.label, defaults.USE_AA, *self.__current_color_scheme)
         sizes = [_.get_rect().size for _ in (self.__open_brace, label_surface, self.__close_brace)]
         width = functools.reduce(lambda acc, size: acc + size[0], sizes, 0)
         _, height = max(sizes, key=lambda size: size[1])
@@ -101,34 +99,38 @@ class Button(pygame.sprite.DirtySprite, gui_interfaces.ISelect, gui_interfaces.I
         # used for collision detection.
         self.rect = pygame.rect.Rect(position, (width, height))
 
+    def __set_color_scheme(self, foreground: RGBA, background: RGBA) -> None:
+        """Switch current colors, button needs to be redrawn only if they have actually changed."""
+        if self.__current_color_scheme != (foreground, background):
+            self.__current_color_scheme = foreground, background
+            self.dirty = 1
+
     # region Base class overrides
     def update(self) -> None:
-        label_surface = self.__font_object.render(self.label, defaults.USE_AA, *self.__current_color_scheme)
-        self.image.blit(label_surface, (self.__render_offset, 0))
+        """Render the label, only if the button is dirty."""
+        if self.dirty:
+            label_surface = self.__font_object.render_cached(self.label, defaults.USE_AA, *self.__current_color_scheme)
+            self.image.blit(label_surface, (self.__render_offset, 0))
     # endregion
 
     # Interface implementations
     # region ISelect
     def selected(self) -> None:
-        self.dirty = True
-        self.__current_color_scheme = self.__color_scheme.select_foreground, self.__color_scheme.select_background
+        self.__set_color_scheme(self.__color_scheme.select_foreground, self.__color_scheme.select_background)
 
     def unselected(self) -> None:
-        self.dirty = True
-        self.__current_color_scheme = self.__color_scheme.default_foreground, self.__color_scheme.default_background
+        self.__set_color_scheme(self.__color_scheme.default_foreground, self.__color_scheme.default_background)
 
     # endregion
 
     # region IPress
     def pressed(self) -> None:
         print("pressed")
-        self.dirty = True
         self.is_pressed = True
         self.callback()
-        self.__current_color_scheme = self.__color_scheme.press_foreground, self.__color_scheme.press_background
+        self.__set_color_scheme(self.__color_scheme.press_foreground, self.__color_scheme.press_background)
 
     def released(self) -> None:
-        self.dirty = True
         self.is_pressed = False
         self.selected()
     # endregion
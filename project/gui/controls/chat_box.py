@@ -4,12 +4,29 @@
 
 """
 This module exposes a chat control that allows users to type in and send messages.
+
+Chat keeps a bounded ring buffer of messages. Each message is word wrapped and every line is rendered
+exactly once, when the message arrives, so history never gets re-rendered. Redrawing the control only
+blits the lines that fall into the visible window, which makes its cost independent of the history length.
 """
 
+from __future__ import annotations
+
+# STD lib imports
+from collections import deque
+from typing import Optional
+
+# External imports
+import pygame.draw
+import pygame.sprite
+import pygame.surface as surf
+
+# Internal imports
 import interfaces as general_interfaces
 import gui.interfaces as gui_interfaces
-from interfaces import IDefault
-from gui.types import RGB
+import gui.config.defaults as defaults
+from gui.controls.fonts import Font
+from gui.types import RGB, Position
 
 
 class ChatColorScheme(general_interfaces.IDefault):
@@ -29,31 +46,168 @@ class ChatColorScheme(general_interfaces.IDefault):
         self.press_background = press_background
 
     @classmethod
-    def default(cls) -> IDefault:
-        pass
+    def default(cls) -> ChatColorScheme:
+        return cls(
+            defaults.Chat.DEFAULT_FOREGROUND_COLOR.value,
+            defaults.Chat.DEFAULT_BACKGROUND_COLOR.value,
+            defaults.Chat.SELECT_FOREGROUND_COLOR.value,
+            defaults.Chat.SELECT_BACKGROUND_COLOR.value,
+            defaults.Chat.PRESS_FOREGROUND_COLOR.value,
+            defaults.Chat.PRESS_BACKGROUND_COLOR.value
+        )
+
+
+def wrap(text: str, font_object: Font, width: int) -> list[str]:
+    """Split the text into lines no wider than width, words that don't fit on their own are broken up."""
+    lines = []
+    current = ""
+    for word in text.split():
+        candidate = f"{current} {word}" if current else word
+        if font_object.size(candidate)[0] <= width:
+            current = candidate
+            continue
+        if current:
+            lines.append(current)
+        current = ""
+        for character in word:
+            if current and font_object.size(current + character)[0] > width:
+                lines.append(current)
+                current = ""
+            current += character
+    if current or not lines:
+        lines.append(current)
+    return lines
+
+
+class Chat(pygame.sprite.DirtySprite, gui_interfaces.ISelect, gui_interfaces.IPress, gui_interfaces.IScroll):
+    """Chat box, newest messages at the bottom.
+
+    Scroll offset is measured in pixels from the bottom of the history, view eases towards the target offset.
+    """
+
+    def __init__(self,
+                 position: Position,
+                 size: tuple[int, int],
+                 font_object: Optional[Font] = None,
+                 color_scheme: Optional[ChatColorScheme] = None,
+                 max_messages: int = defaults.Chat.MAX_MESSAGES.value) -> None:
+        super().__init__()
+        self.__font_object = font_object or Font.default()
+        self.__color_scheme = color_scheme or ChatColorScheme.default()
+        self.__line_height = self.__font_object.get_linesize()
+        self.is_selected = False
+        self.is_focused = False
+
+        # Ring buffer of messages along with their rendered lines.
+        self.messages: deque[tuple[str, list[surf.Surface]]] = deque(maxlen=max_messages)
+        self.line_count = 0
+        self.offset = 0.0
+        self.target_offset = 0.0
 
+        padding = defaults.Chat.PADDING.value + defaults.Chat.BORDER_THICKNESS.value
+        self.image = surf.Surface(size)
+        self.rect = pygame.rect.Rect(position, size)
+        self.text_area = self.image.get_rect().inflate(-2 * padding, -2 * padding)
+        self.__needs_redraw = True
 
-class Chat(gui_interfaces.ISelect, gui_interfaces.IPress):
+    @property
+    def max_offset(self) -> int:
+        return max(0, self.line_count * self.__line_height - self.text_area.height)
 
-    def __init__(self):
-        self.chat_box = None  # please make this minecraft like for now?
-        self.messages: list[str] = []
-        self.width = None     #
-        self.height = None    #  some common class for all controls? -- BaseWidget?
+    def post(self, text: str, author: Optional[str] = None) -> None:
+        """Append the message, only its own lines get rendered."""
+        if author is not None:
+            text = f"{author}: {text}"
+        lines = [self.__font_object.render(line, defaults.USE_AA,
+                                           self.__color_scheme.default_foreground,
+                                           self.__color_scheme.default_background)
+                 for line in wrap(text, self.__font_object, self.text_area.width)]
+
+        if len(self.messages) == self.messages.maxlen:
+            self.line_count -= len(self.messages[0][1])
+        self.messages.append((text, lines))
+        self.line_count += len(lines)
+
+        # View that has been scrolled up keeps showing the same lines.
+        if self.target_offset > 0:
+            added_height = len(lines) * self.__line_height
+            self.offset += added_height
+            self.target_offset += added_height
+        self.offset = min(self.offset, self.max_offset)
+        self.target_offset = min(self.target_offset, self.max_offset)
+        self.__needs_redraw = True
+
+    def scroll(self, lines: int) -> None:
+        """Scroll the view by the number of lines, positive scrolls towards the older messages."""
+        self.target_offset = min(max(0.0, self.target_offset + lines * self.__line_height), self.max_offset)
+
+    # region Base class overrides
+    def update(self, dt: float = 0.0) -> None:
+        """Advance smooth scrolling by dt milliseconds, redraw the visible window if anything has changed."""
+        if self.offset != self.target_offset:
+            step = (self.target_offset - self.offset) * min(1.0, defaults.Chat.SCROLL_SPEED.value * dt / 1000)
+            self.offset = self.target_offset if abs(self.target_offset - self.offset - step) < 0.5 else self.offset + step
+            self.__needs_redraw = True
+
+        if self.__needs_redraw:
+            self.__needs_redraw = False
+            self.__redraw()
+            self.dirty = 1
+    # endregion
+
+    def visible_lines(self) -> list[tuple[surf.Surface, Position]]:
+        """Lines that fall into the text area with their positions, from the bottom up."""
+        offset = round(self.offset)
+        skipped_lines, shift = divmod(offset, self.__line_height)
+        y = self.text_area.bottom - self.__line_height + shift
+        visible = []
+        for _, lines in reversed(self.messages):
+            if skipped_lines >= len(lines):
+                skipped_lines -= len(lines)
+                continue
+            for line in reversed(lines[:len(lines) - skipped_lines]):
+                if y + self.__line_height <= self.text_area.top:
+                    return visible
+                visible.append((line, (self.text_area.x, y)))
+                y -= self.__line_height
+            skipped_lines = 0
+        return visible
+
+    def __redraw(self) -> None:
+        if self.is_focused:
+            border_color = self.__color_scheme.press_foreground
+        elif self.is_selected:
+            border_color = self.__color_scheme.select_foreground
+        else:
+            border_color = self.__color_scheme.default_foreground
+        self.image.fill(self.__color_scheme.default_background)
+        self.image.set_clip(self.text_area)
+        self.image.blits(self.visible_lines(), doreturn=False)
+        self.image.set_clip(None)
+        pygame.draw.rect(self.image, border_color, self.image.get_rect(), defaults.Chat.BORDER_THICKNESS.value)
 
     # Interface implementations
     # region ISelect
     def selected(self) -> None:
-        pass
+        if not self.is_selected:
+            self.is_selected = self.__needs_redraw = True
 
     def unselected(self) -> None:
-        pass
+        if self.is_selected:
+            self.is_selected = False
+            self.__needs_redraw = True
     # endregion
 
     # region IPress
     def pressed(self) -> None:
-        pass
+        self.is_focused = not self.is_focused
+        self.__needs_redraw = True
 
     def released(self) -> None:
         pass
     # endregion
+
+    # region IScroll
+    def scrolled(self, dy: int) -> None:
+        self.scroll(dy * defaults.Chat.SCROLL_LINES.value)
+    # endregion
@@ -2,20 +2,93 @@
 
 from __future__ import annotations
 
+# STD lib imports
+from collections import OrderedDict
+from typing import Optional
+
 # External imports
 import pygame.font as font
+import pygame.surface as surf
 
 # Internal imports
 import interfaces as general_interfaces
 import gui.config.defaults as defaults
+from gui.types import RGBA
 
 
 class Font(font.Font, general_interfaces.IDefault):
     __doc__ = font.Font.__doc__
 
+    # Process-wide registry of loaded fonts keyed by (path, size).
+    __registry: dict[tuple[str, int], Font] = {}
+
+    @classmethod
+    def shared(cls, path: str, size: int) -> Font:
+        """Return font object shared by the whole process, font file gets loaded only on the first call."""
+        try:
+            return cls.__registry[path, size]
+        except KeyError:
+            font_object = cls.__registry[path, size] = cls(path, size)
+            return font_object
+
     @classmethod
     def default(cls) -> Font:
-        return cls(
+        return cls.shared(
             defaults.FONT_PATH,
             defaults.FONT_SIZE
         )
+
+    def render_cached(self,
+                      text: str,
+                      antialias: bool,
+                      color: RGBA,
+                      background: Optional[RGBA] = None) -> surf.Surface:
+        """Same as render, but the result is taken from the TEXT_CACHE.
+
+        Returned surface is shared, so it must not be drawn onto.
+        """
+        return TEXT_CACHE.render(self, text, antialias, color, background)
+
+
+class TextCache:
+    """Bounded LRU cache of rendered text surfaces keyed by (font, text, antialias, foreground, background)."""
+
+    def __init__(self, max_size: int = defaults.TEXT_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self.surfaces: OrderedDict[tuple, surf.Surface] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self,
+               font_object: font.Font,
+               text: str,
+               antialias: bool,
+               color: RGBA,
+               background: Optional[RGBA] = None) -> surf.Surface:
+        key = font_object, text, antialias, tuple(color), tuple(background) if background is not None else None
+        try:
+            surface = self.surfaces[key]
+        except KeyError:
+            self.misses += 1
+            surface = self.surfaces[key] = font_object.render(text, antialias, color, background)
+            if len(self.surfaces) > self.max_size:
+                self.surfaces.popitem(last=False)
+        else:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+        return surface
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self) -> None:
+        """Drop all rendered surfaces and reset the counters."""
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+TEXT_CACHE = TextCache()
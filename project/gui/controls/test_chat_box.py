@@ -0,0 +1,58 @@
+# -*- encoding: utf-8 -*-
+
+import unittest
+
+import pygame
+
+from gui.controls.chat_box import Chat, wrap
+from gui.controls.fonts import Font
+
+
+class ChatTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def setUp(self):
+        self.chat = Chat((0, 0), (200, 100), max_messages=10)
+        self.line_height = Font.default().get_linesize()
+
+    def test_wrap_fits_width(self):
+        font_object = Font.default()
+        lines = wrap("lorem ipsum dolor sit amet " * 5 + "x" * 100, font_object, 150)
+
+        self.assertGreater(len(lines), 1)
+        self.assertTrue(all(font_object.size(line)[0] <= 150 for line in lines))
+        self.assertEqual("".join(lines).replace(" ", ""), ("loremipsumdolorsitamet" * 5 + "x" * 100))
+
+    def test_ring_buffer_drops_oldest_messages(self):
+        for index in range(25):
+            self.chat.post(f"message {index}")
+
+        self.assertEqual(len(self.chat.messages), 10)
+        self.assertEqual(self.chat.messages[0][0], "message 15")
+        self.assertEqual(self.chat.line_count, sum(len(lines) for _, lines in self.chat.messages))
+
+    def test_only_visible_lines_are_drawn(self):
+        for index in range(10):
+            self.chat.post(f"message {index}")
+
+        visible = self.chat.visible_lines()
+        self.assertLessEqual(len(visible), self.chat.text_area.height // self.line_height + 1)
+        self.assertIs(visible[0][0], self.chat.messages[-1][1][-1])
+
+    def test_scrolled_view_stays_put_when_message_arrives(self):
+        for index in range(10):
+            self.chat.post(f"message {index}")
+        self.chat.scroll(2)
+        self.chat.update(10_000)
+        first_visible = self.chat.visible_lines()[0][0]
+
+        self.chat.post("new message")
+        self.chat.update(10_000)
+
+        self.assertIs(self.chat.visible_lines()[0][0], first_visible)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+# -*- encoding: utf-8 -*-
+
+import unittest
+
+import pygame
+
+from gui.controls.fonts import Font, TextCache
+
+
+class TextCacheTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def setUp(self):
+        self.cache = TextCache(max_size=2)
+        self.font = Font.default()
+
+    def render(self, text):
+        return self.cache.render(self.font, text, True, (255, 255, 255))
+
+    def test_hit_returns_the_same_surface(self):
+        surface = self.render("a")
+
+        self.assertIs(self.render("a"), surface)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(self.cache.hit_rate, 0.5)
+
+    def test_least_recently_used_is_evicted(self):
+        self.render("a")
+        self.render("b")
+        # "a" becomes the most recently used, so "b" goes first.
+        self.render("a")
+        self.render("c")
+
+        self.assertEqual([key[1] for key in self.cache.surfaces], ["a", "c"])
+        self.render("b")
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 4))
+
+    def test_clear_resets_the_counters(self):
+        self.render("a")
+        self.render("a")
+        self.cache.clear()
+
+        self.assertEqual((len(self.cache.surfaces), self.cache.hits, self.cache.misses), (0, 0, 0))
+        self.assertEqual(self.cache.hit_rate, 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
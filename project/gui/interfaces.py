@@ -85,3 +85,15 @@ class IDisabled(abc.ABC):
     def enable(self) -> None:
         """Enable responsiveness"""
         pass
+
+
+class IScroll(abc.ABC):
+    """Interface that allows objects to react to the mouse wheel while under the pointer."""
+
+    @abc.abstractmethod
+    def scrolled(self, dy: int) -> None:
+        """Scroll event handler, positive dy scrolls up.
+
+        pygame.event.MOUSEWHEEL event to be precise.
+        """
+        pass
@@ -0,0 +1,114 @@
+# -*- encoding: utf-8 -*-
+
+import unittest
+
+import pygame
+
+import games.caravan.logic.round as round_logic
+from gui.animation import Animator
+from gui.views.caravan.round import Card
+
+
+class AnimatorTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def setUp(self):
+        self.animator = Animator()
+        self.cards = [Card(round_logic.Card(round_logic.Rank.TWO, round_logic.Suit.SPADES), (0, 0)) for _ in range(3)]
+
+    def assert_targets(self, expected):
+        """Each tween still belongs to the sprite it was scheduled for."""
+        for sprite, destination in expected:
+            index = self.animator.index_of(sprite, Animator.Kind.POSITION)
+            self.assertIs(self.animator.sprites[index], sprite)
+            self.assertEqual((self.animator.start_x[index] + self.animator.delta_x[index],
+                              self.animator.start_y[index] + self.animator.delta_y[index]), destination)
+
+    def test_finished_middle_tween_leaves_the_others_on_their_sprites(self):
+        first, middle, last = self.cards
+        self.animator.move(first, (100, 0), duration=300)
+        self.animator.move(middle, (0, 100), duration=100)
+        self.animator.move(last, (200, 200), duration=300)
+
+        self.animator.advance(100)
+        self.assertEqual(middle.position, (0, 100))
+        self.assertIsNone(self.animator.index_of(middle, Animator.Kind.POSITION))
+        self.assert_targets([(first, (100, 0)), (last, (200, 200))])
+
+        self.animator.advance(200)
+        self.assertEqual((first.position, last.position), ((100, 0), (200, 200)))
+        self.assertFalse(self.animator.is_active)
+
+    def test_cancelled_middle_tween_leaves_the_others_on_their_sprites(self):
+        first, middle, last = self.cards
+        for index, sprite in enumerate(self.cards):
+            self.animator.move(sprite, (10 * (index + 1), 0))
+        self.animator.flip(last)
+
+        self.animator.cancel(middle, Animator.Kind.POSITION)
+        self.assertEqual(len(self.animator), 3)
+        self.assert_targets([(first, (10, 0)), (last, (30, 0))])
+        self.assertIs(self.animator.sprites[self.animator.index_of(last, Animator.Kind.FLIP)], last)
+
+    def test_rescheduled_tween_replaces_the_running_one(self):
+        first, middle, _ = self.cards
+        self.animator.move(first, (10, 0))
+        self.animator.move(middle, (20, 0))
+        self.animator.move(first, (50, 0))
+
+        self.assertEqual(len(self.animator), 2)
+        self.assert_targets([(first, (50, 0)), (middle, (20, 0))])
+
+    def test_flip_reuses_its_frame_and_ends_on_the_other_side(self):
+        card = self.cards[0]
+        self.animator.flip(card)
+        frame = self.animator.frames[0]
+
+        self.animator.advance(100)
+        self.assertIs(card.image, frame)
+        self.animator.advance(100)
+        self.assertIs(card.image, frame)
+        self.assertTrue(card.hidden)
+
+        self.animator.advance(100)
+        self.assertTrue(card.hidden)
+        self.assertIsNot(card.image, frame)
+        self.assertFalse(self.animator.is_active)
+
+    def test_highlight_restores_the_state_of_the_sprite(self):
+        card = self.cards[0]
+        card.update(Card.State.INCORRECT)
+        self.animator.highlight(card, Card.State.CORRECT, duration=200)
+        self.assertIs(card.state, Card.State.CORRECT)
+
+        self.animator.advance(100)
+        self.assertIs(card.state, Card.State.CORRECT)
+        # highlight of a highlighted sprite restores its own state, not the previous highlight.
+        self.animator.highlight(card, Card.State.DEFAULT, duration=200)
+        self.assertEqual(len(self.animator), 1)
+        self.animator.advance(200)
+        self.assertIs(card.state, Card.State.INCORRECT)
+        self.assertFalse(self.animator.is_active)
+
+    def test_highlight_runs_along_with_other_tweens_of_the_sprite(self):
+        first, middle, last = self.cards
+        self.animator.move(first, (100, 0), duration=300)
+        self.animator.highlight(middle, Card.State.CORRECT, duration=100)
+        self.animator.highlight(first, Card.State.INCORRECT, duration=300)
+        self.animator.move(last, (0, 100), duration=300)
+
+        self.animator.advance(100)
+        self.assertIs(middle.state, Card.State.DEFAULT)
+        self.assertIsNone(self.animator.index_of(middle, Animator.Kind.HIGHLIGHT))
+        self.assert_targets([(first, (100, 0)), (last, (0, 100))])
+        self.assertIs(self.animator.sprites[self.animator.index_of(first, Animator.Kind.HIGHLIGHT)], first)
+
+        self.animator.cancel(first, Animator.Kind.HIGHLIGHT)
+        self.assertIs(first.state, Card.State.DEFAULT)
+        self.assertEqual(len(self.animator), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+# -*- encoding: utf-8 -*-
+
+"""
+This module exposes the input layer that sits between the pygame event queue and the game loop.
+
+Only the event types that the game handles are let into the queue. All pointer motion of a frame is
+coalesced into its latest position (and mouse wheel steps into their sum), so hover is resolved once per
+frame regardless of how fast the mouse moves, and key presses are translated into UserInputOptions
+through a dispatch table.
+"""
+
+from __future__ import annotations
+
+# STD lib imports
+import time
+from typing import Callable, NamedTuple, Optional, Sequence
+
+# External imports
+import pygame
+import pygame.event
+
+# Internal imports
+import gui.config.defaults as defaults
+import gui.interfaces as gui_interfaces
+from games.caravan.input import UserInputOptions
+from gui.types import Position
+from gui.utils.spatial import SpatialHash
+
+
+class FrameInput(NamedTuple):
+    """Input gathered during single frame."""
+    quit: bool
+    actions: list[UserInputOptions]
+    events: int  # number of events drained from the queue.
+    # perf_counter time the queue was last drained, events of the frame were queued after it. pygame doesn't
+    # tell the time of the events themselves.
+    queued_after: float
+
+
+class InputLayer:
+    """Filtered, coalesced view of the event queue that routes pointer events to sprites of the hit index."""
+
+    # Posted from other threads (eg. by the logic thread after it publishes a snapshot) to wake up an idle loop.
+    WAKE_UP = pygame.event.custom_type()
+
+    HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                      pygame.MOUSEWHEEL, WAKE_UP]
+
+    def __init__(self,
+                 hit_index: SpatialHash,
+                 key_bindings: Optional[dict[int, UserInputOptions]] = None,
+                 hotkeys: Optional[dict[int, Callable[[], None]]] = None) -> None:
+        self.hit_index = hit_index
+        self.key_bindings = key_bindings if key_bindings is not None else defaults.KEY_BINDINGS
+        # Keys handled by the GUI itself, these never reach the game.
+        self.hotkeys = hotkeys if hotkeys is not None else {}
+        self.hovered: Optional[pygame.sprite.Sprite] = None
+        self.drained_at = time.perf_counter()
+
+    @classmethod
+    def wake_up(cls) -> None:
+        """Make the loop render the next frame right away, safe to call from any thread."""
+        pygame.event.post(pygame.event.Event(cls.WAKE_UP))
+
+    @classmethod
+    def install(cls) -> None:
+        """Block all the event types that are not handled, call once the display has been initialized."""
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(cls.HANDLED_EVENTS)
+
+    def poll(self, pending: Sequence[pygame.event.Event] = ()) -> FrameInput:
+        """Drain the event queue.
+
+        :param pending: events already taken off the queue (eg. by the idle wait of FramePacer), they come first.
+        """
+        quit_requested = False
+        actions = []
+        pointer: Optional[Position] = None
+        wheel = 0
+        events = [*pending, *pygame.event.get()]
+        queued_after, self.drained_at = self.drained_at, time.perf_counter()
+        for event in events:
+            match event.type:
+                case pygame.MOUSEMOTION:
+                    pointer = event.pos
+                case pygame.KEYDOWN:
+                    if (hotkey := self.hotkeys.get(event.key)) is not None:
+                        hotkey()
+                    elif (action := self.key_bindings.get(event.key)) is not None:
+                        actions.append(action)
+                # right button and the wheel (buttons 4 and 5, sent along with MOUSEWHEEL) press nothing.
+                case pygame.MOUSEBUTTONDOWN if event.button == pygame.BUTTON_LEFT:
+                    self.press(event.pos)
+                case pygame.MOUSEBUTTONUP if event.button == pygame.BUTTON_LEFT:
+                    self.release(event.pos)
+                case pygame.MOUSEWHEEL:
+                    wheel += event.y
+                case pygame.QUIT:
+                    quit_requested = True
+
+        if pointer is not None:
+            self.hover(pointer)
+        if wheel:
+            self.scroll(pygame.mouse.get_pos(), wheel)
+        return FrameInput(quit_requested, actions, len(events), queued_after)
+
+    # region Pointer routing
+    def hover(self, position: Position) -> None:
+        """Select the topmost sprite under the pointer and unselect the previously hovered one."""
+        target = self.hit_index.topmost(position)
+        if target is self.hovered:
+            return
+        if isinstance(self.hovered, gui_interfaces.ISelect):
+            self.hovered.unselected()
+        if isinstance(target, gui_interfaces.ISelect) and not getattr(target, "is_pressed", False):
+            target.selected()
+        self.hovered = target
+
+    def press(self, position: Position) -> None:
+        target = self.hit_index.topmost(position)
+        if isinstance(target, gui_interfaces.IPress):
+            target.pressed()
+
+    def release(self, position: Position) -> None:
+        target = self.hit_index.topmost(position)
+        if isinstance(target, gui_interfaces.IPress):
+            target.released()
+
+    def scroll(self, position: Position, dy: int) -> None:
+        target = self.hit_index.topmost(position)
+        if isinstance(target, gui_interfaces.IScroll):
+            target.scrolled(dy)
+    # endregion
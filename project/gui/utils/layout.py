@@ -0,0 +1,67 @@
+# -*- encoding: utf-8 -*-
+
+"""
+This module exposes the mapping of logical coordinates onto the screen.
+
+Views position everything in logical coordinates of a defaults.WIDTH x defaults.HEIGHT table. Layout scales
+them uniformly to fit the actual window (letterboxed, so aspect ratio is kept) only when sprites are placed,
+static layers are pre-scaled once per resolution - nothing gets scaled per frame.
+"""
+
+from __future__ import annotations
+
+# STD lib imports
+from typing import Optional
+
+# External imports
+import pygame
+
+# Internal imports
+import gui.config.defaults as defaults
+from gui.types import Position
+
+
+Size = tuple[int, int]
+
+
+class Layout:
+    """Uniform scale and offset from logical coordinates to screen pixels."""
+
+    # Layout of the display, identity until the display mode gets set.
+    __current: Optional[Layout] = None
+
+    def __init__(self, screen_size: Size, logical_size: Size = (defaults.WIDTH, defaults.HEIGHT)) -> None:
+        self.screen_size = tuple(screen_size)
+        self.logical_size = tuple(logical_size)
+        self.scale = min(screen_size[0] / logical_size[0], screen_size[1] / logical_size[1])
+        self.offset = (round((screen_size[0] - logical_size[0] * self.scale) / 2),
+                       round((screen_size[1] - logical_size[1] * self.scale) / 2))
+
+    @classmethod
+    def current(cls) -> Layout:
+        if cls.__current is None:
+            cls.__current = cls((defaults.WIDTH, defaults.HEIGHT))
+        return cls.__current
+
+    @classmethod
+    def configure(cls, screen_size: Size) -> Layout:
+        """Make layout fitting the screen size current, call whenever display mode is set."""
+        cls.__current = cls(screen_size)
+        return cls.__current
+
+    def to_screen(self, position: Position) -> Position:
+        return (self.offset[0] + round(position[0] * self.scale),
+                self.offset[1] + round(position[1] * self.scale))
+
+    def to_logical(self, point: Position) -> Position:
+        return (round((point[0] - self.offset[0]) / self.scale),
+                round((point[1] - self.offset[1]) / self.scale))
+
+    def size_to_screen(self, size: Size) -> Size:
+        return max(1, round(size[0] * self.scale)), max(1, round(size[1] * self.scale))
+
+    def rect_to_screen(self, rect: pygame.Rect) -> pygame.Rect:
+        return pygame.Rect(self.to_screen(rect.topleft), self.size_to_screen(rect.size))
+
+    def font_size(self, size: int = defaults.FONT_SIZE) -> int:
+        return max(1, round(size * self.scale))
@@ -0,0 +1,45 @@
+# -*- encoding: utf-8 -*-
+
+"""
+This module exposes helpers for deferring imports until the imported code is actually needed.
+"""
+
+from __future__ import annotations
+
+# STD lib imports
+import importlib
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Callable
+
+
+def lazy_submodules(package: str, names: set[str]) -> Callable[[str], ModuleType]:
+    """Module level __getattr__ (PEP 562) of the package, that imports its submodules on first access.
+
+    Usage, in package's __init__.py:
+        __getattr__ = lazy_submodules(__name__, {"view", "other_view"})
+    """
+    def __getattr__(name: str) -> ModuleType:
+        if name not in names:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        # importing the submodule also binds it as the attribute of the package, so this runs once per name.
+        return importlib.import_module(f"{package}.{name}")
+
+    return __getattr__
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Module that gets executed on first access to any of its attributes, see importlib.util.LazyLoader.
+
+    Usage, instead of `import package.module as module`:
+        module = lazy_import("package.module")
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
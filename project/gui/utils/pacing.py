@@ -0,0 +1,83 @@
+# -*- encoding: utf-8 -*-
+
+"""
+This module exposes adaptive frame pacing of the game loop.
+
+Loop runs at full frame rate only while there is something going on - input, animations or sprites
+being redrawn. Once it has been quiet for a few frames, the loop blocks on the event queue instead,
+so an idle game uses next to no CPU time. Event that wakes the loop up is handed to the input handling
+directly, putting it back would move it behind the events queued since.
+"""
+
+from __future__ import annotations
+
+# STD lib imports
+import time
+from typing import Optional
+
+# External imports
+import pygame
+import pygame.event
+import pygame.time
+
+# Internal imports
+import gui.config.defaults as defaults
+
+
+class FramePacer:
+    """Decides whether the next frame is rendered right away or after waiting for an event."""
+
+    def __init__(self,
+                 clock: Optional[pygame.time.Clock] = None,
+                 framerate: int = defaults.FRAMERATE,
+                 adaptive: bool = defaults.FramePacing.ADAPTIVE.value,
+                 idle_timeout: int = defaults.FramePacing.IDLE_TIMEOUT.value,
+                 active_frames: int = defaults.FramePacing.ACTIVE_FRAMES.value) -> None:
+        self.clock = clock if clock is not None else pygame.time.Clock()
+        self.framerate = framerate
+        self.adaptive = adaptive
+        self.idle_timeout = idle_timeout
+        self.active_frames = active_frames
+        self.__remaining_active_frames = active_frames
+        self.idle_frames = 0
+        # perf_counter time the idle wait was woken up by an event, the queue was empty until then.
+        self.woken_at = 0.0
+        self.__woken_by: list[pygame.event.Event] = []
+
+    @classmethod
+    def from_config(cls, path: str = defaults.CONFIG_PATH, clock: Optional[pygame.time.Clock] = None) -> FramePacer:
+        """Pacer with the settings of the config file, missing ones are taken from the defaults."""
+        return cls(clock, **defaults.settings("frame_pacing", path))
+
+    @property
+    def is_idle(self) -> bool:
+        return self.adaptive and self.__remaining_active_frames <= 0
+
+    def pending_events(self) -> list[pygame.event.Event]:
+        """Event the idle wait has taken off the queue (if any), it's handed over only once."""
+        events, self.__woken_by = self.__woken_by, []
+        return events
+
+    def tick(self, busy: bool) -> float:
+        """End the frame, busy frame keeps the loop at full rate for a while.
+
+        :return: milliseconds to advance animations by in the next frame.
+        """
+        if busy:
+            self.__remaining_active_frames = self.active_frames
+        elif self.__remaining_active_frames > 0:
+            self.__remaining_active_frames -= 1
+
+        if not self.is_idle:
+            return self.clock.tick(self.framerate)
+
+        self.idle_frames += 1
+        event = pygame.event.wait(self.idle_timeout)
+        if event.type != pygame.NOEVENT:
+            # Woken up by an event, it's the oldest one so it goes first to the input handling of the next frame.
+            self.__woken_by.append(event)
+            self.woken_at = time.perf_counter()
+            self.__remaining_active_frames = self.active_frames
+        # Nothing has been animated while waiting, so the time spent blocked is not passed on.
+        self.clock.tick()
+        return 1000 / self.framerate
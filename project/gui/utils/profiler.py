@@ -0,0 +1,174 @@
+# -*- encoding: utf-8 -*-
+
+"""
+This module exposes frame-time profiler of the game loop and the overlay that displays its statistics.
+
+Profiler keeps a ring buffer of the last N frames, each split into the phases of the game loop,
+along with input-to-present latency of the frames that handled key input - measured from the time the input
+was queued, so that the time it waited for the loop to get to it is included.
+When disabled every method returns right away, so it can stay in the loop at all times.
+"""
+
+from __future__ import annotations
+
+# STD lib imports
+import csv
+import math
+import time
+from array import array
+from enum import Enum, auto
+from typing import Optional
+
+# External imports
+import pygame.sprite
+import pygame.surface as surf
+
+# Internal imports
+import gui.config.defaults as defaults
+from gui.controls.fonts import Font
+from gui.types import Position
+import utils.stats as stats
+
+
+class FrameProfiler:
+    """Ring buffer of per-frame, per-phase timings."""
+
+    class Phase(Enum):
+        """Game loop phases in order of execution."""
+        EVENTS      = 0
+        LOGIC       = auto()
+        VIEW_UPDATE = auto()
+        BLIT        = auto()
+        PRESENT     = auto()
+
+    def __init__(self, capacity: int = defaults.Profiler.CAPACITY.value,
+                 enabled: bool = defaults.Profiler.ENABLED.value) -> None:
+        self.capacity = capacity
+        self.enabled = enabled
+        # One ring per phase, timings in seconds.
+        self.samples = [array("d", [0.0]) * capacity for _ in FrameProfiler.Phase]
+        self.latencies = array("d", [math.nan]) * capacity
+        self.frame_count = 0
+        self.__last_mark = 0.0
+        self.__input_time: Optional[float] = None
+
+    def toggle(self) -> None:
+        self.enabled = not self.enabled
+        if self.enabled:
+            # profiler may be switched on in the middle of a frame.
+            self.begin_frame()
+
+    @property
+    def size(self) -> int:
+        """Number of frames currently held in the buffer."""
+        return min(self.frame_count, self.capacity)
+
+    def begin_frame(self) -> None:
+        if not self.enabled:
+            return
+        self.__last_mark = time.perf_counter()
+        index = self.frame_count % self.capacity
+        for ring in self.samples:
+            ring[index] = 0.0
+        self.latencies[index] = math.nan
+
+    def mark(self, phase: FrameProfiler.Phase) -> None:
+        """Attribute time elapsed since the previous mark to the phase."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.samples[phase.value][self.frame_count % self.capacity] += now - self.__last_mark
+        self.__last_mark = now
+
+    def input_received(self, queued_at: Optional[float] = None) -> None:
+        """Note key input queued at the time (perf_counter, now by default).
+
+        Latency is measured from then until the frame that handled the input is presented.
+        """
+        if self.enabled and self.__input_time is None:
+            self.__input_time = queued_at if queued_at is not None else time.perf_counter()
+
+    def end_frame(self) -> None:
+        """Call right after the frame has been presented."""
+        if not self.enabled:
+            return
+        if self.__input_time is not None:
+            self.latencies[self.frame_count % self.capacity] = time.perf_counter() - self.__input_time
+            self.__input_time = None
+        self.frame_count += 1
+
+    def __chronological(self, ring: array) -> list[float]:
+        """Samples of the ring from the oldest to the newest."""
+        if self.frame_count <= self.capacity:
+            return ring[:self.frame_count].tolist()
+        start = self.frame_count % self.capacity
+        return ring[start:].tolist() + ring[:start].tolist()
+
+    def frame_times(self) -> list[float]:
+        """Total time of each recorded frame."""
+        return [sum(phases) for phases in zip(*(self.__chronological(ring) for ring in self.samples))]
+
+    def summary(self) -> dict[str, tuple[float, ...]]:
+        """Rolling p50/p95/p99 of each phase, the whole frame and input latency, in milliseconds."""
+        rows = {phase.name: self.__chronological(self.samples[phase.value]) for phase in FrameProfiler.Phase}
+        rows["FRAME"] = self.frame_times()
+        rows["LATENCY"] = self.__chronological(self.latencies)
+        return {name: tuple(_ * 1000 for _ in stats.percentiles(samples)) for name, samples in rows.items()}
+
+    def export_csv(self, path: str) -> None:
+        """Write recorded frames, oldest first, timings in milliseconds."""
+        columns = [self.__chronological(self.samples[phase.value]) for phase in FrameProfiler.Phase]
+        latencies = self.__chronological(self.latencies)
+        first_frame = self.frame_count - self.size
+        with open(path, "w", newline="") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(["frame", *(f"{phase.name.lower()}_ms" for phase in FrameProfiler.Phase),
+                             "total_ms", "input_latency_ms"])
+            for offset, (phases, latency) in enumerate(zip(zip(*columns), latencies)):
+                writer.writerow([
+                    first_frame + offset,
+                    *(f"{_ * 1000:.3f}" for _ in phases),
+                    f"{sum(phases) * 1000:.3f}",
+                    "" if math.isnan(latency) else f"{latency * 1000:.3f}"
+                ])
+
+
+class ProfilerOverlay(pygame.sprite.DirtySprite):
+    """Sprite with the profiler summary, it's re-rendered only every few frames."""
+
+    def __init__(self,
+                 profiler: FrameProfiler,
+                 position: Position,
+                 refresh_interval: int = defaults.Profiler.REFRESH_INTERVAL.value) -> None:
+        super().__init__()
+        self.profiler = profiler
+        self.refresh_interval = refresh_interval
+        self.__font_object = Font.default()
+        self.__line_height = self.__font_object.get_linesize()
+        self.__last_refresh = -refresh_interval
+        self.image = surf.Surface((1, 1))
+        self.rect = pygame.rect.Rect(position, (1, 1))
+        self.visible = int(profiler.enabled)
+
+    def update(self) -> None:
+        if self.visible != self.profiler.enabled:
+            self.visible = int(self.profiler.enabled)
+        if not self.profiler.enabled or self.profiler.frame_count - self.__last_refresh < self.refresh_interval:
+            return
+        self.__last_refresh = self.profiler.frame_count
+
+        lines = [f"{'':<12}{'p50':>8}{'p95':>8}{'p99':>8}"] + [
+            f"{name:<12}" + "".join(f"{value:>8.2f}" for value in values)
+            for name, values in self.profiler.summary().items()
+        ]
+        rendered = [self.__font_object.render(line, defaults.USE_AA, defaults.Profiler.FOREGROUND_COLOR.value)
+                    for line in lines]
+        width = max(line.get_width() for line in rendered)
+        image = surf.Surface((width, self.__line_height * len(rendered)))
+        image.fill(defaults.Profiler.BACKGROUND_COLOR.value)
+        for index, line in enumerate(rendered):
+            image.blit(line, (0, index * self.__line_height))
+
+        self.image = image
+        self.rect.size = image.get_size()
+        self.dirty = 1
@@ -0,0 +1,111 @@
+# -*- encoding: utf-8 -*-
+
+"""
+This module exposes the scene manager that moves the game through its stages.
+
+While a scene is on screen, files of the next stage's assets are read (and decoded) by a background thread,
+so that switching to it doesn't wait for the disk. Everything that touches shared state - conversion to the
+display format, the font registry and the surface caches - is done when the stage is entered, on the main
+thread. Once loaded, assets stay in those process-wide caches, stages share most of them.
+"""
+
+from __future__ import annotations
+
+# STD lib imports
+import importlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import ModuleType
+from typing import Any, Callable, Optional
+
+# Internal imports
+import interfaces as general_interfaces
+import gui.config.defaults as defaults
+from games.caravan.game import Game
+
+
+# Modules of gui.views.caravan with the view of each stage.
+STAGE_VIEWS = {
+    Game.Stages.BIDDING:       "bidding",
+    Game.Stages.DECK_ASSEMBLY: "deck_assembly",
+    Game.Stages.ROUND:         "round",
+    Game.Stages.SUMMARY:       "summary",
+}
+
+
+def stage_view(stage: Game.Stages) -> ModuleType:
+    """Module with the view of the stage, its load() is run in the background and prepare() on the main thread."""
+    return importlib.import_module(f"gui.views.caravan.{STAGE_VIEWS[stage]}")
+
+
+class SceneManager(general_interfaces.IDefault):
+    """Switches between the stages of the game and owns the assets of their scenes."""
+
+    def __init__(self,
+                 game: Game,
+                 loaders: dict[Game.Stages, Callable[[], Any]],
+                 preparers: Optional[dict[Game.Stages, Callable[[Any], Any]]] = None,
+                 preload: bool = defaults.Scenes.PRELOAD.value) -> None:
+        self.game = game
+        # Loaders run on the preloading thread, so they must not touch any shared state.
+        self.loaders = loaders
+        # Turn what the loader has read into the assets of the scene, on the main thread.
+        self.preparers = preparers if preparers is not None else {}
+        self.preload_enabled = preload
+        self.prepared: dict[Game.Stages, Any] = {}
+        self.pending: dict[Game.Stages, Future] = {}
+        # Number of scenes entered without (hits) and with (misses) waiting for their assets.
+        self.hits = 0
+        self.misses = 0
+        self.__executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scene-preload")
+
+    @classmethod
+    def default(cls, game: Optional[Game] = None) -> SceneManager:
+        return cls(game or Game(Game.Stages.BIDDING),
+                   {stage: (lambda stage=stage: stage_view(stage).load()) for stage in Game.Stages},
+                   {stage: (lambda loaded, stage=stage: stage_view(stage).prepare(loaded)) for stage in Game.Stages})
+
+    @property
+    def assets(self) -> Any:
+        """Assets of the current scene."""
+        return self.prepared[self.game.current_stage]
+
+    def preload(self, stage: Game.Stages) -> None:
+        """Start reading assets of the stage in the background, unless they are loaded or loading already."""
+        if stage not in self.prepared and stage not in self.pending:
+            self.pending[stage] = self.__executor.submit(self.loaders[stage])
+
+    def enter(self, stage: Game.Stages) -> Any:
+        """Make the stage current, then start preloading the one that follows it. Main thread only.
+
+        :return: assets of the stage.
+        """
+        future = self.pending.pop(stage, None)
+        if stage in self.prepared:
+            self.hits += 1
+        else:
+            if future is not None and future.done():
+                self.hits += 1
+            else:
+                # loading hitch - preloading hasn't finished (it's waited for) or hasn't been started at all.
+                self.misses += 1
+            loaded = future.result() if future is not None else self.loaders[stage]()
+            prepare = self.preparers.get(stage)
+            self.prepared[stage] = prepare(loaded) if prepare is not None else loaded
+
+        self.game.current_stage = stage
+        if self.preload_enabled and (next_stage := self.game.next_stage()) is not None:
+            self.preload(next_stage)
+        return self.prepared[stage]
+
+    def advance(self) -> Optional[Any]:
+        """Move on to the next stage.
+
+        :return: assets of the next stage, None if the current stage was the last one.
+        """
+        next_stage = self.game.next_stage()
+        return self.enter(next_stage) if next_stage is not None else None
+
+    def shutdown(self) -> None:
+        """Stop the preloading thread, assets that are still loading are abandoned."""
+        self.__executor.shutdown(wait=False, cancel_futures=True)
+        self.pending.clear()
@@ -0,0 +1,100 @@
+# -*- encoding: utf-8 -*-
+
+"""
+This module exposes uniform grid spatial index used for mouse hit-testing of sprites.
+
+Each sprite is stored in every cell its rect overlaps, so a pointer event only has to check the few
+sprites in a single cell. Sprites registered in the index get a spatial_index attribute, which they
+use to report their movement.
+"""
+
+from __future__ import annotations
+
+# STD lib imports
+import itertools as it
+from typing import Optional
+
+# External imports
+import pygame
+
+# Internal imports
+import gui.config.defaults as defaults
+from gui.types import Position
+
+
+Cell = tuple[int, int]
+
+
+class SpatialHash:
+    """Uniform grid of interactive sprites, ordered by z-order - layer, then insertion order."""
+
+    def __init__(self, cell_size: int = defaults.HIT_GRID_CELL_SIZE) -> None:
+        self.cell_size = cell_size
+        self.cells: dict[Cell, set[pygame.sprite.Sprite]] = {}
+        self.__rects: dict[pygame.sprite.Sprite, pygame.Rect] = {}
+        self.__z_order: dict[pygame.sprite.Sprite, tuple[int, int]] = {}
+        self.__counter = it.count()
+
+    def __len__(self) -> int:
+        return len(self.__rects)
+
+    def __contains__(self, sprite: pygame.sprite.Sprite) -> bool:
+        return sprite in self.__rects
+
+    def cell_of(self, point: Position) -> Cell:
+        return point[0] // self.cell_size, point[1] // self.cell_size
+
+    def __cells_of(self, rect: pygame.Rect) -> list[Cell]:
+        left, top = self.cell_of(rect.topleft)
+        right, bottom = self.cell_of((rect.right - 1, rect.bottom - 1))
+        return [(x, y) for x in range(left, right + 1) for y in range(top, bottom + 1)]
+
+    def __bucket(self, sprite: pygame.sprite.Sprite, rect: pygame.Rect) -> None:
+        self.__rects[sprite] = rect
+        for cell in self.__cells_of(rect):
+            self.cells.setdefault(cell, set()).add(sprite)
+
+    def __unbucket(self, sprite: pygame.sprite.Sprite) -> None:
+        for cell in self.__cells_of(self.__rects.pop(sprite)):
+            bucket = self.cells[cell]
+            bucket.discard(sprite)
+            if not bucket:
+                del self.cells[cell]
+
+    def insert(self, sprite: pygame.sprite.Sprite, layer: int = 0) -> None:
+        """Register the sprite, sprites inserted later are above the earlier ones on the same layer."""
+        if sprite in self.__rects:
+            self.remove(sprite)
+        self.__z_order[sprite] = layer, next(self.__counter)
+        self.__bucket(sprite, sprite.rect.copy())
+        sprite.spatial_index = self
+
+    def remove(self, sprite: pygame.sprite.Sprite) -> None:
+        if sprite in self.__rects:
+            self.__unbucket(sprite)
+            del self.__z_order[sprite]
+            sprite.spatial_index = None
+
+    def update(self, sprite: pygame.sprite.Sprite) -> None:
+        """Move the sprite to the cells of its current rect, if it has changed."""
+        rect = self.__rects.get(sprite)
+        if rect is not None and rect != sprite.rect:
+            self.__unbucket(sprite)
+            self.__bucket(sprite, sprite.rect.copy())
+
+    def set_layer(self, sprite: pygame.sprite.Sprite, layer: int) -> None:
+        if sprite in self.__z_order and self.__z_order[sprite][0] != layer:
+            self.__z_order[sprite] = layer, next(self.__counter)
+
+    def at(self, point: Position) -> list[pygame.sprite.Sprite]:
+        """All sprites under the point, topmost first."""
+        candidates = self.cells.get(self.cell_of(point), ())
+        hits = [sprite for sprite in candidates if sprite.rect.collidepoint(point)]
+        hits.sort(key=self.__z_order.__getitem__, reverse=True)
+        return hits
+
+    def topmost(self, point: Position) -> Optional[pygame.sprite.Sprite]:
+        """Sprite under the point that is drawn on top, None if there is none."""
+        candidates = self.cells.get(self.cell_of(point), ())
+        return max((sprite for sprite in candidates if sprite.rect.collidepoint(point)),
+                   key=self.__z_order.__getitem__, default=None)
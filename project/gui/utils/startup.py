@@ -0,0 +1,79 @@
+# -*- encoding: utf-8 -*-
+
+"""
+This module exposes startup profiling of the game client.
+
+Client is started in a subprocess that exits right after its first frame has been presented, once plainly
+to measure time to first frame and once under `-X importtime` to break the import time down by module.
+Exit status tells whether time to first frame stays within the budget, which makes it usable as a CI check:
+
+    SDL_VIDEODRIVER=dummy python main.py --startup-profile --startup-budget 1000
+"""
+
+from __future__ import annotations
+
+# STD lib imports
+import os
+import statistics
+import subprocess
+import sys
+from typing import NamedTuple
+
+# Internal imports
+import gui.config.defaults as defaults
+
+
+# Line printed by the client started with --exit-after-first-frame.
+FIRST_FRAME_MARKER = "FIRST FRAME MS"
+
+
+class ImportTime(NamedTuple):
+    """Single entry of -X importtime report, times in microseconds."""
+    module: str
+    self_time: int
+    cumulative: int
+
+
+def parse_import_times(report: str) -> list[ImportTime]:
+    """Entries of -X importtime report (the header and unrelated lines are skipped)."""
+    entries = []
+    for line in report.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_time, cumulative, module = line.removeprefix("import time:").split("|")
+        if not self_time.strip().isdigit():
+            continue  # header
+        entries.append(ImportTime(module.strip(), int(self_time), int(cumulative)))
+    return entries
+
+
+def run_client(script: str, *interpreter_options: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *interpreter_options, script, "--exit-after-first-frame"],
+                          cwd=os.path.dirname(os.path.abspath(script)), capture_output=True, text=True, check=True)
+
+
+def time_to_first_frame(script: str) -> float:
+    """Milliseconds from the start of the script until its first frame has been presented."""
+    for line in run_client(script).stdout.splitlines():
+        if line.startswith(FIRST_FRAME_MARKER):
+            return float(line.removeprefix(FIRST_FRAME_MARKER))
+    raise RuntimeError(f"{script} exited without presenting a frame.")
+
+
+def profile(script: str,
+            budget: float = defaults.Startup.BUDGET.value,
+            runs: int = defaults.Startup.RUNS.value,
+            top: int = defaults.Startup.REPORTED_IMPORTS.value) -> bool:
+    """Print the slowest imports and time to first frame (median of the runs).
+
+    :return: whether time to first frame is within the budget.
+    """
+    imports = parse_import_times(run_client(script, "-X", "importtime").stderr)
+    print(f"{'module':<48}{'self [ms]':>12}{'cumulative [ms]':>18}")
+    for entry in sorted(imports, key=lambda _: _.cumulative, reverse=True)[:top]:
+        print(f"{entry.module:<48}{entry.self_time / 1000:>12.1f}{entry.cumulative / 1000:>18.1f}")
+
+    first_frame = statistics.median(time_to_first_frame(script) for _ in range(runs))
+    within_budget = first_frame <= budget
+    print(f"time to first frame: {first_frame:.1f} ms, budget {budget:.1f} ms - {'OK' if within_budget else 'EXCEEDED'}")
+    return within_budget
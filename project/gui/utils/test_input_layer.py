@@ -0,0 +1,54 @@
+# -*- encoding: utf-8 -*-
+
+import unittest
+from unittest import mock
+
+import pygame
+
+from games.caravan.input import UserInputOptions
+from gui.controls.chat_box import Chat
+from gui.utils.input_layer import InputLayer
+from gui.utils.spatial import SpatialHash
+
+
+class InputLayerTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def setUp(self):
+        self.chat = Chat((0, 0), (200, 100))
+        hit_index = SpatialHash()
+        hit_index.insert(self.chat)
+        self.input_layer = InputLayer(hit_index)
+
+    def poll(self, *events, pending=()):
+        with mock.patch("gui.utils.input_layer.pygame.event.get", return_value=list(events)):
+            return self.input_layer.poll(pending)
+
+    def click(self, button):
+        return (pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=button, pos=(50, 50)),
+                pygame.event.Event(pygame.MOUSEBUTTONUP, button=button, pos=(50, 50)))
+
+    def test_left_click_focuses_the_chat(self):
+        self.poll(*self.click(pygame.BUTTON_LEFT))
+
+        self.assertTrue(self.chat.is_focused)
+
+    def test_wheel_and_right_button_leave_focus_alone(self):
+        for button in (pygame.BUTTON_WHEELUP, pygame.BUTTON_WHEELDOWN, pygame.BUTTON_RIGHT):
+            frame_input = self.poll(*self.click(button))
+
+            self.assertFalse(self.chat.is_focused)
+            self.assertEqual(frame_input.events, 2)
+
+    def test_pending_events_precede_the_queued_ones(self):
+        left, right = (pygame.event.Event(pygame.KEYDOWN, key=key) for key in (pygame.K_LEFT, pygame.K_RIGHT))
+        frame_input = self.poll(right, pending=[left])
+
+        self.assertEqual(frame_input.actions, [UserInputOptions.MOVE_LEFT, UserInputOptions.MOVE_RIGHT])
+        self.assertEqual(frame_input.events, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+# -*- encoding: utf-8 -*-
+
+import math
+import unittest
+
+import pygame
+
+import games.caravan.logic.round as round_logic
+import gui.config.defaults as defaults
+from gui.utils.layout import Layout
+from gui.views.caravan.round import Card
+
+RESOLUTIONS = [(1450, 800), (1920, 1080), (2560, 1440), (3840, 2160), (1024, 768)]
+LOGICAL_POINTS = [(0, 0), (1, 1), (150, 470), (725, 400), (1449, 799), (defaults.WIDTH, defaults.HEIGHT)]
+
+
+class LayoutTestCase(unittest.TestCase):
+    def tearDown(self):
+        Layout.configure((defaults.WIDTH, defaults.HEIGHT))
+
+    def test_logical_points_survive_the_round_trip(self):
+        for resolution in RESOLUTIONS:
+            screen_layout = Layout(resolution)
+            for point in LOGICAL_POINTS:
+                with self.subTest(resolution=resolution, point=point):
+                    x, y = screen_layout.to_logical(screen_layout.to_screen(point))
+                    # scaled down, several logical points share a pixel.
+                    tolerance = 0 if screen_layout.scale >= 1 else math.ceil(1 / screen_layout.scale)
+                    self.assertLessEqual(max(abs(x - point[0]), abs(y - point[1])), tolerance)
+
+    def test_table_is_letterboxed_into_the_screen(self):
+        for resolution in RESOLUTIONS:
+            screen_layout = Layout(resolution)
+            with self.subTest(resolution=resolution):
+                left, top = screen_layout.to_screen((0, 0))
+                right, bottom = screen_layout.to_screen((defaults.WIDTH, defaults.HEIGHT))
+                self.assertTrue(0 <= left and 0 <= top and right <= resolution[0] and bottom <= resolution[1])
+                # table touches both edges along one of the axes.
+                self.assertTrue((left, right) == (0, resolution[0]) or (top, bottom) == (0, resolution[1]))
+
+    def test_native_resolution_is_identity(self):
+        screen_layout = Layout((defaults.WIDTH, defaults.HEIGHT))
+
+        self.assertEqual((screen_layout.scale, screen_layout.offset), (1, (0, 0)))
+        self.assertEqual(screen_layout.rect_to_screen(pygame.Rect(10, 20, 30, 40)), pygame.Rect(10, 20, 30, 40))
+
+    def test_card_rect_is_the_projection_of_its_position(self):
+        pygame.font.init()
+        screen_layout = Layout.configure((2900, 1600))
+        card = Card(round_logic.Card(round_logic.Rank.TWO, round_logic.Suit.SPADES), (100, 50))
+
+        self.assertEqual(card.rect, pygame.Rect((200, 100), (2 * defaults.Card.WIDTH.value,
+                                                             2 * defaults.Card.HEIGHT.value)))
+        card.move_to((300, 200))
+        self.assertEqual(card.rect.topleft, (600, 400))
+        self.assertEqual(screen_layout.to_logical(card.rect.topleft), card.position)
+
+
+if __name__ == '__main__':
+    unittest.main()
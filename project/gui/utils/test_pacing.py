@@ -0,0 +1,74 @@
+# -*- encoding: utf-8 -*-
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import pygame
+
+from gui.utils.pacing import FramePacer
+
+
+class Clock:
+    def __init__(self):
+        self.ticks = []
+
+    def tick(self, framerate=0):
+        self.ticks.append(framerate)
+        return 16
+
+
+class FramePacerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.pacer = FramePacer(self.clock, framerate=60, adaptive=True, idle_timeout=500, active_frames=2)
+        self.wait = mock.patch("gui.utils.pacing.pygame.event.wait",
+                               return_value=pygame.event.Event(pygame.NOEVENT)).start()
+        self.post = mock.patch("gui.utils.pacing.pygame.event.post").start()
+        self.addCleanup(mock.patch.stopall)
+
+    def test_loop_goes_idle_after_quiet_frames_and_busy_frame_wakes_it(self):
+        self.assertEqual(self.pacer.tick(busy=True), 16)
+        self.pacer.tick(busy=False)
+        self.assertFalse(self.pacer.is_idle)
+        self.wait.assert_not_called()
+
+        self.pacer.tick(busy=False)
+        self.assertTrue(self.pacer.is_idle)
+        self.wait.assert_called_once_with(500)
+        self.assertEqual(self.pacer.idle_frames, 1)
+
+        self.assertEqual(self.pacer.tick(busy=True), 16)
+        self.assertFalse(self.pacer.is_idle)
+
+    def test_event_ends_the_idle_wait(self):
+        event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT)
+        self.wait.return_value = event
+        for _ in range(3):
+            self.pacer.tick(busy=False)
+
+        # event is handed over directly, posting it would put it behind the ones queued in the meantime.
+        self.post.assert_not_called()
+        self.assertEqual(self.pacer.pending_events(), [event])
+        self.assertEqual(self.pacer.pending_events(), [])
+        self.assertFalse(self.pacer.is_idle)
+        self.assertGreater(self.pacer.woken_at, 0)
+
+    def test_settings_are_read_from_the_config_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "config.json")
+            with open(path, "w") as config_file:
+                json.dump({"frame_pacing": {"idle_timeout": 100, "adaptive": False}}, config_file)
+            pacer = FramePacer.from_config(path, self.clock)
+
+        self.assertEqual((pacer.idle_timeout, pacer.adaptive), (100, False))
+        self.assertEqual(pacer.active_frames, FramePacer().active_frames)
+        for _ in range(50):
+            pacer.tick(busy=False)
+        self.assertFalse(pacer.is_idle)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+# -*- encoding: utf-8 -*-
+
+import unittest
+from unittest import mock
+
+from gui.utils.profiler import FrameProfiler
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FrameProfilerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        patcher = mock.patch("gui.utils.profiler.time.perf_counter", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.profiler = FrameProfiler(capacity=3, enabled=True)
+
+    def frame(self, seconds, queued_at=None):
+        self.profiler.begin_frame()
+        if queued_at is not None:
+            self.profiler.input_received(queued_at)
+        self.clock.now += seconds
+        self.profiler.mark(FrameProfiler.Phase.BLIT)
+        self.profiler.end_frame()
+
+    def test_ring_buffer_keeps_the_last_frames_in_order(self):
+        for seconds in (1, 2, 3, 4, 5):
+            self.frame(seconds)
+
+        self.assertEqual(self.profiler.size, 3)
+        self.assertEqual(self.profiler.frame_times(), [3, 4, 5])
+
+    def test_latency_is_measured_from_the_time_input_was_queued(self):
+        self.clock.now = 10.0
+        self.frame(0.5, queued_at=9.0)
+        self.frame(0.5)
+
+        self.assertEqual(self.profiler.summary()["LATENCY"], (1500.0, 1500.0, 1500.0))
+
+    def test_disabled_profiler_records_nothing(self):
+        self.profiler.enabled = False
+        self.frame(1)
+
+        self.assertEqual(self.profiler.frame_times(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
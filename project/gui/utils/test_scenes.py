@@ -0,0 +1,56 @@
+# -*- encoding: utf-8 -*-
+
+import threading
+import unittest
+
+from games.caravan.game import Game
+from gui.utils.scenes import SceneManager
+
+
+class SceneManagerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.loads = []
+        self.threads = {}
+        self.scenes = SceneManager(Game(Game.Stages.BIDDING), {
+            stage: (lambda stage=stage: self.loaded(stage, "load") or stage.name) for stage in Game.Stages
+        }, {
+            stage: (lambda name, stage=stage: self.loaded(stage, "prepare") or name.lower()) for stage in Game.Stages
+        })
+
+    def tearDown(self):
+        self.scenes.shutdown()
+
+    def loaded(self, stage, step):
+        self.loads.append(stage)
+        self.threads[stage, step] = threading.current_thread()
+
+    def test_next_stage_is_preloaded(self):
+        self.scenes.enter(Game.Stages.BIDDING)
+        self.scenes.pending[Game.Stages.DECK_ASSEMBLY].result()
+
+        self.assertEqual(self.scenes.advance(), "deck_assembly")
+        self.assertIs(self.scenes.game.current_stage, Game.Stages.DECK_ASSEMBLY)
+        self.assertEqual((self.scenes.hits, self.scenes.misses), (1, 1))
+
+    def test_only_loader_runs_in_the_background(self):
+        self.scenes.enter(Game.Stages.BIDDING)
+        self.scenes.pending[Game.Stages.DECK_ASSEMBLY].result()
+        self.assertNotIn((Game.Stages.DECK_ASSEMBLY, "prepare"), self.threads)
+
+        self.scenes.advance()
+        self.assertIsNot(self.threads[Game.Stages.DECK_ASSEMBLY, "load"], threading.main_thread())
+        self.assertIs(self.threads[Game.Stages.DECK_ASSEMBLY, "prepare"], threading.main_thread())
+
+    def test_entered_scene_is_not_reloaded(self):
+        for stage in Game.Stages:
+            self.scenes.enter(stage)
+        self.scenes.enter(Game.Stages.ROUND)
+
+        self.assertEqual(self.loads.count(Game.Stages.ROUND), 2)
+        self.assertEqual(self.scenes.assets, "round")
+        self.assertEqual(self.scenes.advance(), "summary")
+        self.assertIsNone(self.scenes.advance())
+
+
+if __name__ == '__main__':
+    unittest.main()
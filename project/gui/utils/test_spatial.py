@@ -0,0 +1,58 @@
+# -*- encoding: utf-8 -*-
+
+import unittest
+
+import pygame
+
+from gui.utils.spatial import SpatialHash
+
+
+class Box(pygame.sprite.Sprite):
+    def __init__(self, x, y, width=50, height=50):
+        super().__init__()
+        self.rect = pygame.Rect(x, y, width, height)
+
+
+class SpatialHashTestCase(unittest.TestCase):
+    def setUp(self):
+        self.index = SpatialHash(cell_size=64)
+
+    def test_topmost_respects_layers_and_insertion_order(self):
+        bottom, middle, top = Box(0, 0), Box(10, 10), Box(20, 20)
+        self.index.insert(top, layer=1)
+        self.index.insert(bottom)
+        self.index.insert(middle)
+
+        self.assertIs(self.index.topmost((30, 30)), top)
+        self.assertEqual(self.index.at((30, 30)), [top, middle, bottom])
+        self.assertIs(self.index.topmost((5, 5)), bottom)
+        self.assertIsNone(self.index.topmost((500, 500)))
+
+    def test_sprite_spanning_many_cells(self):
+        wide = Box(0, 0, 300, 10)
+        self.index.insert(wide)
+
+        self.assertIs(self.index.topmost((250, 5)), wide)
+
+    def test_update_after_move(self):
+        box = Box(0, 0)
+        self.index.insert(box)
+        box.rect.topleft = (200, 200)
+        self.index.update(box)
+
+        self.assertIsNone(self.index.topmost((10, 10)))
+        self.assertIs(self.index.topmost((210, 210)), box)
+        self.assertEqual(set(self.index.cells), {(3, 3)})
+
+    def test_remove(self):
+        box = Box(0, 0)
+        self.index.insert(box)
+        self.index.remove(box)
+
+        self.assertNotIn(box, self.index)
+        self.assertIsNone(self.index.topmost((10, 10)))
+        self.assertEqual(self.index.cells, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
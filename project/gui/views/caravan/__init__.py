@@ -1,15 +1,14 @@
-#!/usr/bin/python
-# -*- coding: utf-8 -*-
+# -*- encoding: utf-8 -*-
 
-import argparse
+"""
+Views of the caravan game stages.
 
+Views are imported on first access (gui.views.caravan.round etc.), so that the stages that are not
+on screen yet don't add to the startup time.
+"""
 
-def main():
-    parser = argparse.ArgumentParser()
-    parser.add_argument("some_arg", help="Template for casual python script")
-    args = parser.parse_args()
-    print("Hello World!")
+# Internal imports
+from gui.utils.lazy import lazy_submodules
 
 
-if __name__ == "__main__":
-    main()
+__getattr__ = lazy_submodules(__name__, {"bidding", "deck_assembly", "round", "summary"})
@@ -5,9 +5,25 @@
 This module exposes gameloop bidding game stage view.
 """
 
+from __future__ import annotations
+
+# External imports
 import pygame.sprite as sprite
 
+# Internal imports
+import gui.config.defaults as defaults
 import gui.controls as controls
+import gui.utils.layout as layout
+from gui.controls.fonts import Font
+
+
+def load() -> None:
+    """Stage has no files of its own to read in the background."""
+
+
+def prepare(_: None) -> list[Font]:
+    """Load assets of the stage, main thread only."""
+    return [Font.shared(defaults.FONT_PATH, layout.Layout.current().font_size())]
 
 
 class BaseView:
@@ -1,14 +1,106 @@
 # -*- encoding: utf-8 -*-
 
-import argparse
+"""
+This module exposes gameloop deck assembly game stage view.
 
+Available cards are displayed in a horizontally scrolling carousel. Sprites exist only for the visible
+window and a small margin on both sides of it - card with index i is always displayed by the sprite i mod
+pool size, so when the window moves only the sprites that have left it get a new card. Selection and the
+picked cards are displayed with the atlas areas of card states, so frame time doesn't depend on the number
+of available cards.
+"""
 
-def main():
-    parser = argparse.ArgumentParser()
-    parser.add_argument("some_arg", help="Template for casual python script")
-    args = parser.parse_args()
-    print("Hello World!")
+from __future__ import annotations
 
+# STD lib imports
+from typing import Optional
 
-if __name__ == "__main__":
-    main()
+# External imports
+import pygame.sprite
+from pygame.surface import Surface
+
+# Internal imports
+import games.caravan.logic.deck_assembly as deck_assembly_logic
+import gui.config.defaults as defaults
+import gui.views.caravan.round as round_view
+from gui.types import Position
+
+
+class Carousel(round_view.IView):
+    """Carousel of the cards available for the deck.
+
+    Selected card is raised, cards picked into the deck are displayed in the CORRECT state.
+    """
+
+    def __init__(self,
+                 composition: deck_assembly_logic.DeckComposition,
+                 position: Position,
+                 visible_count: int = defaults.Carousel.VISIBLE_CARDS.value,
+                 margin: int = defaults.Carousel.MARGIN.value,
+                 spacing: int = defaults.Carousel.SPACING.value,
+                 sprites: Optional[pygame.sprite.LayeredDirty] = None) -> None:
+        self.composition = composition
+        self.x, self.y = position
+        self.visible_count = min(visible_count, len(composition.available_cards))
+        self.margin = margin
+        self.spacing = spacing
+        self.sprites = sprites if sprites is not None else pygame.sprite.LayeredDirty()
+        self.first_visible = 0
+
+        pool_size = min(len(composition.available_cards), self.visible_count + 2 * margin)
+        self.pool = [round_view.Card(card, position) for card in composition.available_cards[:pool_size]]
+        # Index of the available card each sprite of the pool displays.
+        self.bound = list(range(pool_size))
+        for sprite in self.pool:
+            self.sprites.add(sprite)
+        self.refresh()
+
+    def window(self) -> range:
+        """Indices of the available cards that have a sprite, visible ones along with the margin."""
+        card_count = len(self.composition.available_cards)
+        return range(max(0, self.first_visible - self.margin),
+                     min(card_count, self.first_visible + self.visible_count + self.margin))
+
+    def refresh(self) -> None:
+        """Center the window on the selection and bring the sprites in line with the composition.
+
+        Only the sprites whose card, position or state has changed are marked as dirty.
+        """
+        if not self.pool:
+            return
+        cards = self.composition.available_cards
+        selection = self.composition.selection_position
+        self.first_visible = min(max(0, selection - self.visible_count // 2), len(cards) - self.visible_count)
+
+        window = self.window()
+        for index in window:
+            slot = index % len(self.pool)
+            sprite = self.pool[slot]
+            if self.bound[slot] != index:
+                # recycled sprite, its atlas area is updated below.
+                self.bound[slot] = index
+                sprite.card = cards[index]
+            lift = defaults.Carousel.SELECTION_LIFT.value if index == selection else 0
+            sprite.move_to((self.x + (index - self.first_visible) * self.spacing, self.y - lift))
+            sprite.update(round_view.Card.State.CORRECT
+                          if self.composition.SELECT_CARDs[index] else round_view.Card.State.DEFAULT)
+            visible = int(self.first_visible <= index < self.first_visible + self.visible_count)
+            if sprite.visible != visible:
+                sprite.visible = visible
+        # window clipped at an edge leaves some sprites without a card, they still show the one they had.
+        for sprite, index in zip(self.pool, self.bound):
+            if index not in window and sprite.visible:
+                sprite.visible = 0
+
+    def draw(self, surface: Surface) -> list[pygame.rect.Rect]:
+        """Draws the carousel to the surface.
+
+        :return: list of areas of the surface that have changed.
+        """
+        self.refresh()
+        return self.sprites.draw(surface)
+
+
+# stage displays the same cards and text as the round.
+load = round_view.load
+prepare = round_view.prepare
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import collections
 from abc import ABC, abstractmethod
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 from typing import Optional
 import random
 
@@ -18,9 +18,16 @@ from pygame.surface import Surface
 
 # Internal imports
 import games.caravan.logic.round as round_logic
+import games.caravan.logic.snapshot as snapshots
+import gui.animation as animation
+import gui.assets.cache as asset_cache
+import gui.assets.renderer as renderer
 import gui.config.defaults as defaults
 import gui.controls as controls
+import gui.utils.layout as layout
+import gui.utils.spatial as spatial
 import interfaces as general_interfaces
+from gui.controls.fonts import Font
 from gui.types import Position, RGB
 
 
@@ -37,13 +44,15 @@ class IView(ABC):
         pass
 
 
-class CardColorScheme(general_interfaces.IDefault):
+class CardColorScheme(general_interfaces.IDefault, general_interfaces.IObservable):
     """Struct that contains Card color scheme information.
 
     Scheme consist of 3 sets of color values which correspond to the card's 3 states:
         - select  - used to signal that card CAN be placed in its current location.
         - pressed - used to signal that card CANNOT be places in its current location.
         - default - used in all other cases.
+
+    Observers are notified whenever any of the colors changes.
     """
 
     def __init__(self,
@@ -51,6 +60,7 @@ class CardColorScheme(general_interfaces.IDefault):
                  default_color: RGB,
                  correct_color: RGB,
                  incorrect_color: RGB) -> None:
+        self._observers: list[general_interfaces.IObserver] = []
         self.background = background
         self.default_color = default_color
         self.correct_placement = correct_color
@@ -65,8 +75,120 @@ class CardColorScheme(general_interfaces.IDefault):
             defaults.Card.INCORRECT_PLACEMENT_COLOR.value
         )
 
+    def __setattr__(self, name, value) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self.notify()
+
+    # Interface implementations
+    # region IObservable
+    def attach(self, observer: general_interfaces.IObserver) -> None:
+        self._observers.append(observer)
+
+    def detach(self, observer: general_interfaces.IObserver) -> None:
+        self._observers.remove(observer)
+
+    def notify(self, event: Optional[CardColorScheme] = None) -> None:
+        """Broadcast the change to all observers, the payload is the scheme itself unless given."""
+        for observer in self._observers:
+            observer.update(self if event is None else event)
+    # endregion
+
+
+class CardSurfaceCache(general_interfaces.IObserver):
+    """Card atlas of a color scheme and the areas of individual cards within it.
+
+    All card faces, the card back and each of the Card.State borders are packed into a single converted
+    surface - baked one if available, otherwise rendered in memory once. Sprites display their area
+    of the atlas, so drawing a card boils down to a single blit from the shared surface.
+    Each cache is bound to one color scheme and gets cleared whenever that scheme changes.
+    """
+
+    # Caches shared between all the sprites that use the same color scheme.
+    __instances: dict[CardColorScheme, CardSurfaceCache] = {}
+    __default_scheme: Optional[CardColorScheme] = None
+
+    def __init__(self, color_scheme: CardColorScheme) -> None:
+        self.color_scheme = color_scheme
+        self.atlases: dict[tuple[int, int], Surface] = {}
+        self.areas: dict[tuple, pygame.Rect] = {}
+        self.surfaces: dict[tuple, Surface] = {}
+        self.color_scheme.attach(self)
 
-class Card(pygame.sprite.Sprite):
+    @classmethod
+    def for_scheme(cls, color_scheme: Optional[CardColorScheme] = None) -> CardSurfaceCache:
+        """Return cache shared by all cards that use given color scheme (shared default scheme if None)."""
+        if color_scheme is None:
+            if cls.__default_scheme is None:
+                cls.__default_scheme = CardColorScheme.default()
+            color_scheme = cls.__default_scheme
+        if color_scheme not in cls.__instances:
+            cls.__instances[color_scheme] = cls(color_scheme)
+        return cls.__instances[color_scheme]
+
+    @staticmethod
+    def key(card: round_logic.Card, state: Card.State, hidden: bool, size: tuple[int, int]) -> tuple:
+        # round_logic.Card defines __eq__ without __hash__, so it can't be used as a key directly.
+        return card.rank, card.suit, state, hidden, size
+
+    @staticmethod
+    def atlas_border_colors(color_scheme: CardColorScheme) -> tuple[RGB, ...]:
+        """Border colors of the card atlas rows, one for each Card.State in order of definition."""
+        return color_scheme.default_color, color_scheme.correct_placement, color_scheme.incorrect_placement
+
+    def atlas(self, size: tuple[int, int] = (CARD_WIDTH, CARD_HEIGHT)) -> Surface:
+        """Atlas of cards of the on-screen size, baked one for the size if available."""
+        try:
+            return self.atlases[size]
+        except KeyError:
+            atlas = asset_cache.load_card_atlas(
+                self.atlas_border_colors(self.color_scheme), self.color_scheme.background, size)
+            self.atlases[size] = atlas
+            return atlas
+
+    def area(self,
+             card: round_logic.Card,
+             state: Card.State,
+             hidden: bool,
+             size: tuple[int, int] = (CARD_WIDTH, CARD_HEIGHT)) -> pygame.Rect:
+        """Area of the atlas with the card, the same Rect object is returned for the same arguments."""
+        key = self.key(card, state, hidden, size)
+        try:
+            return self.areas[key]
+        except KeyError:
+            face_index = renderer.CARD_BACK_INDEX if hidden else renderer.CARD_FACE_INDICES[card.rank, card.suit]
+            area = renderer.card_atlas_rect(face_index, list(Card.State).index(state), size)
+            self.areas[key] = area
+            return area
+
+    def get(self,
+            card: round_logic.Card,
+            state: Card.State,
+            hidden: bool,
+            size: tuple[int, int] = (CARD_WIDTH, CARD_HEIGHT)) -> Surface:
+        """Return the card as a standalone surface - subsurface of the atlas."""
+        key = self.key(card, state, hidden, size)
+        try:
+            return self.surfaces[key]
+        except KeyError:
+            surface = self.atlas(size).subsurface(self.area(card, state, hidden, size))
+            self.surfaces[key] = surface
+            return surface
+
+    def invalidate(self) -> None:
+        """Drop the atlases along with everything cut out of them."""
+        self.atlases.clear()
+        self.areas.clear()
+        self.surfaces.clear()
+
+    # Interface implementations
+    # region IObserver
+    def update(self, event: CardColorScheme) -> None:
+        self.invalidate()
+    # endregion
+
+
+class Card(pygame.sprite.DirtySprite):
     """Card sprite.
 
     Cards should have the following states:
@@ -78,6 +200,8 @@ class Card(pygame.sprite.Sprite):
     Cards should be movable across the table.
     Cards should have animations of being moved.
     Cards should be selectable.
+
+    Position and size of the card are logical (see gui.utils.layout), rect is their projection on the screen.
     """
 
     class State(Enum):
@@ -95,67 +219,50 @@ class Card(pygame.sprite.Sprite):
         super().__init__()
         self.card = card
         self.hidden = hidden
-        self.__color_scheme = color_scheme or CardColorScheme.default()
-        self.__current_color = self.__color_scheme.correct_placement
-        self.__font_object = controls.fonts.Font.default()
+        self.state = Card.State.DEFAULT
+        self.spatial_index: Optional[spatial.SpatialHash] = None
+        self.__surface_cache = CardSurfaceCache.for_scheme(color_scheme)
+        self.__layout = layout.Layout.current()
+        self.position: Position = tuple(position)
         # sprite implementation
-        self.image = pygame.surface.Surface((width, height), pygame.SRCALPHA)
-        self.rect = pygame.rect.Rect(position, (width, height))
+        self.rect = pygame.rect.Rect(self.__layout.to_screen(position), self.__layout.size_to_screen((width, height)))
+        self.image = self.__surface_cache.atlas(self.rect.size)
+        self.source_rect = self.__surface_cache.area(self.card, self.state, self.hidden, self.rect.size)
 
     def update(self, state: Card.State = State.DEFAULT) -> None:
-        # region border
-        match state:
-            case Card.State.DEFAULT:
-                self.__current_color = self.__color_scheme.default_color
-            case Card.State.CORRECT:
-                self.__current_color = self.__color_scheme.correct_placement
-            case Card.State.INCORRECT:
-                self.__current_color = self.__color_scheme.incorrect_placement
-
-        pygame.draw.rect(
-            self.image,
-            self.__current_color,
-            self.image.get_rect(),
-            border_radius=defaults.Card.RECT_BORDER_RADIUS.value)
-        pygame.draw.rect(
-            self.image,
-            self.__color_scheme.background,
-            self.image.get_rect().inflate(-defaults.Card.BORDER_THICKNESS.value, -defaults.Card.BORDER_THICKNESS.value),
-            border_radius=defaults.Card.RECT_BORDER_RADIUS.value)
-        # endregion border
-
-        # region text
-        if not self.hidden:
-            # upper left corner
-            text = self.__font_object.render(
-                str(self.card),
-                defaults.USE_AA,
-                self.__current_color,
-                self.__color_scheme.background
-            )
-            self.image.blit(
-                text,
-                self.image.get_rect().move(defaults.Card.TEXT_X_MARGIN.value, defaults.Card.TEXT_Y_MARGIN.value)
-            )
-            # upper right corner
-            rotated = pygame.transform.flip(text, True, True)
-            rect = self.image.get_rect()
-            rect.move_ip(
-                defaults.Card.WIDTH.value - defaults.Card.TEXT_X_MARGIN.value - rotated.get_width(),
-                defaults.Card.HEIGHT.value - defaults.Card.TEXT_Y_MARGIN.value - rotated.get_height()
-            )
-            self.image.blit(
-                rotated,
-                rect
-            )
-        # endregion
+        """Display the area of the atlas matching the state, mark sprite dirty if it changed."""
+        self.state = state
+        self.show(self.__surface_cache.atlas(self.rect.size),
+                  self.__surface_cache.area(self.card, self.state, self.hidden, self.rect.size))
+
+    def show(self, image: Surface, area: Optional[pygame.Rect] = None) -> None:
+        """Display the area of the image (whole image if area is None), mark sprite dirty if it changed."""
+        if image is not self.image or area is not self.source_rect:
+            self.image = image
+            self.source_rect = area
+            self.dirty = 1
+
+    def cached_image(self) -> Surface:
+        """Image of the card in its current state and side, as stored in the surface cache."""
+        return self.__surface_cache.get(self.card, self.state, self.hidden, self.rect.size)
+
+    def move_to(self, position: Position) -> None:
+        """Place the card at the logical position, mark sprite dirty if it has actually moved."""
+        position = tuple(position)
+        if self.position != position:
+            self.position = position
+            self.rect.topleft = self.__layout.to_screen(position)
+            self.dirty = 1
+            if self.spatial_index is not None:
+                self.spatial_index.update(self)
 
     # CODE STRUCTURE: this should be used as Event handler!
     def move(self, dx, dy):
-        self.rect.move_ip(dx, dy)
+        self.move_to((self.position[0] + dx, self.position[1] + dy))
 
 
-class Hand(IView):
+class Hand:
+    """Sprites of the cards in a hand, they are drawn by the LayeredDirty group of the Round."""
 
     WIDTH = 250
     HEIGHT = defaults.Card.HEIGHT.value
@@ -163,24 +270,47 @@ class Hand(IView):
     def __init__(self, position: Position, hand_obj_ref: round_logic.Hand, hidden: bool = False) -> None:
         self.hand_obj_ref = hand_obj_ref
 
-        card_count = len(self.hand_obj_ref.sequence) or 1
-
         # URGENT: REMOVE DEBUG
         self.hidden = hidden
         self.rect = pygame.rect.Rect(*position, Hand.WIDTH, Hand.HEIGHT)
+        self.card_positions: list[Position] = []
+        self.cards = [Card(card, position, hidden=self.hidden) for card in self.hand_obj_ref.sequence]
+        self.layout()
+
+    def layout(self, animator: Optional[animation.Animator] = None) -> None:
+        """Spread the cards evenly across the hand, only the sprites that change position become dirty.
+
+        Cards slide to their new positions if animator is given.
+        """
+        card_count = len(self.cards) or 1
         card_corner_offset = Hand.WIDTH // card_count
-        self.card_positions = [(i * card_corner_offset + position[0],  position[1])
+        self.card_positions = [(i * card_corner_offset + self.rect.x,  self.rect.y)
                                for i in range(card_count)]
-        self.cards = [Card(card, position, hidden=self.hidden) for position, card
-                  in zip(self.card_positions, self.hand_obj_ref.sequence)]
+        for position, card in zip(self.card_positions, self.cards):
+            if animator is not None:
+                animator.move(card, position)
+            else:
+                card.move_to(position)
+
+    def insert_card(self, card: round_logic.Card, index: int, animator: Optional[animation.Animator] = None) -> Card:
+        """Create sprite for the card at specified index of the hand and return it."""
+        card_sprite = Card(card, self.rect.topleft, hidden=self.hidden)
+        self.cards.insert(index, card_sprite)
+        self.layout(animator)
+        return card_sprite
+
+    def remove_card(self, index: int, animator: Optional[animation.Animator] = None) -> Card:
+        """Remove sprite with specified index from the hand and return it."""
+        card_sprite = self.cards.pop(index)
+        self.layout(animator)
+        return card_sprite
 
     def render_selection(self) -> None:
         pass
 
-    def draw(self, surface) -> None:
-        for card in self.cards:
-            card.update()
-            surface.blit(card.image, card.rect)
+    def layered_sprites(self) -> list[tuple[Card, int]]:
+        """Card sprites paired with their layer, cards further right are drawn on top."""
+        return [(card, index) for index, card in enumerate(self.cards)]
 
 
 class GrowDirection(Enum):
@@ -189,8 +319,8 @@ class GrowDirection(Enum):
     DOWN = auto()
 
 
-class Caravan(IView):
-    """Caravan view."""
+class Caravan:
+    """Caravan view, its sprites are drawn by the LayeredDirty group of the Round."""
     def __init__(self, position: Position, caravan_ref: round_logic.Caravan, grow_direction: GrowDirection) -> None:
         self.x, self.y = position
         self.caravan_ref = caravan_ref
@@ -207,29 +337,39 @@ class Caravan(IView):
             for applied_card in self.caravan_ref.applied_face_cards[index]:
                 self.apply_card(applied_card, index)
 
-    def append_card(self, card: round_logic.Card) -> None:
+    def append_card(self, card: round_logic.Card) -> Card:
+        """Create sprite for the card on top of the caravan and return it."""
         card_sprite = Card(card, (self.x, self.y + self.y_offset * len(self.cards)))
         self.applied_cards[len(self.cards)] = []
         self.cards.append(card_sprite)
+        return card_sprite
 
-    def apply_card(self, function_card: round_logic.Card, card_index: int) -> None:
+    def apply_card(self, function_card: round_logic.Card, card_index: int) -> Card:
         """Create sprite for specified function_card and assign it to group"""
         number_of_card_applied = len(self.applied_cards[card_index])
         card_sprite = Card(
             function_card, (
                 self.x + (number_of_card_applied + 1) * self.applied_x_offset,
-                self.cards[card_index].rect.y))
+                self.cards[card_index].position[1]))
         self.applied_cards[card_index].append(card_sprite)
+        return card_sprite
+
+    def discard(self) -> list[Card]:
+        """Replace the caravan with a new (empty) one and return all the sprites of the old one."""
+        card_sprites = [card for card, _ in self.layered_sprites()]
+        self.caravan_ref = round_logic.Caravan.default()
+        self.applied_cards = {}
+        self.cards = []
+        return card_sprites
 
-    def draw(self, surface: Surface) -> None:
-        for index, card in enumerate(self.cards):
-            card.update()  # is this necessary?
-            surface.blit(card.image, card.rect)
-            for applied_card in self.applied_cards[index]:
-                applied_card.update()  # is this necessary?
-                surface.blit(applied_card.image, applied_card.rect)
+    def layered_sprites(self) -> list[tuple[Card, int]]:
+        """Card sprites paired with their layer, each card is drawn over the cards applied to the previous one."""
+        return [(sprite, 2 * index + int(sprite is not card))
+                for index, card in enumerate(self.cards)
+                for sprite in (card, *self.applied_cards[index])]
 
 
+EXIT_PROMPT = "EXIT THE GAME?  ENTER - YES  ESC - NO"
 X_OFFSET = 150
 Y_OFFSET = 30
 APPLIED_X_OFFSET = 40
@@ -237,7 +377,27 @@ TOP_DRAW_POINTS = [(255 + (85 + X_OFFSET) * i, 200) for i in range(3)]
 BOTTOM_DRAW_POINTS = [(150 + (85 + X_OFFSET) * i, 470) for i in range(3)]
 
 
-class Round(IView):
+class Round(IView, general_interfaces.IObserver):
+    """Round view.
+
+    All card sprites live in a single LayeredDirty group, so that only the areas that have changed since
+    the previous frame get redrawn. Group can be shared with other sprites (eg. buttons) to make it into
+    a complete render pipeline of the screen.
+
+    View is built from the round manager, afterwards it only reads snapshots published by the logic thread
+    and applies each RoundDelta only to the affected hand or caravan.
+    """
+
+    class Layer(IntEnum):
+        """Drawing layers of the round's sprites.
+
+        Hands and caravans occupy layers starting from TABLE depending on the card's position.
+        """
+        TABLE     = 0
+        SELECTION = 100
+        PICKED    = 101
+        PROMPT    = 102
+
     DRAW_POINTS = [
         (200, 300 - CARD_HEIGHT), (400, 300 - CARD_HEIGHT), (600, 300 - CARD_HEIGHT),
         (150, 380), (350, 380), (550, 380),
@@ -257,61 +417,226 @@ class Round(IView):
     def caravan(self, surface: pygame.surface.Surface, caravan: round_logic.Caravan.Position) -> None:
         pass
 
-    def __init__(self, round_manager: Optional[round_logic.RoundManager] = None) -> None:
+    def __init__(self,
+                 round_manager: Optional[round_logic.RoundManager] = None,
+                 sprites: Optional[pygame.sprite.LayeredDirty] = None,
+                 hit_index: Optional[spatial.SpatialHash] = None) -> None:
+        self.round_manager = round_manager or round_logic.RoundManager.default()
         self.hands = [Hand(position, hand, hidden=(index == 0)) for position, (index, hand)
-                      in zip(Round.HAND_POSITIONS, enumerate(round_manager.hands()))]
+                      in zip(Round.HAND_POSITIONS, enumerate(self.round_manager.hands()))]
         self.caravans = [Caravan(position, caravan, GrowDirection.DOWN if index > 2 else GrowDirection.UP) for position,
-                         (index, caravan) in zip(Round.CARAVAN_POSITIONS, enumerate(round_manager.caravans()))]
-        self.round_manager = round_manager or round_logic.RoundManager.default()
-
-    def draw(self, surface) -> None:
-        """Draws current state of the game to the screen."""
-
-        for hand in self.hands:
-            hand.draw(surface)
-        for caravan in self.caravans:
-            caravan.draw(surface)
-
-        match self.round_manager.state:
+                         (index, caravan) in zip(Round.CARAVAN_POSITIONS, enumerate(self.round_manager.caravans()))]
+
+        self.sprites = sprites if sprites is not None else pygame.sprite.LayeredDirty()
+        # Table cards are registered for hit-testing, overlays are not interactive.
+        self.hit_index = hit_index if hit_index is not None else spatial.SpatialHash()
+        for view in (*self.hands, *self.caravans):
+            self._sync_sprites(view)
+        # Highlighted copy of the selected hand card and the card that is being placed.
+        self.selection_sprite: Optional[Card] = None
+        self.picked_sprite: Optional[Card] = None
+        # Displayed while the round waits for the player to confirm exiting the game.
+        self.exit_prompt: Optional[pygame.sprite.DirtySprite] = None
+        self.animator = animation.Animator()
+        # Latest snapshot read and index of the last delta applied from it.
+        self.snapshot: Optional[snapshots.RoundSnapshot] = None
+        self.applied_delta = -1
+
+    def hand_view(self, player: round_logic.Player.Position) -> Hand:
+        return self.hands[0 if player is round_logic.Player.Position.TOP else 1]
+
+    def caravan_view(self, player: round_logic.Player.Position, caravan: round_logic.Caravan.Position) -> Caravan:
+        shift = 0 if player is round_logic.Player.Position.TOP else 3
+        index = {
+            round_logic.Caravan.Position.LEFT: 0,
+            round_logic.Caravan.Position.MIDDLE: 1,
+            round_logic.Caravan.Position.RIGHT: 2
+        }[caravan]
+        return self.caravans[index + shift]
+
+    def _sync_sprites(self, view: Hand | Caravan) -> None:
+        """Add new sprites of the view to the group and move the existing ones to their current layers."""
+        for sprite, layer in view.layered_sprites():
+            if not self.sprites.has(sprite):
+                self.sprites.add(sprite, layer=Round.Layer.TABLE + layer)
+                self.hit_index.insert(sprite, Round.Layer.TABLE + layer)
+            elif self.sprites.get_layer_of_sprite(sprite) != Round.Layer.TABLE + layer:
+                self.sprites.change_layer(sprite, Round.Layer.TABLE + layer)
+                self.hit_index.set_layer(sprite, Round.Layer.TABLE + layer)
+                sprite.dirty = 1
+
+    def _remove_sprite(self, sprite: Card) -> None:
+        """Remove table card from the group, its area gets restored with the background, and from hit-testing."""
+        sprite.kill()
+        self.hit_index.remove(sprite)
+
+    def _show_overlay(self,
+                      overlay: Optional[Card],
+                      card: round_logic.Card,
+                      position: Position,
+                      state: Card.State,
+                      layer: Round.Layer) -> Card:
+        """Display overlay sprite of the card at the position, recreate the sprite only if card has changed."""
+        if overlay is None or overlay.card is not card:
+            self._hide_overlay(overlay)
+            overlay = Card(card, position)
+            self.sprites.add(overlay, layer=layer)
+        overlay.move_to(position)
+        overlay.update(state)
+        return overlay
+
+    @staticmethod
+    def _hide_overlay(overlay: Optional[pygame.sprite.DirtySprite]) -> None:
+        # removed sprite's area is restored with the background by the group.
+        if overlay is not None:
+            overlay.kill()
+
+    def sync(self, buffer: snapshots.SnapshotBuffer[snapshots.RoundSnapshot]) -> None:
+        """Read the latest snapshot of the round, apply its new deltas and bring overlays in line with it."""
+        snapshot = buffer.read()
+        if snapshot is None or snapshot is self.snapshot:
+            return
+        for index, delta in snapshot.deltas:
+            if index > self.applied_delta:
+                self.update(delta)
+                self.applied_delta = index
+        buffer.acknowledge(self.applied_delta)
+        self.snapshot = snapshot
+        self.refresh_overlays()
+
+    def picked_card_draw_point(self, picked_position: snapshots.PickedCardSnapshot) -> Position:
+        """Project the position of the picked card to the screen."""
+        positions, shift = {
+            round_logic.Player.Position.TOP: (TOP_DRAW_POINTS, 0),
+            round_logic.Player.Position.BOTTOM: (BOTTOM_DRAW_POINTS, 3)
+        }[picked_position.player]
+        index = {
+            round_logic.Caravan.Position.LEFT: 0,
+            round_logic.Caravan.Position.MIDDLE: 1,
+            round_logic.Caravan.Position.RIGHT: 2
+        }[picked_position.caravan]
+        x_pos = positions[index][0]
+        y_pos = positions[index][1]
+        y_pos += self.caravans[index + shift].y_offset * picked_position.card_index
+        if picked_position.location is round_logic.PickedCardPosition.Location.OTHER:
+            x_pos += (picked_position.applied_card_count + 1) * self.caravans[index + shift].applied_x_offset
+        else:
+            y_pos += self.caravans[index + shift].y_offset
+        return x_pos, y_pos
+
+    def _show_exit_prompt(self) -> None:
+        if self.exit_prompt is not None:
+            return
+        screen_layout = layout.Layout.current()
+        font_object = Font.shared(defaults.FONT_PATH, screen_layout.font_size())
+        self.exit_prompt = pygame.sprite.DirtySprite()
+        self.exit_prompt.image = font_object.render_cached(EXIT_PROMPT, defaults.USE_AA,
+                                                           defaults.Button.SELECT_FOREGROUND_COLOR.value,
+                                                           defaults.Colors.BACKGROUND.value)
+        self.exit_prompt.rect = self.exit_prompt.image.get_rect(
+            center=screen_layout.to_screen((defaults.WIDTH // 2, defaults.HEIGHT // 2)))
+        self.sprites.add(self.exit_prompt, layer=Round.Layer.PROMPT)
+
+    def refresh_overlays(self) -> None:
+        """Bring overlay sprites in line with the latest snapshot."""
+        if self.snapshot is None:
+            return
+        if self.snapshot.state is not round_logic.RoundManager.State.CONFIRM_EXIT:
+            self._hide_overlay(self.exit_prompt)
+            self.exit_prompt = None
+        match self.snapshot.state:
             case round_logic.RoundManager.State.SELECT_CARD:
-                index = self.round_manager.hand_selection.index
-                selected_card = self.hands[1].cards[index]
-                selected_card.update(state=Card.State.CORRECT)
-                surface.blit(selected_card.image, selected_card.rect)
+                hand_cards = self.hands[1].cards
+                if hand_cards:
+                    selected_card = hand_cards[self.snapshot.selected_hand_index]
+                    self.selection_sprite = self._show_overlay(
+                        self.selection_sprite, selected_card.card, selected_card.position,
+                        Card.State.CORRECT, Round.Layer.SELECTION)
+                else:
+                    self._hide_overlay(self.selection_sprite)
+                    self.selection_sprite = None
+                self._hide_overlay(self.picked_sprite)
+                self.picked_sprite = None
 
             case round_logic.RoundManager.State.PLACE_CARD:
-                # here we finally need to project data stored in PickedCardPosition to a screen.
-                picked_position = self.round_manager.picked_card_position
-                positions, shift = {
-                    round_logic.Player.Position.TOP: (TOP_DRAW_POINTS, 0),
-                    round_logic.Player.Position.BOTTOM: (BOTTOM_DRAW_POINTS, 3)
-                }[picked_position.player]
-                index = {
-                    round_logic.Caravan.Position.LEFT: 0,
-                    round_logic.Caravan.Position.MIDDLE: 1,
-                    round_logic.Caravan.Position.RIGHT: 2
-                }[picked_position.caravan]
-                caravan = self.round_manager.caravans()[index + shift]
-                x_pos = positions[index][0]
-                y_pos = positions[index][1]
-                y_pos += self.caravans[index + shift].y_offset * picked_position.card_index
-                if picked_position.location is round_logic.PickedCardPosition.Location.OTHER:
-                    applied_card_count = len(caravan.applied_face_cards[picked_position.card_index])
-                    x_pos += (applied_card_count + 1) * self.caravans[index + shift].applied_x_offset
-                else:
-                    y_pos += self.caravans[index + shift].y_offset
-
-                card = self.round_manager.picked_card
-                picked_card = Card(card, (x_pos, y_pos))
-                picked_card.update(Card.State.CORRECT
-                                   if self.round_manager.is_current_picked_card_position_correct()
-                                   else Card.State.INCORRECT)
-                surface.blit(picked_card.image, picked_card.rect)
+                picked = self.snapshot.picked
+                self.picked_sprite = self._show_overlay(
+                    self.picked_sprite, picked.card, self.picked_card_draw_point(picked),
+                    Card.State.CORRECT if picked.is_position_correct else Card.State.INCORRECT,
+                    Round.Layer.PICKED)
+                self._hide_overlay(self.selection_sprite)
+                self.selection_sprite = None
+
             case round_logic.RoundManager.State.DISCARD_CARAVAN:
-                pass
+                self._hide_overlay(self.selection_sprite)
+                self._hide_overlay(self.picked_sprite)
+                self.selection_sprite = self.picked_sprite = None
+
+            case round_logic.RoundManager.State.CONFIRM_EXIT:
+                self._hide_overlay(self.selection_sprite)
+                self._hide_overlay(self.picked_sprite)
+                self.selection_sprite = self.picked_sprite = None
+                self._show_exit_prompt()
+
+    def animate(self, dt: float) -> None:
+        """Advance card animations by dt milliseconds."""
+        self.animator.advance(dt)
+
+    def draw(self, surface) -> list[pygame.rect.Rect]:
+        """Draws current state of the game to the screen.
+
+        :return: list of areas of the surface that have changed.
+        """
+        self.refresh_overlays()
+        return self.sprites.draw(surface)
+
+    def _slide_from_picked_card(self, card_sprite: Card) -> None:
+        """Newly placed card slides from where the picked card was, to its place on the table.
+
+        It keeps the highlight of the picked card for a while after it lands.
+        """
+        if self.picked_sprite is not None:
+            destination = card_sprite.position
+            card_sprite.move_to(self.picked_sprite.position)
+            self.animator.move(card_sprite, destination)
+            self.animator.highlight(card_sprite, self.picked_sprite.state)
+
+    # Interface implementations
+    # region IObserver
+    def update(self, event: round_logic.RoundDelta) -> None:
+        """Apply the round delta to affected hand or caravan view only."""
+        match event.kind:
+            case round_logic.RoundDelta.Kind.HAND_CARD_REMOVED:
+                hand = self.hand_view(event.player)
+                self._remove_sprite(hand.remove_card(event.index, self.animator))
+                self._sync_sprites(hand)
+            case round_logic.RoundDelta.Kind.HAND_CARD_ADDED:
+                hand = self.hand_view(event.player)
+                card_sprite = hand.insert_card(event.card, event.index, self.animator)
+                if not hand.hidden:
+                    # drawn card is revealed to the player.
+                    card_sprite.hidden = True
+                    card_sprite.update(card_sprite.state)
+                    self.animator.flip(card_sprite)
+                self._sync_sprites(hand)
+            case round_logic.RoundDelta.Kind.CARAVAN_CARD_APPENDED:
+                caravan = self.caravan_view(event.player, event.caravan)
+                self._slide_from_picked_card(caravan.append_card(event.card))
+                self._sync_sprites(caravan)
+            case round_logic.RoundDelta.Kind.CARAVAN_CARD_APPLIED:
+                caravan = self.caravan_view(event.player, event.caravan)
+                self._slide_from_picked_card(caravan.apply_card(event.card, event.index))
+                self._sync_sprites(caravan)
+            case round_logic.RoundDelta.Kind.CARAVAN_DISCARDED:
+                caravan = self.caravan_view(event.player, event.caravan)
+                for sprite in caravan.discard():
+                    self._remove_sprite(sprite)
+    # endregion
 
     @classmethod
-    def example(cls) -> Round:
+    def example(cls,
+                sprites: Optional[pygame.sprite.LayeredDirty] = None,
+                hit_index: Optional[spatial.SpatialHash] = None) -> Round:
         rm = round_logic.RoundManager.default()
 
         from games.caravan.logic.round import Rank, Suit
@@ -372,4 +697,23 @@ class Round(IView):
             for fcard in {0: [], 1: [], 2: [], 3: [], 4: []}[index]:
                 rm.table.players[round_logic.Player.Position.TOP].caravans[round_logic.Caravan.Position.RIGHT].apply(fcard, index)
 
-        return cls(rm)
+        return cls(rm, sprites, hit_index)
+
+
+def load() -> tuple[tuple[RGB, ...], RGB, Optional[Surface]]:
+    """Read the baked card atlas of the stage along with its recipe, safe to call from a background thread."""
+    color_scheme = CardColorScheme.default()
+    border_colors = CardSurfaceCache.atlas_border_colors(color_scheme)
+    card_size = layout.Layout.current().size_to_screen((CARD_WIDTH, CARD_HEIGHT))
+    return (border_colors, color_scheme.background,
+            asset_cache.read_card_atlas(border_colors, color_scheme.background, card_size))
+
+
+def prepare(loaded: tuple[tuple[RGB, ...], RGB, Optional[Surface]]) -> tuple[Font, Surface]:
+    """Convert what load() has read and put it into the shared caches, main thread only."""
+    border_colors, background, atlas = loaded
+    screen_layout = layout.Layout.current()
+    card_size = screen_layout.size_to_screen((CARD_WIDTH, CARD_HEIGHT))
+    asset_cache.load_card_atlas(border_colors, background, card_size, atlas)
+    return (Font.shared(defaults.FONT_PATH, screen_layout.font_size()),
+            CardSurfaceCache.for_scheme().atlas(card_size))
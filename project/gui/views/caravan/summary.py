@@ -1 +1,19 @@
 # -*- encoding: utf-8 -*-
+
+"""
+This module exposes gameloop summary game stage view.
+"""
+
+# Internal imports
+import gui.config.defaults as defaults
+import gui.utils.layout as layout
+from gui.controls.fonts import Font
+
+
+def load() -> None:
+    """Stage has no files of its own to read in the background."""
+
+
+def prepare(_: None) -> list[Font]:
+    """Load assets of the stage, main thread only."""
+    return [Font.shared(defaults.FONT_PATH, layout.Layout.current().font_size())]
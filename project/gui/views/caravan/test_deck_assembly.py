@@ -0,0 +1,67 @@
+# -*- encoding: utf-8 -*-
+
+import unittest
+
+import pygame
+
+import games.caravan.logic.round as round_logic
+from games.caravan.logic.deck_assembly import DeckComposition
+from gui.views.caravan.deck_assembly import Carousel
+from gui.views.caravan.round import Card
+
+
+class CarouselTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def setUp(self):
+        self.composition = DeckComposition(round_logic.DEFAULT_DECK * 10)
+        self.carousel = Carousel(self.composition, (0, 300), visible_count=5, margin=2)
+
+    def visible_cards(self):
+        return sorted((sprite.position[0], sprite.card) for sprite in self.carousel.pool if sprite.visible)
+
+    def test_sprites_are_created_for_window_only(self):
+        self.assertEqual(len(self.carousel.sprites), 9)
+        self.assertEqual(len(self.visible_cards()), 5)
+
+    def test_sprites_are_recycled_as_selection_moves(self):
+        pool = list(self.carousel.pool)
+        for _ in range(30):
+            self.composition.move_selection(round_logic.HorizontalDirection.RIGHT)
+            self.carousel.refresh()
+
+        self.assertEqual(self.carousel.pool, pool)
+        selection = self.composition.selection_position
+        expected = self.composition.available_cards[selection - 2:selection + 3]
+        self.assertTrue(all(shown is card for (_, shown), card in zip(self.visible_cards(), expected)))
+
+    def assert_window_is_displayed(self):
+        selection = self.composition.selection_position
+        first = min(max(0, selection - 2), len(self.composition.available_cards) - 5)
+        expected = self.composition.available_cards[first:first + 5]
+        shown = self.visible_cards()
+        self.assertEqual([x for x, _ in shown], [index * self.carousel.spacing for index in range(5)])
+        self.assertTrue(all(card is expected_card for (_, card), expected_card in zip(shown, expected)))
+        self.assertEqual(len(shown), 5)
+
+    def test_only_the_window_is_displayed_after_jumping_to_either_edge(self):
+        last = len(self.composition.available_cards) - 1
+        for position in (last, 0, last, last // 2, 0, 1, last - 1):
+            with self.subTest(position=position):
+                self.composition.selection_position = position
+                self.carousel.refresh()
+                self.assert_window_is_displayed()
+
+    def test_picked_card_is_displayed_as_correct(self):
+        self.composition.add_card()
+        self.carousel.refresh()
+
+        selected, = [sprite for sprite, index in zip(self.carousel.pool, self.carousel.bound)
+                     if index == self.composition.selection_position]
+        self.assertIs(selected.state, Card.State.CORRECT)
+
+
+if __name__ == '__main__':
+    unittest.main()
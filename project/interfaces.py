@@ -5,12 +5,14 @@ from __future__ import annotations
 
 # STD lib imports
 import abc
+from typing import Any
 
 
 class IObserver(abc.ABC):
 
     @abc.abstractmethod
-    def update(self, event: IObservable) -> None:
+    def update(self, event: Any) -> None:
+        """Handle the event of the observable, either its payload or the observable itself."""
         pass
 
 
@@ -28,8 +30,8 @@ class IObservable(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def notify(self):
-        """Notify all observers that an event has occurred."""
+    def notify(self, event: Any = None) -> None:
+        """Notify all observers that an event has occurred, passing them its payload."""
         pass
 
 
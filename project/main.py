@@ -1,7 +1,14 @@
 # -*- encoding: utf-8 -*-
 
+from __future__ import annotations
+
 # region STD lib imports
+import time
+STARTED_AT = time.perf_counter()  # before anything else is imported, start of the time to first frame.
+
+import argparse
 import sys
+from typing import TYPE_CHECKING, Optional
 # endregion
 
 # region External imports
@@ -10,79 +17,174 @@ import pygame
 
 # region Internal imports
 from gui.config import defaults
-import gui.views.caravan.round as views
-import games.caravan.logic.round as logic
-import gui.controls.buttons as buttons
+import gui.utils.layout as layout
+from gui.utils.lazy import lazy_import
+
+# Everything else is imported on first use, once the display is up.
+worker = lazy_import("games.caravan.logic.worker")
+asset_cache = lazy_import("gui.assets.cache")
+starfields = lazy_import("gui.assets.starfield")
+views = lazy_import("gui.views.caravan.round")
+buttons = lazy_import("gui.controls.buttons")
+fonts = lazy_import("gui.controls.fonts")
+input_handling = lazy_import("gui.utils.input_layer")
+pacing = lazy_import("gui.utils.pacing")
+spatial = lazy_import("gui.utils.spatial")
+profiling = lazy_import("gui.utils.profiler")
+scene_management = lazy_import("gui.utils.scenes")
+game = lazy_import("games.caravan.game")
+
+if TYPE_CHECKING:
+    from games.caravan.logic.snapshot import RoundSnapshot, SnapshotBuffer
 # endregion
 
-# region Configuration:
-pygame.init()
-clock = pygame.time.Clock()
 
-WINDOW_SIZE = WIDTH, HEIGHT = defaults.WIDTH, defaults.HEIGHT
-FULL_SCREEN = defaults.FULLSCREEN
-SCREEN = pygame.display.set_mode(WINDOW_SIZE) if not FULL_SCREEN else pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+def init_display() -> pygame.Surface:
+    """Initialise only the subsystems needed to render frames and set the display mode."""
+    pygame.display.init()
+    pygame.font.init()
+    if defaults.FULLSCREEN:
+        screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+    else:
+        screen = pygame.display.set_mode(defaults.WINDOW_SIZE)
+    layout.Layout.configure(screen.get_size())
+    return screen
+
+
+def create_scene(surface: pygame.Surface,
+                 background: pygame.Surface) -> tuple[pygame.sprite.Group,
+                                                      pygame.sprite.LayeredDirty,
+                                                      spatial.SpatialHash,
+                                                      views.Round]:
+    """Create buttons and the round view along with the render pipeline and hit-testing index they share."""
+    screen_layout = layout.Layout.current()
+    font_object = fonts.Font.shared(defaults.FONT_PATH, screen_layout.font_size())
+    button_group: pygame.sprite.Group = pygame.sprite.Group(
+        buttons.Button("START", lambda: print("START"), screen_layout.to_screen((1280, 700)), font_object),
+        buttons.Button("DRAW", lambda: print("DRAW"), screen_layout.to_screen((1080, 700)), font_object),
+        buttons.Button("PLACE", lambda: print("PLACE"), screen_layout.to_screen((880, 700)), font_object)
+    )
 
-card = pygame.surface.Surface((100, 160))
-filled_card = card.fill((230, 153, 0))
-# endregion
+    # Render pipeline - only the areas of sprites that have changed get redrawn and pushed to the display.
+    render_group = pygame.sprite.LayeredDirty(*button_group)
+    render_group.clear(surface, background)
 
+    hit_index = spatial.SpatialHash()
+    for button in button_group:
+        hit_index.insert(button)
 
-def main():
-    """Main game loop."""
+    round_view = views.Round.example(render_group, hit_index)
+    return button_group, render_group, hit_index, round_view
 
-    # Load game assets.
-    BACKGROUND = pygame.image.load(F"gui/assets/background.bmp")
 
-    button_group: pygame.sprite.Group = pygame.sprite.Group(
-        buttons.Button("START", lambda: print("START"), (1280, 700)),
-        buttons.Button("DRAW", lambda: print("DRAW"), (1080, 700)),
-        buttons.Button("PLACE", lambda: print("PLACE"), (880, 700))
-    )
+def update_views(button_group: pygame.sprite.Group,
+                 round_view: views.Round,
+                 snapshots: SnapshotBuffer[RoundSnapshot],
+                 dt: float) -> None:
+    """Bring sprites in line with the latest snapshot of the game and advance animations by dt milliseconds.
 
-    round_manager = logic.RoundManager.default()
-    round_view = views.Round.example()
+    This marks the sprites that have changed as dirty.
+    """
+    button_group.update()
+    round_view.sync(snapshots)
+    round_view.animate(dt)
 
-    while True:
 
-        # Event handling
-        # OPTIMIZATION: try using C implemented higher order functions in event loop.
-        for event in pygame.event.get():
-            match event.type:
-                case pygame.QUIT:
-                    sys.exit()
-                case pygame.KEYDOWN:
-                    round_view.round_manager.handle_user_input(event.key)
-                case pygame.MOUSEMOTION:
-                    for button in button_group:
-                        if button.rect.collidepoint(*event.pos):
-                            if not button.is_pressed:
-                                button.selected()
-                        else:
-                            button.unselected()
-                case pygame.MOUSEBUTTONDOWN:
-                    for button in button_group:
-                        if button.rect.collidepoint(*event.pos):
-                            button.pressed()
-                            break
-                case pygame.MOUSEBUTTONUP:
-                    for button in button_group:
-                        if button.rect.collidepoint(*event.pos):
-                            button.released()
-                            break
-
-        # here render game to the screen.
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Caravan game client.")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="report import times and time to first frame, exit with non-zero status over budget.")
+    parser.add_argument("--startup-budget", type=float, default=defaults.Startup.BUDGET.value,
+                        help="allowed time to first frame in milliseconds.")
+    parser.add_argument("--exit-after-first-frame", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
 
-        # Rendering
-        SCREEN.blit(BACKGROUND, (0, 0))
 
-        button_group.update()
-        button_group.draw(SCREEN)
+def main(argv: Optional[list[str]] = None):
+    """Main game loop."""
+    args = parse_args(argv)
+    if args.startup_profile:
+        # imported here, to keep it off the startup path of the client itself.
+        import gui.utils.startup as startup
+        sys.exit(0 if startup.profile(__file__, args.startup_budget) else 1)
+
+    SCREEN = init_display()
+
+    # Load game assets.
+    BACKGROUND = asset_cache.load_background(SCREEN.get_size())
+    starfield = None
+    if defaults.Starfield.ENABLED.value and starfields.Starfield.available():
+        # Stars are drawn into the background, so the cached surface has to stay untouched.
+        BACKGROUND = BACKGROUND.copy()
+        starfield = starfields.Starfield(BACKGROUND)
+
+    # Client shows the round only for now, summary gets preloaded while it's played.
+    scenes = scene_management.SceneManager.default(game.Game(game.Game.Stages.ROUND))
+    scenes.enter(game.Game.Stages.ROUND)
+    button_group, render_group, hit_index, round_view = create_scene(SCREEN, BACKGROUND)
+    # From now on round manager belongs to the logic thread, the loop only reads its snapshots.
+    logic_thread = worker.LogicThread(round_view.round_manager, on_publish=input_handling.InputLayer.wake_up)
+
+    profiler = profiling.FrameProfiler()
+    profiler_overlay = profiling.ProfilerOverlay(profiler, (30, 30))
+    render_group.add(profiler_overlay, layer=views.Round.Layer.PICKED + 1)
+
+    input_layer = input_handling.InputLayer(hit_index, hotkeys={
+        defaults.Profiler.TOGGLE_KEY.value: profiler.toggle,
+        defaults.Profiler.EXPORT_KEY.value: lambda: profiler.export_csv(defaults.Profiler.CSV_PATH.value)
+    })
+    input_layer.install()
+    pacer = pacing.FramePacer.from_config()
+    logic_thread.start()
+
+    SCREEN.blit(BACKGROUND, (0, 0))
+    pygame.display.flip()
+    dt = 0
 
-        round_view.draw(SCREEN)
+    while True:
+        profiler.begin_frame()
 
-        pygame.display.flip()
-        clock.tick(defaults.FRAMERATE)
+        # Event handling
+        frame_input = input_layer.poll(pacer.pending_events())
+        if frame_input.quit or not logic_thread.is_alive():
+            logic_thread.stop()
+            scenes.shutdown()
+            sys.exit()
+        if frame_input.actions:
+            # idle loop was blocked on the queue, input got into it only when the wait was woken up.
+            profiler.input_received(max(frame_input.queued_after, pacer.woken_at))
+        profiler.mark(profiling.FrameProfiler.Phase.EVENTS)
+
+        # Game logic runs on its own thread.
+        for action in frame_input.actions:
+            logic_thread.submit(action)
+        profiler.mark(profiling.FrameProfiler.Phase.LOGIC)
+
+        # Rendering
+        update_views(button_group, round_view, logic_thread.snapshots, dt)
+        profiler_overlay.update()
+        profiler.mark(profiling.FrameProfiler.Phase.VIEW_UPDATE)
+
+        # Twinkling stars alone don't keep the loop running at full rate.
+        busy = bool(frame_input.events or round_view.animator.is_active
+                    or any(sprite.dirty for sprite in render_group.sprites()))
+        if starfield is not None:
+            # stars are redrawn along with the sprites, sprites over them get redrawn too.
+            for rect in starfield.update(dt):
+                render_group.repaint_rect(rect)
+        dirty_rects = render_group.draw(SCREEN)
+        profiler.mark(profiling.FrameProfiler.Phase.BLIT)
+
+        pygame.display.update(dirty_rects)
+        profiler.mark(profiling.FrameProfiler.Phase.PRESENT)
+        profiler.end_frame()
+
+        if args.exit_after_first_frame:
+            # marker read by gui.utils.startup
+            print(f"FIRST FRAME MS {(time.perf_counter() - STARTED_AT) * 1000:.3f}")
+            return
+
+        dt = pacer.tick(busy)
 
 
 if __name__ == '__main__':
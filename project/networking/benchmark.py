@@ -0,0 +1,84 @@
+# -*- encoding: utf-8 -*-
+
+"""
+Encoding and decoding throughput of the network protocol.
+
+    python -m networking.benchmark [-n MESSAGES]
+
+Reports messages per second of a single core for each message type, along with decoding of a stream
+of mixed messages delivered in chunks, the way it comes from the socket.
+"""
+
+# region STD lib imports
+import argparse
+import itertools as it
+import time
+# endregion
+
+# region Internal imports
+from networking.framing import FrameBuffer
+from networking.messages import Chat, DeltaMessage, Heartbeat, MoveMessage, TableState, decode, encode
+# endregion
+
+
+SAMPLES = {
+    "move": MoveMessage(0, 3, 1, 2, 0, 0),
+    "chat": Chat("good luck, have fun"),
+    "delta": DeltaMessage(1024, 2, 0, 1, 17),
+    "heartbeat": Heartbeat(1234.5678),
+    "table state": TableState(1024, True, (1, 2, 3, 4, 5, 6, 7, 8), 8, 46, 46,
+                              (((3, 50),), ((12,), (17,)), (), ((8,),), ((22, 51), (26,), (30,)), ())),
+}
+# Chunk size of the simulated socket reads.
+CHUNK_SIZE = 1024
+
+
+def rate(count: int, elapsed: float) -> float:
+    return count / elapsed if elapsed > 0 else float("inf")
+
+
+def measure(message, count: int) -> tuple[float, float, int]:
+    """Encoded and decoded messages per second and the size of the frame."""
+    start = time.perf_counter()
+    for _ in range(count):
+        encode(message)
+    encoded = rate(count, time.perf_counter() - start)
+
+    payload = memoryview(encode(message))[2:]
+    start = time.perf_counter()
+    for _ in range(count):
+        decode(payload)
+    decoded = rate(count, time.perf_counter() - start)
+    return encoded, decoded, len(payload) + 2
+
+
+def measure_stream(count: int) -> float:
+    """Decoded messages per second of a stream of mixed messages, including the reassembly of frames."""
+    stream = b"".join(encode(message) for message in it.islice(it.cycle(SAMPLES.values()), count))
+    frames = FrameBuffer()
+    decoded = 0
+    start = time.perf_counter()
+    for offset in range(0, len(stream), CHUNK_SIZE):
+        frames.feed(stream[offset:offset + CHUNK_SIZE])
+        for payload in frames.frames():
+            decode(payload)
+            decoded += 1
+    elapsed = time.perf_counter() - start
+    assert decoded == count
+    return rate(count, elapsed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Network protocol encoding and decoding benchmark.")
+    parser.add_argument("-n", "--messages", type=int, default=200_000, help="messages of each kind.")
+    args = parser.parse_args()
+
+    print(f"{'message':<14}{'bytes':>7}{'encode/s':>14}{'decode/s':>14}")
+    for name, message in SAMPLES.items():
+        encoded, decoded, size = measure(message, args.messages)
+        print(f"{name:<14}{size:>7}{encoded:>14,.0f}{decoded:>14,.0f}")
+    print(f"mixed stream, reassembled and decoded: {measure_stream(args.messages):,.0f} messages/s")
+
+
+if __name__ == "__main__":
+    main()
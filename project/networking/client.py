@@ -1,42 +1,62 @@
+# -*- encoding: utf-8 -*-
+
+"""
+This module exposes the client side of the connection to the game server.
+"""
+
+from __future__ import annotations
+
+# STD lib imports
 import asyncio
+from typing import Callable, Optional
+
+# Internal imports
+from networking.framing import FrameBuffer, FrameError
+from networking.messages import Message, decode, encode
+
 
+HOST = "127.0.0.1"
+PORT = 8888
 
-class EchoClientProtocol(asyncio.Protocol):
-    def __init__(self, message, on_con_lost):
-        self.message = message
-        self.on_con_lost = on_con_lost
 
-    def connection_made(self, transport: asyncio.Transport):
-        transport.write(self.message.encode())
-        print('Data sent: {!r}'.format(self.message))
+class ClientProtocol(asyncio.BufferedProtocol):
+    """Connection to the server, every message received is passed to on_message."""
 
-    def data_received(self, data):
-        print('Data received: {!r}'.format(data.decode()))
+    def __init__(self, on_message: Callable[[Message], None]) -> None:
+        self.on_message = on_message
+        self.frames = FrameBuffer()
+        self.transport: Optional[asyncio.Transport] = None
+        self.closed = asyncio.get_running_loop().create_future()
 
-    def connection_lost(self, exc):
-        print('The server closed the connection')
-        self.on_con_lost.set_result(True)
+    def send(self, message: Message) -> None:
+        self.transport.write(encode(message))
 
+    def close(self) -> None:
+        self.transport.close()
 
-async def main():
-    # Get a reference to the event loop as we plan to use
-    # low-level APIs.
-    loop = asyncio.get_running_loop()
+    # Interface implementations
+    # region asyncio.BufferedProtocol
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self.transport = transport
 
-    on_con_lost = loop.create_future()
-    message = 'Hello World!'
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self.frames.get_buffer(sizehint)
 
-    transport, protocol = await loop.create_connection(
-        lambda: EchoClientProtocol(message, on_con_lost),
-        '127.0.0.1', 8888
-    )
+    def buffer_updated(self, nbytes: int) -> None:
+        self.frames.buffer_updated(nbytes)
+        try:
+            for payload in self.frames.frames():
+                self.on_message(decode(payload))
+        except (FrameError, ValueError):
+            # server doesn't send malformed messages, something is badly wrong.
+            self.close()
 
-    # Wait until the protocol signals that the connection
-    # is lost and close the transport.
-    try:
-        await on_con_lost
-    finally:
-        transport.close()
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        if not self.closed.done():
+            self.closed.set_result(exc)
+    # endregion
 
 
-asyncio.run(main())
+async def connect(on_message: Callable[[Message], None], host: str = HOST, port: int = PORT) -> ClientProtocol:
+    _, protocol = await asyncio.get_running_loop().create_connection(lambda: ClientProtocol(on_message), host, port)
+    return protocol
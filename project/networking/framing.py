@@ -0,0 +1,89 @@
+# -*- encoding: utf-8 -*-
+
+"""
+This module exposes the framing layer of the network protocol.
+
+Every message is sent as a frame: payload length (2 bytes, network order) followed by the payload.
+TCP delivers a stream, so a frame may arrive split into several chunks or together with other frames.
+FrameBuffer reassembles them: data is received straight into its fixed buffer (see asyncio.BufferedProtocol)
+and complete frames are handed out as memoryviews of it, so payloads are never copied.
+"""
+
+from __future__ import annotations
+
+# STD lib imports
+import struct
+from typing import Iterator
+
+
+LENGTH = struct.Struct("!H")
+MAX_FRAME_SIZE = 4096  # longest payload accepted by default.
+
+
+class FrameError(ValueError):
+    """Stream doesn't hold valid frames, connection can't go on."""
+
+
+def frame(payload: bytes) -> bytes:
+    return LENGTH.pack(len(payload)) + payload
+
+
+class FrameBuffer:
+    """Streaming reassembly buffer of length-prefixed frames.
+
+    Buffer holds incomplete data between start and end. It never grows, incomplete frame is moved
+    to the front only when there isn't enough room after it.
+    """
+
+    def __init__(self, max_frame_size: int = MAX_FRAME_SIZE) -> None:
+        self.max_frame_size = max_frame_size
+        self.data = bytearray(2 * (LENGTH.size + max_frame_size))
+        self.view = memoryview(self.data)
+        self.start = 0
+        self.end = 0
+
+    def __len__(self) -> int:
+        """Number of bytes waiting for the rest of their frame."""
+        return self.end - self.start
+
+    def get_buffer(self, sizehint: int = -1) -> memoryview:
+        """Free part of the buffer that received data should be written into."""
+        if self.start == self.end:
+            self.start = self.end = 0
+        elif len(self.data) - self.end < max(sizehint, LENGTH.size + self.max_frame_size - len(self)):
+            # only the tail of a single incomplete frame is moved.
+            pending = len(self)
+            self.data[:pending] = self.view[self.start:self.end]
+            self.start, self.end = 0, pending
+        return self.view[self.end:]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        self.end += nbytes
+
+    def feed(self, data: bytes) -> None:
+        """Copy the data into the buffer, for callers that don't receive into get_buffer directly."""
+        view = memoryview(data)
+        while view:
+            buffer = self.get_buffer(len(view))
+            if not buffer:
+                raise FrameError("buffer is full, complete frames have to be taken out first")
+            written = min(len(buffer), len(view))
+            buffer[:written] = view[:written]
+            self.buffer_updated(written)
+            view = view[written:]
+
+    def frames(self) -> Iterator[memoryview]:
+        """Payloads of the complete frames received so far.
+
+        Payloads are views of the buffer, they are valid only until the next call to get_buffer.
+        FrameError is raised if the frame is longer than allowed.
+        """
+        while self.end - self.start >= LENGTH.size:
+            (length,) = LENGTH.unpack_from(self.data, self.start)
+            if length > self.max_frame_size:
+                raise FrameError(f"frame of {length} bytes exceeds {self.max_frame_size}")
+            payload_start = self.start + LENGTH.size
+            if self.end - payload_start < length:
+                return
+            self.start = payload_start + length
+            yield self.view[payload_start:self.start]
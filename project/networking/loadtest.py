@@ -0,0 +1,280 @@
+# -*- encoding: utf-8 -*-
+
+"""
+Load test of the game server with simulated players.
+
+    python -m networking.loadtest [-c CLIENTS] [-d SECONDS] [--think SECONDS] [--chat PROBABILITY] [--memory]
+
+Starts the server in a process of its own and connects the bots to it. Each bot joins a table, plays random
+legal moves after its think time, chats now and then and sends heartbeats. Bot whose game can't go on joins
+another table. Bots share a single process, with short think times it may become the bottleneck before
+the server does - move round trips grow while the server process is not fully busy.
+
+Reports round trip times of each kind of message as p50/p95/p99 and a histogram:
+    move      - move sent until the first delta of it arrives,
+    heartbeat - heartbeat sent until it's echoed back,
+    chat      - chat sent until the opponent gets it,
+moves played by the server per second and, with --memory, memory the server allocates per table.
+Tracing the memory slows everything down, so the round trip times of such a run aren't representative.
+"""
+
+from __future__ import annotations
+
+# region STD lib imports
+import argparse
+import asyncio
+import bisect
+import itertools as it
+import multiprocessing
+import random
+import tracemalloc
+from collections import defaultdict
+from multiprocessing.connection import Connection
+from typing import NamedTuple, Optional
+
+try:
+    import resource
+except ImportError:  # not available on Windows.
+    resource = None
+# endregion
+
+# region Internal imports
+import games.caravan.logic.moves as moves
+import server as game_server
+from networking.client import HOST, ClientProtocol, connect
+from networking.messages import Chat, DeltaMessage, Heartbeat, Join, Message, MoveMessage, Rejected, TableState
+from networking.sync import RemoteTable
+from utils.stats import percentiles
+# endregion
+
+
+CLIENTS = 1000
+DURATION = 10.0
+THINK_TIME = 0.5         # mean, actual think time is drawn from 0.5 to 1.5 of it.
+CHAT_PROBABILITY = 0.05  # of sending a chat along with a move.
+HEARTBEAT_INTERVAL = 1.0
+RAMP_UP = 2.0            # bots connect gradually, not to overflow the listen backlog.
+TRACE_DEPTH = 16         # deep enough to reach the server's frames from the allocations of the round.
+# Upper bounds of the histogram buckets, in milliseconds.
+BUCKETS = (0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)
+HISTOGRAM_WIDTH = 40
+
+
+class Stats:
+    """Measurements shared by all the bots."""
+
+    def __init__(self) -> None:
+        # Round trip times of each kind of message, in seconds.
+        self.round_trips: dict[str, list[float]] = defaultdict(list)
+        self.games = 0
+        self.rejected = 0
+        self.connection_errors = 0
+
+    def record(self, kind: str, seconds: float) -> None:
+        self.round_trips[kind].append(seconds)
+
+    def histogram(self, kind: str) -> list[int]:
+        """Number of the round trips in each bucket, the last one holds the longer ones."""
+        counts = [0] * (len(BUCKETS) + 1)
+        for seconds in self.round_trips[kind]:
+            counts[bisect.bisect_left(BUCKETS, seconds * 1000)] += 1
+        return counts
+
+
+class Bot:
+    """Simulated player, driven by the messages of the server and its timers - it has no task of its own."""
+
+    def __init__(self, stats: Stats, think_time: float, chat_probability: float, rng: random.Random) -> None:
+        self.stats = stats
+        self.think_time = think_time
+        self.chat_probability = chat_probability
+        self.rng = rng
+        self.loop = asyncio.get_running_loop()
+        self.client: Optional[ClientProtocol] = None
+        self.table = RemoteTable()
+        self.move_sent_at: Optional[float] = None
+        self.move_timer: Optional[asyncio.TimerHandle] = None
+        self.heartbeat_timer: Optional[asyncio.TimerHandle] = None
+
+    async def run(self, port: int, until: float, delay: float = 0.0) -> None:
+        """Play games one after another until the time is up."""
+        await asyncio.sleep(delay)
+        while self.loop.time() < until:
+            try:
+                self.client = await connect(self.receive, HOST, port)
+            except OSError:
+                self.stats.connection_errors += 1
+                await asyncio.sleep(self.rng.uniform(0, 1))
+                continue
+            self.table = RemoteTable()
+            self.move_sent_at = None
+            self.client.send(Join())
+            self.heartbeat()
+            try:
+                await asyncio.wait_for(asyncio.shield(self.client.closed), until - self.loop.time())
+                self.stats.games += 1
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                self.leave()
+
+    def leave(self) -> None:
+        for timer in (self.move_timer, self.heartbeat_timer):
+            if timer is not None:
+                timer.cancel()
+        self.move_timer = self.heartbeat_timer = None
+        self.client.close()
+
+    def heartbeat(self) -> None:
+        self.client.send(Heartbeat(self.loop.time()))
+        self.heartbeat_timer = self.loop.call_later(HEARTBEAT_INTERVAL, self.heartbeat)
+
+    def move(self) -> None:
+        self.move_timer = None
+        legal_moves = moves.legal_moves(self.table.round_manager())
+        if not legal_moves:
+            # game is over for the bot, the opponent gets disconnected too.
+            self.client.close()
+            return
+        self.move_sent_at = self.loop.time()
+        self.client.send(MoveMessage.from_move(self.rng.choice(legal_moves)))
+        if self.rng.random() < self.chat_probability:
+            self.client.send(Chat(f"gl hf {self.loop.time()!r}"))
+
+    def receive(self, message: Message) -> None:
+        now = self.loop.time()
+        match message:
+            case Heartbeat(sent_at):
+                self.stats.record("heartbeat", now - sent_at)
+            case Chat(text):
+                self.stats.record("chat", now - float(text.rpartition(" ")[2]))
+            case Rejected():
+                # copy of the table went out of sync, there is no point in going on.
+                self.stats.rejected += 1
+                self.client.close()
+            case DeltaMessage() | TableState():
+                if self.move_sent_at is not None:
+                    self.stats.record("move", now - self.move_sent_at)
+                    self.move_sent_at = None
+                was_turn = self.table.your_turn
+                if (reply := self.table.receive(message)) is not None:
+                    self.client.send(reply)
+                # deltas of own move come before the one that passes the turn, it's still the bot's turn.
+                if self.table.your_turn and not was_turn:
+                    think_time = self.think_time * self.rng.uniform(0.5, 1.5)
+                    self.move_timer = self.loop.call_later(think_time, self.move)
+
+
+def raise_open_files_limit() -> None:
+    """Every bot takes two sockets, one on each end of its connection."""
+    if resource is not None:
+        _, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+class ServerStats(NamedTuple):
+    moves_played: int
+    tables: int
+    memory_per_table: Optional[float]  # bytes, only if the memory is traced.
+
+
+def memory_per_table(server: game_server.Server) -> float:
+    """Bytes allocated by the server that are still in use, per open table."""
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(True, game_server.__file__, all_frames=True)]
+    )
+    return sum(trace.size for trace in snapshot.traces) / max(len(server.tables), 1)
+
+
+def run_server(pipe: Connection, trace_memory: bool) -> None:
+    """Server process, it sends its port and then answers the requests for its stats until it's stopped."""
+    asyncio.run(serve(pipe, trace_memory))
+
+
+async def serve(pipe: Connection, trace_memory: bool) -> None:
+    if trace_memory:
+        tracemalloc.start(TRACE_DEPTH)
+    server = game_server.Server()
+    listener = await server.start(HOST, 0)
+    pipe.send(listener.sockets[0].getsockname()[1])
+    loop = asyncio.get_running_loop()
+    while await loop.run_in_executor(None, pipe.recv):
+        memory = memory_per_table(server) if trace_memory else None
+        pipe.send(ServerStats(server.moves_played, len(server.tables), memory))
+    listener.close()
+    await listener.wait_closed()
+
+
+class ServerProcess:
+    """Game server running in a process of its own, so that the bots don't take its CPU time."""
+
+    def __init__(self, trace_memory: bool = False) -> None:
+        self.pipe, server_pipe = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=run_server, args=(server_pipe, trace_memory), daemon=True)
+        self.process.start()
+        self.port: int = self.pipe.recv()
+
+    def stats(self) -> ServerStats:
+        self.pipe.send(True)
+        return self.pipe.recv()
+
+    def stop(self) -> None:
+        self.pipe.send(False)
+        self.process.join()
+
+
+async def load_test(server: ServerProcess, clients: int, duration: float, think_time: float,
+                    chat_probability: float) -> tuple[Stats, ServerStats]:
+    """Run the bots against the server, return their measurements and the stats of the server at the peak."""
+    loop = asyncio.get_running_loop()
+    until = loop.time() + duration
+    stats = Stats()
+    bots = [Bot(stats, think_time, chat_probability, random.Random(seed)) for seed in range(clients)]
+    runs = [asyncio.create_task(bot.run(server.port, until, index * min(RAMP_UP, duration / 2) / clients))
+            for index, bot in enumerate(bots)]
+    # tables are all running by now.
+    await asyncio.sleep(duration * 3 / 4)
+    peak = await loop.run_in_executor(None, server.stats)
+    await asyncio.gather(*runs)
+    return stats, peak
+
+
+def report(stats: Stats, peak: ServerStats, moves_played: int, duration: float) -> None:
+    print(f"{'round trip':<12}{'count':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for kind, samples in sorted(stats.round_trips.items()):
+        p50, p95, p99 = (_ * 1000 for _ in percentiles(samples))
+        print(f"{kind:<12}{len(samples):>9}{p50:>10.2f}{p95:>10.2f}{p99:>10.2f}")
+    for kind in sorted(stats.round_trips):
+        counts = stats.histogram(kind)
+        print(f"\n{kind} round trip histogram")
+        for bound, count in zip(it.chain((f"<= {_:g} ms" for _ in BUCKETS), ("longer",)), counts):
+            bar = "#" * round(HISTOGRAM_WIDTH * count / max(max(counts), 1))
+            print(f"{bound:>12} {count:>9} {bar}")
+    print(f"\nmoves played by the server: {moves_played} ({moves_played / duration:,.0f}/s)")
+    print(f"tables open: {peak.tables}, games finished: {stats.games}, moves rejected: {stats.rejected}, "
+          f"connection errors: {stats.connection_errors}")
+    if peak.memory_per_table is not None:
+        print(f"memory per table: {peak.memory_per_table / 1024:.1f} KiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test of the game server with simulated players.")
+    parser.add_argument("-c", "--clients", type=int, default=CLIENTS)
+    parser.add_argument("-d", "--duration", type=float, default=DURATION, help="seconds.")
+    parser.add_argument("--think", type=float, default=THINK_TIME, help="mean think time of a bot, in seconds.")
+    parser.add_argument("--chat", type=float, default=CHAT_PROBABILITY, help="probability of a chat with a move.")
+    parser.add_argument("--memory", action="store_true", help="measure memory per table, slows everything down.")
+    args = parser.parse_args()
+
+    raise_open_files_limit()
+    server = ServerProcess(args.memory)
+    try:
+        stats, peak = asyncio.run(load_test(server, args.clients, args.duration, args.think, args.chat))
+        moves_played = server.stats().moves_played
+    finally:
+        server.stop()
+    report(stats, peak, moves_played, args.duration)
+
+
+if __name__ == "__main__":
+    main()
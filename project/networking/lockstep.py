@@ -0,0 +1,155 @@
+# -*- encoding: utf-8 -*-
+
+"""
+This module exposes the lockstep mode of the game, in which peers play the round themselves.
+
+The round is fully determined by the order of the decks and the moves, so peers only agree on the decks and
+then exchange moves - each one replays them on its own RoundManager. The server relays the messages and
+does nothing else (see server.RelayTable).
+
+Order of a deck is drawn from the owner's secret seed and the nonce of the opponent, so neither of them can
+pick it alone. Peers first send Commit - hash of their secret, then Nonce once the opponent has committed.
+During the round each peer knows only its own deck, cards of the opponent are revealed as they are played.
+At the end peers Reveal their secrets, the opponent checks them against the commitments and replays
+the whole round with both decks known, so a card played from outside of the deck gets caught.
+
+    peer = Peer(seat)                  # once Joined, seat of the top player starts the round.
+    send(peer.commit())
+    reply = peer.receive(message)      # Commit, Nonce, PeerMove and Reveal of the opponent.
+    send(peer.play(move))              # own moves.
+    send(peer.reveal())
+"""
+
+from __future__ import annotations
+
+# STD lib imports
+import hashlib
+import random
+import secrets
+from typing import NamedTuple, Optional
+
+# Internal imports
+import games.caravan.logic.moves as moves
+from games.caravan.logic.moves import Move, TurnBasedRound
+from games.caravan.logic.round import DEFAULT_DECK, Deck, Player, RoundManager, Table
+from networking.messages import (HIDDEN, SEED_SIZE, Commit, Message, Nonce, PeerMove, Reveal, card_code,
+                                 card_from_code)
+
+
+class LockstepError(ValueError):
+    """Opponent broke the rules or the protocol, the game can't go on."""
+
+
+def commitment(secret: bytes) -> bytes:
+    return hashlib.sha256(secret).digest()
+
+
+def deck_order(secret: bytes, nonce: bytes) -> Deck:
+    """Deck of the owner of the secret, shuffled the same way by both peers."""
+    deck = Deck.default()
+    deck.shuffle(random.Random(hashlib.sha256(secret + nonce).digest()))
+    return deck
+
+
+def new_round(own_deck: Deck, opponent_deck: Deck, moves_first: bool) -> TurnBasedRound:
+    """Round as seen by the peer, who sits at the bottom."""
+    round_manager = TurnBasedRound(Table({Player.Position.BOTTOM: Player.dealt(own_deck),
+                                          Player.Position.TOP: Player.dealt(opponent_deck)}),
+                                   RoundManager.State.SELECT_CARD)
+    if not moves_first:
+        round_manager.make_active(Player.Position.TOP)
+    return round_manager
+
+
+class PlayedMove(NamedTuple):
+    player: Player.Position
+    move: Move
+    card: int  # code of the card revealed by the move.
+
+
+class Peer:
+    """One side of a lockstep game, positions are relative to it - as in the messages of the server."""
+
+    def __init__(self, seat: Player.Position, secret: Optional[bytes] = None, nonce: Optional[bytes] = None) -> None:
+        # Player in the bottom seat moves first.
+        self.seat = seat
+        self.secret = secret if secret is not None else secrets.token_bytes(SEED_SIZE)
+        self.nonce = nonce if nonce is not None else secrets.token_bytes(SEED_SIZE)
+        self.opponent_digest: Optional[bytes] = None
+        self.opponent_nonce: Optional[bytes] = None
+        self.round_manager: Optional[TurnBasedRound] = None
+        self.history: list[PlayedMove] = []
+        self.verified = False
+
+    def commit(self) -> Commit:
+        return Commit(commitment(self.secret))
+
+    def reveal(self) -> Reveal:
+        return Reveal(self.secret)
+
+    def play(self, move: Move) -> Optional[PeerMove]:
+        """Make own move, return the message for the opponent or None if the move is illegal."""
+        if self.round_manager is None or self.round_manager.active_player is not Player.Position.BOTTOM:
+            return None
+        if not moves.is_legal(self.round_manager, move):
+            return None
+        hand = self.round_manager.table.players[Player.Position.BOTTOM].hand.sequence
+        card = hand[move.hand_index] if move.kind is Move.Kind.PLACE else None
+        moves.play(self.round_manager, move)
+        message = PeerMove.from_move(move, card)
+        self.history.append(PlayedMove(Player.Position.BOTTOM, move, message.card))
+        return message
+
+    def receive(self, message: Message) -> Optional[Message]:
+        """Handle the message of the opponent, return the reply if there is one.
+
+        LockstepError is raised if the opponent cheated or broke the protocol.
+        """
+        match message:
+            case Commit(digest) if self.opponent_digest is None:
+                self.opponent_digest = digest
+                return Nonce(self.nonce)
+            case Nonce(nonce) if self.opponent_digest is not None and self.round_manager is None:
+                self.opponent_nonce = nonce
+                opponent_deck = Deck([HIDDEN] * len(DEFAULT_DECK))
+                self.round_manager = new_round(deck_order(self.secret, nonce), opponent_deck,
+                                               self.seat is Player.Position.BOTTOM)
+            case PeerMove() if self.round_manager is not None:
+                self.replay(message)
+            case Reveal(secret) if self.round_manager is not None:
+                self.verify(secret)
+            case _:
+                raise LockstepError(f"unexpected {type(message).__name__}")
+        return None
+
+    def replay(self, message: PeerMove) -> None:
+        if self.round_manager.active_player is not Player.Position.TOP:
+            raise LockstepError("opponent moved out of turn")
+        try:
+            move = message.to_move()
+            card = card_from_code(message.card) if move.kind is Move.Kind.PLACE else None
+        except (IndexError, TypeError) as error:
+            raise LockstepError("malformed move") from error
+        # opponent sits at the bottom of their own table.
+        move = move._replace(player=move.player.other())
+        hand = self.round_manager.table.players[Player.Position.TOP].hand.sequence
+        if card is not None and 0 <= move.hand_index < len(hand):
+            hand[move.hand_index] = card
+        if not moves.play(self.round_manager, move):
+            raise LockstepError("illegal move")
+        self.history.append(PlayedMove(Player.Position.TOP, move, message.card))
+
+    def verify(self, secret: bytes) -> None:
+        """Replay the round with the deck of the opponent known, check every card they have revealed."""
+        if commitment(secret) != self.opponent_digest:
+            raise LockstepError("secret doesn't match the commitment")
+        round_manager = new_round(deck_order(self.secret, self.opponent_nonce), deck_order(secret, self.nonce),
+                                  self.seat is Player.Position.BOTTOM)
+        for player, move, card in self.history:
+            if move.kind is Move.Kind.PLACE:
+                played = round_manager.table.players[player].hand.sequence[move.hand_index]
+                if card_code(played) != card:
+                    raise LockstepError(f"{card_from_code(card)} was not in the hand")
+            if not moves.play(round_manager, move):
+                raise LockstepError("illegal move")
+        self.verified = True
@@ -0,0 +1,322 @@
+# -*- encoding: utf-8 -*-
+
+"""
+This module exposes messages exchanged by the game client and the server, along with their encoding.
+
+Messages only hold plain values (ints, strings, tuples of ints). Each one is sent as a single frame
+(see networking.framing) - message type byte followed by the struct packed body. Positions in the messages
+are always relative to the receiving client, who sits at the bottom of the table.
+
+The server sends the whole table (TableState) only when the client joins or asks for it with Resync,
+every change after that comes as a numbered DeltaMessage of a few bytes. At lockstep tables the server
+only relays the messages of the peers (Commit, Nonce, PeerMove, Reveal), see networking.lockstep.
+"""
+
+from __future__ import annotations
+
+# STD lib imports
+import struct
+from enum import Enum, IntEnum
+from typing import Callable, NamedTuple, Optional, Type, TypeVar, Union
+
+# Internal imports
+from games.caravan.logic.moves import Move
+from games.caravan.logic.round import Caravan, Card, PickedCardPosition, Player, Rank, RoundDelta, Suit
+from networking.framing import LENGTH, frame
+
+
+E = TypeVar("E", bound=Enum)
+
+RANKS = list(Rank)
+SUITS = [*Suit, None]
+NONE = 0xFF  # byte of a missing (or hidden) optional value.
+# Stands for a card the client can't see - in the opponent's hand or in a deck.
+HIDDEN = Card(Rank.JOKER, None)
+SEED_SIZE = 16
+DIGEST_SIZE = 32  # sha256
+
+
+# region Plain value conversions
+def index_of(member: Enum) -> int:
+    return list(type(member)).index(member)
+
+
+def member_of(enum: Type[E], index: int) -> E:
+    if index < 0:
+        raise IndexError(f"{enum.__name__} has no member with index {index}")
+    return list(enum)[index]
+
+
+def card_code(card: Card) -> int:
+    """Card as a single small int."""
+    return RANKS.index(card.rank) * len(SUITS) + SUITS.index(card.suit)
+
+
+def card_from_code(code: int) -> Card:
+    rank, suit = divmod(code, len(SUITS))
+    return Card(RANKS[rank], SUITS[suit])
+
+
+def relative_to(seat: Player.Position, position: Player.Position) -> Player.Position:
+    """Position as seen by the player in the seat, who sits at the bottom. It's its own inverse."""
+    return position if seat is Player.Position.BOTTOM else position.other()
+# endregion
+
+
+# region Messages
+class Join(NamedTuple):
+    """Client asks for a seat at the table, any table with a free seat if table_id is negative.
+
+    At a lockstep table the round is played by the peers themselves, the server only relays their messages.
+    """
+    table_id: int = -1
+    lockstep: bool = False
+
+
+class Joined(NamedTuple):
+    """Client has been seated at the table, round starts once the other seat is taken.
+
+    Seat is the index of the client's Player.Position at the table, the player in the bottom seat moves first.
+    """
+    table_id: int
+    seat: int
+
+
+class MoveMessage(NamedTuple):
+    """Move of the player, see games.caravan.logic.moves.Move."""
+    kind: int
+    hand_index: int
+    player: int
+    caravan: int
+    card_index: int
+    location: int
+
+    @classmethod
+    def from_move(cls, move: Move) -> MoveMessage:
+        return cls(index_of(move.kind), move.hand_index, index_of(move.player), index_of(move.caravan),
+                   move.card_index, index_of(move.location))
+
+    def to_move(self) -> Move:
+        """Move the message describes, TypeError or IndexError is raised if it's malformed."""
+        if not all(type(field) is int for field in self):
+            raise TypeError("move fields have to be ints")
+        return Move(member_of(Move.Kind, self.kind), self.hand_index, member_of(Player.Position, self.player),
+                    member_of(Caravan.Position, self.caravan), self.card_index,
+                    member_of(PickedCardPosition.Location, self.location))
+
+
+class PeerMove(NamedTuple):
+    """Move of a lockstep peer along with the code of the card it reveals, NONE for a discard."""
+    kind: int
+    hand_index: int
+    player: int
+    caravan: int
+    card_index: int
+    location: int
+    card: int
+
+    @classmethod
+    def from_move(cls, move: Move, card: Optional[Card]) -> PeerMove:
+        return cls(*MoveMessage.from_move(move), NONE if card is None else card_code(card))
+
+    def to_move(self) -> Move:
+        return MoveMessage(*self[:-1]).to_move()
+
+
+class Commit(NamedTuple):
+    """Lockstep peer commits to its secret seed with its hash, before it sees the nonce of the opponent."""
+    digest: bytes
+
+
+class Nonce(NamedTuple):
+    """Lockstep peer's share of the opponent's deck order, sent once the opponent has committed."""
+    nonce: bytes
+
+
+class Reveal(NamedTuple):
+    """Lockstep peer reveals its secret seed, so that the opponent can check its deck and moves."""
+    secret: bytes
+
+
+class Rejected(NamedTuple):
+    """Last message of the client has not been acted upon."""
+
+    class Reason(IntEnum):
+        MALFORMED_MESSAGE = 0
+        MALFORMED_MOVE    = 1
+        NOT_YOUR_TURN     = 2
+        ILLEGAL_MOVE      = 3
+
+    reason: Rejected.Reason
+
+
+class Chat(NamedTuple):
+    text: str
+
+
+class Heartbeat(NamedTuple):
+    """Echoed back by the server as is, sent_at is the sender's clock."""
+    sent_at: float
+
+
+class DeltaMessage(NamedTuple):
+    """Single change of the table as seen by the client, see games.caravan.logic.round.RoundDelta.
+
+    Deltas are numbered by the table, client that misses one asks for the whole table with Resync.
+    Missing values are NONE, so are the cards the opponent draws.
+    """
+    sequence: int
+    kind: int
+    player: int
+    caravan: int = NONE
+    card: int = NONE
+    index: int = NONE
+
+    @classmethod
+    def from_delta(cls, sequence: int, delta: RoundDelta, seat: Player.Position) -> DeltaMessage:
+        player = relative_to(seat, delta.player)
+        hidden = delta.kind is RoundDelta.Kind.HAND_CARD_ADDED and player is Player.Position.TOP
+        return cls(sequence, index_of(delta.kind), index_of(player),
+                   NONE if delta.caravan is None else index_of(delta.caravan),
+                   NONE if delta.card is None or hidden else card_code(delta.card),
+                   NONE if delta.index is None else delta.index)
+
+
+class Resync(NamedTuple):
+    """Client asks for the whole table, sequence is the last delta it has applied."""
+    sequence: int
+
+
+class TableState(NamedTuple):
+    """Whole table as seen by the client, sequence is the last delta it includes.
+
+    Caravans are in RoundManager.caravans() order, each one a tuple of stacks - value card code
+    followed by the codes of the cards applied to it.
+    """
+    sequence: int
+    your_turn: bool
+    hand: tuple[int, ...]
+    opponent_hand_size: int
+    deck_size: int
+    opponent_deck_size: int
+    caravans: tuple[tuple[tuple[int, ...], ...], ...]
+
+
+Message = Union[Join, Joined, MoveMessage, Rejected, Chat, Heartbeat, DeltaMessage, Resync, TableState,
+                PeerMove, Commit, Nonce, Reveal]
+
+# endregion
+
+
+# region Encoding
+class MessageType(IntEnum):
+    JOIN        = 1
+    JOINED      = 2
+    MOVE        = 3
+    REJECTED    = 4
+    CHAT        = 5
+    HEARTBEAT   = 6
+    TABLE_STATE = 7
+    DELTA       = 8
+    RESYNC      = 9
+    PEER_MOVE   = 10
+    COMMIT      = 11
+    NONCE       = 12
+    REVEAL      = 13
+
+
+class FixedLayout(NamedTuple):
+    """Layout of a message whose body has a fixed size."""
+    message_type: MessageType
+    frame: struct.Struct  # whole frame - length, type and body, packed in one go.
+    body: struct.Struct
+
+    @classmethod
+    def of(cls, message_type: MessageType, body_format: str) -> FixedLayout:
+        return cls(message_type, struct.Struct(f"!HB{body_format}"), struct.Struct(f"!{body_format}"))
+
+
+FIXED_LAYOUTS: dict[type, FixedLayout] = {
+    Join:         FixedLayout.of(MessageType.JOIN, "i?"),
+    Joined:       FixedLayout.of(MessageType.JOINED, "IB"),
+    MoveMessage:  FixedLayout.of(MessageType.MOVE, "6B"),
+    Rejected:     FixedLayout.of(MessageType.REJECTED, "B"),
+    Heartbeat:    FixedLayout.of(MessageType.HEARTBEAT, "d"),
+    DeltaMessage: FixedLayout.of(MessageType.DELTA, "I5B"),
+    Resync:       FixedLayout.of(MessageType.RESYNC, "I"),
+    PeerMove:     FixedLayout.of(MessageType.PEER_MOVE, "7B"),
+    Commit:       FixedLayout.of(MessageType.COMMIT, f"{DIGEST_SIZE}s"),
+    Nonce:        FixedLayout.of(MessageType.NONCE, f"{SEED_SIZE}s"),
+    Reveal:       FixedLayout.of(MessageType.REVEAL, f"{SEED_SIZE}s"),
+}
+# sequence, your turn, opponent hand size, deck size, opponent deck size, hand size - then the hand and caravans.
+TABLE_STATE_HEADER = struct.Struct("!BI?BBBB")
+CARAVAN_COUNT = 6
+
+
+def encode(message: Message) -> bytes:
+    """Message as a complete frame."""
+    layout = FIXED_LAYOUTS.get(type(message))
+    if layout is not None:
+        return layout.frame.pack(layout.frame.size - LENGTH.size, layout.message_type, *message)
+    if type(message) is Chat:
+        return frame(bytes((MessageType.CHAT,)) + message.text.encode())
+    if type(message) is TableState:
+        return frame(encode_table_state(message))
+    raise TypeError(f"{type(message).__name__} is not a message")
+
+
+def encode_table_state(state: TableState) -> bytearray:
+    payload = bytearray(TABLE_STATE_HEADER.pack(MessageType.TABLE_STATE, state.sequence, state.your_turn,
+                                                state.opponent_hand_size, state.deck_size,
+                                                state.opponent_deck_size, len(state.hand)))
+    payload += bytes(state.hand)
+    for caravan in state.caravans:
+        payload.append(len(caravan))
+        for stack in caravan:
+            payload.append(len(stack))
+            payload += bytes(stack)
+    return payload
+
+
+def decode_fixed(message_class: type, layout: FixedLayout) -> Callable[[memoryview], Message]:
+    def decode_message(payload: memoryview) -> Message:
+        if len(payload) != 1 + layout.body.size:
+            raise ValueError(f"{message_class.__name__} of wrong size {len(payload)}")
+        return message_class(*layout.body.unpack_from(payload, 1))
+    return decode_message
+
+
+def decode_table_state(payload: memoryview) -> TableState:
+    _, sequence, your_turn, opponent_hand_size, deck_size, opponent_deck_size, hand_size = \
+        TABLE_STATE_HEADER.unpack_from(payload)
+    offset = TABLE_STATE_HEADER.size + hand_size
+    hand = tuple(payload[TABLE_STATE_HEADER.size:offset])
+    caravans = []
+    for _ in range(CARAVAN_COUNT):
+        stacks = []
+        for _ in range(payload[offset]):
+            stack_size = payload[offset + 1]
+            stacks.append(tuple(payload[offset + 2:offset + 2 + stack_size]))
+            offset += 1 + stack_size
+        caravans.append(tuple(stacks))
+        offset += 1
+    if offset != len(payload) or len(hand) != hand_size:
+        raise ValueError("malformed table state")
+    return TableState(sequence, your_turn, hand, opponent_hand_size, deck_size, opponent_deck_size, tuple(caravans))
+
+
+DECODERS: dict[int, Callable[[memoryview], Message]] = {
+    **{layout.message_type: decode_fixed(message_class, layout) for message_class, layout in FIXED_LAYOUTS.items()},
+    MessageType.CHAT: lambda payload: Chat(str(payload[1:], "utf-8")),
+    MessageType.TABLE_STATE: decode_table_state,
+}
+
+
+def decode(payload: memoryview | bytes) -> Message:
+    """Decode payload of a single frame, ValueError is raised if it's not a valid message."""
+    try:
+        return DECODERS[payload[0]](payload)
+    except (KeyError, IndexError, struct.error) as error:
+        raise ValueError(f"invalid message {bytes(payload[:16])!r}") from error
+# endregion
@@ -0,0 +1,122 @@
+# -*- encoding: utf-8 -*-
+
+"""
+This module exposes the client side copy of the table.
+
+Server sends the whole table once, when the round starts, after that only the deltas of the moves.
+RemoteTable applies them in order of their sequence numbers. Deltas are delivered over TCP so they can't
+get reordered, but one can be missing if the client dropped it (e.g. while reconnecting) - then the table
+can't be trusted anymore and the whole one has to be requested again.
+"""
+
+from __future__ import annotations
+
+# STD lib imports
+from typing import Optional
+
+# Internal imports
+from games.caravan.logic.moves import TurnBasedRound
+from games.caravan.logic.round import Caravan, Deck, Hand, Player, RoundDelta, RoundManager, Table
+from networking.messages import (CARAVAN_COUNT, HIDDEN, DeltaMessage, Message, Resync, TableState, card_from_code,
+                                 member_of)
+
+
+class RemoteTable:
+    """Table as seen by the client, kept up to date with the messages of the server."""
+
+    def __init__(self) -> None:
+        # Last delta applied, None until the first TableState arrives.
+        self.sequence: Optional[int] = None
+        self.resyncing = False
+        self.your_turn = False
+        self.hand: list[int] = []
+        self.opponent_hand_size = 0
+        self.deck_size = 0
+        self.opponent_deck_size = 0
+        self.caravans: list[list[list[int]]] = [[] for _ in range(CARAVAN_COUNT)]
+
+    def receive(self, message: Message) -> Optional[Resync]:
+        """Apply the message of the server, Resync is returned if it has to be sent back."""
+        match message:
+            case TableState():
+                self.load(message)
+            case DeltaMessage(sequence=sequence):
+                if self.sequence is None or sequence <= self.sequence or self.resyncing:
+                    # there is no table to apply it to yet, it's already applied, or TableState is on its way.
+                    return None
+                if sequence != self.sequence + 1:
+                    self.resyncing = True
+                    return Resync(self.sequence)
+                self.apply(message)
+                self.sequence = sequence
+        return None
+
+    def load(self, state: TableState) -> None:
+        self.sequence = state.sequence
+        self.resyncing = False
+        self.your_turn = state.your_turn
+        self.hand = list(state.hand)
+        self.opponent_hand_size = state.opponent_hand_size
+        self.deck_size = state.deck_size
+        self.opponent_deck_size = state.opponent_deck_size
+        self.caravans = [[list(stack) for stack in caravan] for caravan in state.caravans]
+
+    def apply(self, delta: DeltaMessage) -> None:
+        own = member_of(Player.Position, delta.player) is Player.Position.BOTTOM
+        # caravans of the opponent go first.
+        caravan_index = own * (CARAVAN_COUNT // 2) + delta.caravan
+        match member_of(RoundDelta.Kind, delta.kind):
+            case RoundDelta.Kind.HAND_CARD_REMOVED:
+                if own:
+                    del self.hand[delta.index]
+                else:
+                    self.opponent_hand_size -= 1
+            case RoundDelta.Kind.HAND_CARD_ADDED:
+                if own:
+                    self.hand.insert(delta.index, delta.card)
+                    self.deck_size -= 1
+                else:
+                    self.opponent_hand_size += 1
+                    self.opponent_deck_size -= 1
+            case RoundDelta.Kind.CARAVAN_CARD_APPENDED:
+                self.caravans[caravan_index].append([delta.card])
+            case RoundDelta.Kind.CARAVAN_CARD_APPLIED:
+                self.caravans[caravan_index][delta.index].append(delta.card)
+            case RoundDelta.Kind.CARAVAN_DISCARDED:
+                self.caravans[caravan_index] = []
+            case RoundDelta.Kind.TURN_PASSED:
+                self.your_turn = own
+
+    def round_manager(self) -> TurnBasedRound:
+        """Round as far as the client knows it, cards it can't see are HIDDEN.
+
+        It's enough to find the legal moves of the client, see games.caravan.logic.moves.legal_moves.
+        """
+        players = {}
+        for position, hand, deck_size, caravans in (
+                (Player.Position.BOTTOM, list(map(card_from_code, self.hand)), self.deck_size,
+                 self.caravans[CARAVAN_COUNT // 2:]),
+                (Player.Position.TOP, [HIDDEN] * self.opponent_hand_size, self.opponent_deck_size,
+                 self.caravans[:CARAVAN_COUNT // 2])):
+            players[position] = Player(Deck([HIDDEN] * deck_size), Hand(hand),
+                                       {caravan_position: caravan_of(stacks)
+                                        for caravan_position, stacks in zip(Caravan.Position, caravans)})
+        round_manager = TurnBasedRound(Table(players), RoundManager.State.SELECT_CARD)
+        if not self.your_turn:
+            round_manager.make_active(Player.Position.TOP)
+        return round_manager
+
+    def state(self) -> TableState:
+        """Copy of the table in the form the server sends it."""
+        return TableState(self.sequence, self.your_turn, tuple(self.hand), self.opponent_hand_size, self.deck_size,
+                          self.opponent_deck_size,
+                          tuple(tuple(map(tuple, caravan)) for caravan in self.caravans))
+
+
+def caravan_of(stacks: list[list[int]]) -> Caravan:
+    caravan = Caravan.default()
+    for value_card, *applied_cards in stacks:
+        caravan.append(card_from_code(value_card))
+        for card in applied_cards:
+            caravan.apply(card_from_code(card), len(caravan) - 1)
+    return caravan
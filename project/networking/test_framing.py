@@ -0,0 +1,54 @@
+# -*- encoding: utf-8 -*-
+
+import unittest
+
+from networking.framing import LENGTH, FrameBuffer, FrameError, frame
+from networking.messages import (Chat, Commit, DeltaMessage, Heartbeat, Join, Joined, MoveMessage, PeerMove,
+                                 Rejected, Resync, TableState, decode, encode)
+
+
+MESSAGES = [
+    Join(), Join(7, True), Joined(7, 1), MoveMessage(0, 3, 1, 2, 0, 0), Rejected(Rejected.Reason.ILLEGAL_MOVE),
+    Chat("zażółć"), Heartbeat(12.5), DeltaMessage(3, 1, 0, 2, 17, 4), Resync(3), PeerMove(0, 3, 1, 2, 0, 0, 17),
+    Commit(bytes(range(32))), TableState(3, True, (1, 2, 3), 8, 40, 41, ((), ((5, 1), (7,)), (), (), ((9,),), ())),
+]
+
+
+class FrameBufferTestCase(unittest.TestCase):
+    def test_frames_split_at_every_byte_are_reassembled(self):
+        stream = b"".join(map(encode, MESSAGES))
+        frames = FrameBuffer()
+        received = []
+        for offset in range(len(stream)):
+            frames.feed(stream[offset:offset + 1])
+            received.extend(decode(payload) for payload in frames.frames())
+
+        self.assertEqual(received, MESSAGES)
+        self.assertEqual(len(frames), 0)
+
+    def test_buffer_does_not_grow(self):
+        frames = FrameBuffer(max_frame_size=64)
+        capacity = len(frames.data)
+        for _ in range(1000):
+            frames.feed(frame(b"x" * 64) + frame(b"y" * 10)[:5])
+            self.assertEqual([bytes(payload) for payload in frames.frames()][-1], b"x" * 64)
+            frames.feed(frame(b"y" * 10)[5:])
+            self.assertEqual([bytes(payload) for payload in frames.frames()], [b"y" * 10])
+
+        self.assertEqual(len(frames.data), capacity)
+
+    def test_oversized_frame_is_an_error(self):
+        frames = FrameBuffer(max_frame_size=16)
+        frames.feed(LENGTH.pack(17))
+
+        with self.assertRaises(FrameError):
+            list(frames.frames())
+
+    def test_malformed_message_is_a_value_error(self):
+        for payload in (b"", b"\xff", b"\x03\x01", b"\x07\x01"):
+            with self.assertRaises(ValueError):
+                decode(payload)
+
+
+if __name__ == '__main__':
+    unittest.main()
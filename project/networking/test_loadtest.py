@@ -0,0 +1,27 @@
+# -*- encoding: utf-8 -*-
+
+import asyncio
+import unittest
+
+from networking.loadtest import ServerProcess, load_test
+
+
+class LoadTestTestCase(unittest.TestCase):
+    def test_bots_play_against_the_server(self):
+        server = ServerProcess(trace_memory=True)
+        try:
+            stats, peak = asyncio.run(load_test(server, 4, 1.0, 0.01, 1.0))
+            moves_played = server.stats().moves_played
+        finally:
+            server.stop()
+
+        self.assertLessEqual(peak.tables, 2)
+        self.assertIsNotNone(peak.memory_per_table)
+        self.assertEqual(stats.rejected, 0)
+        # bot at each table can be left without the deltas of its last move when the time is up.
+        self.assertIn(moves_played - len(stats.round_trips["move"]), range(3))
+        self.assertTrue(stats.round_trips["chat"] and stats.round_trips["heartbeat"])
+
+
+if __name__ == '__main__':
+    unittest.main()
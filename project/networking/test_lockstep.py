@@ -0,0 +1,68 @@
+# -*- encoding: utf-8 -*-
+
+import unittest
+
+import games.caravan.logic.moves as moves
+from games.caravan.logic.moves import Move
+from games.caravan.logic.round import Player, Suit
+from networking.lockstep import LockstepError, Peer
+from networking.messages import SUITS, Reveal, card_code
+
+
+def placement(peer):
+    return next(move for move in moves.legal_moves(peer.round_manager) if move.kind is Move.Kind.PLACE)
+
+
+class LockstepTestCase(unittest.TestCase):
+    def setUp(self):
+        self.bottom, self.top = Peer(Player.Position.BOTTOM), Peer(Player.Position.TOP)
+        commits = self.bottom.commit(), self.top.commit()
+        nonces = self.top.receive(commits[0]), self.bottom.receive(commits[1])
+        self.bottom.receive(nonces[0])
+        self.top.receive(nonces[1])
+
+    def play_turns(self, count):
+        peers = self.bottom, self.top
+        for turn in range(count):
+            peer, opponent = peers[turn % 2], peers[(turn + 1) % 2]
+            message = peer.play(placement(peer))
+            self.assertIsNotNone(message)
+            opponent.receive(message)
+
+    def test_peers_replay_the_same_round(self):
+        self.play_turns(10)
+
+        for peer, opponent in ((self.bottom, self.top), (self.top, self.bottom)):
+            own = peer.round_manager.table.players[Player.Position.BOTTOM]
+            # peer is at the top of the opponent's table.
+            seen = opponent.round_manager.table.players[Player.Position.TOP]
+            for caravan, seen_caravan in zip(own.caravans.values(), seen.caravans.values()):
+                self.assertEqual(list(map(card_code, caravan.cards)), list(map(card_code, seen_caravan.cards)))
+            self.assertEqual((len(own.hand), len(own.deck)), (len(seen.hand), len(seen.deck)))
+
+        self.bottom.receive(self.top.reveal())
+        self.top.receive(self.bottom.reveal())
+        self.assertTrue(self.bottom.verified and self.top.verified)
+
+    def test_card_from_outside_of_the_deck_is_caught(self):
+        self.play_turns(1)
+        message = self.top.play(placement(self.top))
+        # top peer claims it has played the same rank of another suit, which is just as legal on the table.
+        rank, suit = divmod(message.card, len(SUITS))
+        forged = message._replace(card=rank * len(SUITS) + (suit + 1) % len(Suit))
+
+        # the deck of the opponent is unknown until the end, so the move is accepted on arrival...
+        self.assertIsNone(self.bottom.receive(forged))
+        self.assertEqual(self.bottom.history[-1].card, forged.card)
+        # ...and the forged card is caught when the round is replayed with it.
+        with self.assertRaises(LockstepError):
+            self.bottom.receive(self.top.reveal())
+        self.assertFalse(self.bottom.verified)
+
+    def test_secret_has_to_match_the_commitment(self):
+        with self.assertRaises(LockstepError):
+            self.bottom.receive(Reveal(bytes(16)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+# -*- encoding: utf-8 -*-
+
+import unittest
+
+from games.caravan.logic.round import Player, RoundDelta
+from networking.messages import DeltaMessage, Resync, TableState, index_of
+from networking.sync import RemoteTable
+
+
+def turn_passed(sequence: int) -> DeltaMessage:
+    return DeltaMessage(sequence, index_of(RoundDelta.Kind.TURN_PASSED), index_of(Player.Position.BOTTOM))
+
+
+class RemoteTableTestCase(unittest.TestCase):
+    def setUp(self):
+        self.table = RemoteTable()
+        self.table.receive(TableState(5, False, (1, 2), 8, 40, 40, ((),) * 6))
+
+    def test_applied_deltas_are_skipped(self):
+        self.assertIsNone(self.table.receive(turn_passed(5)))
+        self.assertFalse(self.table.your_turn)
+        self.assertIsNone(self.table.receive(turn_passed(6)))
+        self.assertTrue(self.table.your_turn)
+        self.assertEqual(self.table.sequence, 6)
+
+    def test_gap_asks_for_the_whole_table_once(self):
+        self.assertEqual(self.table.receive(turn_passed(7)), Resync(5))
+        self.assertIsNone(self.table.receive(turn_passed(8)))
+        self.assertEqual(self.table.sequence, 5)
+
+        self.table.receive(TableState(8, True, (1, 2), 8, 40, 40, ((),) * 6))
+        self.assertIsNone(self.table.receive(turn_passed(9)))
+        self.assertEqual(self.table.sequence, 9)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,328 @@
 # -*- encoding: utf-8 -*-
 
+"""
+Authoritative caravan game server.
 
-class Server()
+    python server.py [--host HOST] [--port PORT]
+
+Each table runs as a single asyncio task that owns its RoundManager, connections only forward messages
+into the inbox of their table. Moves are validated and made by the table. Players get the whole table
+when the round starts (or when they ask for it with Resync), after that only numbered deltas of the moves,
+each one as seen from their seat - about 50 bytes per move. Memory of a table is bounded: the inbox holds
+at most INBOX_SIZE messages - once it fills up the clients at the table are neither read from nor are
+the frames they have sent already handled until it drains - length of a message and the amount of data
+waiting to be sent to a client are capped.
+Messages are framed and encoded as described in networking.framing and networking.messages.
+
+Clients can also ask for a lockstep table (see networking.lockstep), where they play the round themselves
+and the server only relays their messages.
+"""
+
+from __future__ import annotations
+
+# STD lib imports
+import argparse
+import asyncio
+import itertools as it
+from typing import Optional
+
+# Internal imports
+import games.caravan.logic.moves as moves
+from games.caravan.logic.round import Player, RoundDelta
+from interfaces import IObserver
+from networking.framing import FrameBuffer, FrameError
+from networking.messages import (Chat, Commit, DeltaMessage, Heartbeat, Join, Joined, Message, MoveMessage, Nonce,
+                                 PeerMove, Rejected, Resync, Reveal, TableState, card_code, decode, encode,
+                                 index_of, relative_to)
+
+
+HOST = "127.0.0.1"
+PORT = 8888
+INBOX_SIZE = 16               # messages waiting for the table, a client that sends more gets slowed down.
+MAX_MESSAGE_SIZE = 4096       # longest message accepted from a client.
+MAX_WRITE_BUFFER = 64 * 1024  # client that doesn't read its messages is disconnected.
+
+
+class Connection(asyncio.BufferedProtocol):
+    """Client connected to the server, data is received straight into its frame buffer."""
+
+    def __init__(self, server: Server) -> None:
+        self.server = server
+        self.frames = FrameBuffer(MAX_MESSAGE_SIZE)
+        self.transport: Optional[asyncio.Transport] = None
+        self.table: Optional[RelayTable] = None
+        self.seat: Optional[Player.Position] = None
+        # Frames are left in the buffer, unhandled, while the inbox of the table is full.
+        self.paused = False
+
+    def send(self, message: Message) -> None:
+        if self.transport.is_closing():
+            return
+        if self.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+            self.close()
+            return
+        self.transport.write(encode(message))
+
+    def close(self) -> None:
+        self.transport.close()
+
+    def pause(self) -> None:
+        """Stop reading from the client and handling the frames it has sent already."""
+        self.paused = True
+        self.transport.pause_reading()
+
+    def resume(self) -> None:
+        """Handle the frames left in the buffer, then carry on reading, unless the inbox fills up again."""
+        self.paused = False
+        self.handle_frames()
+        if not self.paused:
+            self.transport.resume_reading()
+
+    def handle_frames(self) -> None:
+        try:
+            for payload in self.frames.frames():
+                try:
+                    message = decode(payload)
+                except ValueError:
+                    self.send(Rejected(Rejected.Reason.MALFORMED_MESSAGE))
+                    continue
+                self.server.receive(self, message)
+                if self.paused:
+                    break
+        except FrameError:
+            self.close()
+
+    # Interface implementations
+    # region asyncio.BufferedProtocol
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self.transport = transport
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self.frames.get_buffer(sizehint)
+
+    def buffer_updated(self, nbytes: int) -> None:
+        self.frames.buffer_updated(nbytes)
+        if not self.paused:
+            self.handle_frames()
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.server.leave(self)
+    # endregion
+
+
+class RelayTable:
+    """Lockstep table of two peers, messages of one are relayed to the other.
+
+    Peers play the round themselves (see networking.lockstep), the server doesn't look into their messages.
+    """
+
+    def __init__(self, table_id: int) -> None:
+        self.table_id = table_id
+        self.moves_played = 0
+        self.seats: dict[Player.Position, Connection] = {}
+        self.inbox: asyncio.Queue[tuple[Player.Position, Message]] = asyncio.Queue(INBOX_SIZE)
+        # Connections that don't get read from until the inbox drains.
+        self.paused: set[Connection] = set()
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def is_full(self) -> bool:
+        return len(self.seats) == len(Player.Position)
+
+    def take_seat(self, connection: Connection) -> Player.Position:
+        seat = Player.Position.BOTTOM if Player.Position.BOTTOM not in self.seats else Player.Position.TOP
+        self.seats[seat] = connection
+        connection.table, connection.seat = self, seat
+        return seat
+
+    def post(self, connection: Connection, message: Message) -> None:
+        """Queue the message of the client for the table, pause the clients at the table once the inbox is full.
+
+        Paused clients can't post, only Joined of a client seated while the inbox is full doesn't fit,
+        such client is disconnected.
+        """
+        try:
+            self.inbox.put_nowait((connection.seat, message))
+        except asyncio.QueueFull:
+            connection.close()
+            return
+        if self.inbox.full():
+            for seated in self.seats.values():
+                seated.pause()
+                self.paused.add(seated)
+
+    async def run(self) -> None:
+        """Task of the table, it's the only code that touches the round manager."""
+        try:
+            while True:
+                seat, message = await self.inbox.get()
+                if self.paused and self.inbox.qsize() <= INBOX_SIZE // 2:
+                    # resumed connection may post until the inbox is full again and pause them anew.
+                    paused, self.paused = self.paused, set()
+                    for connection in paused:
+                        connection.resume()
+                self.handle(seat, message)
+        finally:
+            for connection in self.seats.values():
+                connection.close()
+
+    def handle(self, seat: Player.Position, message: Message) -> None:
+        # top seat is taken last, its Joined tells the bottom peer that the round starts.
+        if type(message) is not Joined or seat is Player.Position.TOP:
+            self.relay(seat, message)
+        if type(message) is PeerMove:
+            self.moves_played += 1
+
+    def relay(self, seat: Player.Position, message: Message) -> None:
+        if (opponent := self.seats.get(seat.other())) is not None:
+            opponent.send(message)
+
+
+class Table(RelayTable, IObserver):
+    """Table of two players.
+
+    Seats are positions in the round manager's table, the player in the top seat sees it upside down.
+    Deltas of the round manager are numbered and sent to both players as seen from their seats.
+    """
+
+    def __init__(self, table_id: int) -> None:
+        super().__init__(table_id)
+        self.round_manager = moves.TurnBasedRound.default()
+        self.round_manager.attach(self)
+        # Number of the last delta sent.
+        self.sequence = 0
+
+    def handle(self, seat: Player.Position, message: Message) -> None:
+        match message:
+            case Joined() if seat is Player.Position.TOP:
+                # top seat is taken last, the round starts.
+                self.broadcast_state()
+            case MoveMessage():
+                self.make_move(seat, message)
+            case Resync() if self.is_full:
+                self.seats[seat].send(self.state_for(seat))
+            case Chat():
+                self.relay(seat, message)
+
+    def make_move(self, seat: Player.Position, message: MoveMessage) -> None:
+        connection = self.seats[seat]
+        if not self.is_full or seat is not self.round_manager.active_player:
+            connection.send(Rejected(Rejected.Reason.NOT_YOUR_TURN))
+            return
+        try:
+            move = message.to_move()
+        except (IndexError, TypeError):
+            connection.send(Rejected(Rejected.Reason.MALFORMED_MOVE))
+            return
+        move = move._replace(player=relative_to(seat, move.player))
+        if not moves.play(self.round_manager, move):
+            connection.send(Rejected(Rejected.Reason.ILLEGAL_MOVE))
+            return
+        self.moves_played += 1
+
+    def state_for(self, seat: Player.Position) -> TableState:
+        """Table as seen by the player in the seat - they are at the bottom."""
+        own, opponent = seat, seat.other()
+        players = self.round_manager.table.players
+        caravans = tuple(
+            tuple((card_code(card), *map(card_code, caravan.applied_face_cards[index]))
+                  for index, card in enumerate(caravan.cards))
+            for position in (opponent, own) for caravan in players[position].caravans.values()
+        )
+        return TableState(self.sequence, seat is self.round_manager.active_player,
+                          tuple(map(card_code, players[own].hand.sequence)), len(players[opponent].hand),
+                          len(players[own].deck), len(players[opponent].deck), caravans)
+
+    def broadcast_state(self) -> None:
+        for seat, connection in self.seats.items():
+            connection.send(self.state_for(seat))
+
+    # Interface implementations
+    # region IObserver
+    def update(self, delta: RoundDelta) -> None:
+        self.sequence += 1
+        for seat, connection in self.seats.items():
+            connection.send(DeltaMessage.from_delta(self.sequence, delta, seat))
+    # endregion
+
+
+class Server:
+    """Hosts the tables, pairs up connecting clients."""
+
+    def __init__(self) -> None:
+        self.tables: dict[int, RelayTable] = {}
+        # Table of each kind with a single player waiting for the opponent.
+        self.waiting: dict[type[RelayTable], RelayTable] = {}
+        # Moves played at the tables that are already closed.
+        self.closed_moves_played = 0
+        self.__table_ids = it.count()
+
+    @property
+    def moves_played(self) -> int:
+        return self.closed_moves_played + sum(table.moves_played for table in self.tables.values())
+
+    def open_table(self, table_type: type[RelayTable]) -> RelayTable:
+        table = table_type(next(self.__table_ids))
+        self.tables[table.table_id] = table
+        table.task = asyncio.create_task(self.run_table(table))
+        return table
+
+    async def run_table(self, table: RelayTable) -> None:
+        try:
+            await table.run()
+        finally:
+            self.closed_moves_played += table.moves_played
+            del self.tables[table.table_id]
+            if self.waiting.get(type(table)) is table:
+                del self.waiting[type(table)]
+
+    def seat(self, connection: Connection, table_id: int, table_type: type[RelayTable] = Table) -> RelayTable:
+        """Seat the client at the table, at the waiting table of the kind or at a new one."""
+        table = self.tables.get(table_id)
+        if table is None or table.is_full or type(table) is not table_type:
+            table = self.waiting.get(table_type)
+            if table is None or table.is_full:
+                table = self.waiting[table_type] = self.open_table(table_type)
+        table.take_seat(connection)
+        if table.is_full and self.waiting.get(table_type) is table:
+            del self.waiting[table_type]
+        return table
+
+    def receive(self, connection: Connection, message: Message) -> None:
+        match message:
+            case Heartbeat():
+                connection.send(message)
+            case Join(table_id, lockstep) if connection.table is None:
+                table = self.seat(connection, table_id, RelayTable if lockstep else Table)
+                joined = Joined(table.table_id, index_of(connection.seat))
+                connection.send(joined)
+                table.post(connection, joined)
+            case (MoveMessage() | Resync() | Chat() | PeerMove() | Commit() | Nonce() | Reveal()) \
+                    if connection.table is not None:
+                connection.table.post(connection, message)
+
+    def leave(self, connection: Connection) -> None:
+        # game can't go on without the player.
+        if connection.table is not None and connection.table.task is not None:
+            connection.table.task.cancel()
+
+    async def start(self, host: str = HOST, port: int = PORT) -> asyncio.Server:
+        return await asyncio.get_running_loop().create_server(lambda: Connection(self), host, port)
+
+
+async def serve(host: str, port: int) -> None:
+    server = await Server().start(host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Caravan game server.")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    args = parser.parse_args()
+    asyncio.run(serve(args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
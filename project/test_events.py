@@ -0,0 +1,92 @@
+# -*- encoding: utf-8 -*-
+
+import asyncio
+import threading
+import unittest
+
+from events import Dispatcher
+from games.caravan.logic.round import RoundDelta, RoundManager
+
+
+class DispatcherTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dispatcher = Dispatcher()
+        self.numbers = self.dispatcher.topic("numbers", int)
+        self.words = self.dispatcher.topic("words", str)
+
+    def test_events_are_delivered_on_flush_in_order(self):
+        received = []
+        self.dispatcher.subscribe(self.numbers, received.append)
+        self.dispatcher.subscribe(self.words, received.append)
+        for event in (1, "two", 3):
+            self.dispatcher.publish(self.words if isinstance(event, str) else self.numbers, event)
+
+        self.assertEqual(received, [])
+        self.assertEqual(self.dispatcher.flush(), 3)
+        self.assertEqual(received, [1, "two", 3])
+
+    def test_events_published_during_flush_wait_for_the_next_one(self):
+        received = []
+        self.dispatcher.subscribe(self.numbers, lambda event: self.dispatcher.publish(self.words, str(event)))
+        self.dispatcher.subscribe(self.words, received.append)
+        self.dispatcher.publish(self.numbers, 7)
+
+        self.dispatcher.flush()
+        self.assertEqual(received, [])
+        self.dispatcher.flush()
+        self.assertEqual(received, ["7"])
+
+    def test_topics_are_typed(self):
+        self.assertIs(self.dispatcher.topic("numbers", int), self.numbers)
+        with self.assertRaises(TypeError):
+            self.dispatcher.topic("numbers", str)
+        with self.assertRaises(TypeError):
+            self.dispatcher.publish(self.numbers, "seven")
+
+    def test_unsubscribed_get_nothing(self):
+        received = []
+        self.dispatcher.subscribe(self.numbers, received.append)
+        self.dispatcher.unsubscribe(self.numbers, received.append)
+        self.dispatcher.publish(self.numbers, 1)
+        self.dispatcher.flush()
+        self.assertEqual((received, self.numbers.subscribers), ([], ()))
+
+    def test_round_deltas_are_published(self):
+        received = []
+        deltas = self.dispatcher.topic("deltas", RoundDelta)
+        self.dispatcher.subscribe(deltas, received.append)
+        round_manager = RoundManager.default()
+        round_manager.attach(self.dispatcher.observer(deltas))
+
+        round_manager.pick_selected_card()
+        round_manager.place_picked_card()
+        self.dispatcher.flush()
+        self.assertEqual([delta.kind for delta in received],
+                         [RoundDelta.Kind.CARAVAN_CARD_APPENDED, RoundDelta.Kind.HAND_CARD_REMOVED,
+                          RoundDelta.Kind.HAND_CARD_ADDED])
+
+
+class AsyncSubscriberTestCase(unittest.IsolatedAsyncioTestCase):
+    async def test_coroutine_subscribers_get_events_from_any_thread(self):
+        dispatcher = Dispatcher()
+        numbers = dispatcher.topic("numbers", int)
+        received = []
+
+        async def subscriber(event):
+            await asyncio.sleep(0)
+            received.append(event)
+
+        dispatcher.subscribe(numbers, subscriber)
+        dispatcher.publish(numbers, 1)
+        dispatcher.flush()
+        # game loop flushes from its own thread.
+        dispatcher.publish(numbers, 2)
+        flushing = threading.Thread(target=dispatcher.flush)
+        flushing.start()
+        await asyncio.to_thread(flushing.join)
+        await dispatcher.drain()
+        self.assertEqual(sorted(received), [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
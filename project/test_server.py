@@ -0,0 +1,146 @@
+# -*- encoding: utf-8 -*-
+
+import asyncio
+import unittest
+
+import games.caravan.logic.moves as moves
+from games.caravan.logic.moves import Move
+from games.caravan.logic.round import Caravan, Player, RoundDelta
+from networking.client import connect
+from networking.lockstep import Peer
+from networking.messages import (Chat, DeltaMessage, Join, Joined, MoveMessage, Nonce, Rejected, Resync,
+                                 TableState, encode, index_of)
+from networking.sync import RemoteTable
+from server import INBOX_SIZE, Server
+
+
+class ServerTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = Server()
+        self.listener = await self.server.start("127.0.0.1", 0)
+        self.port = self.listener.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.listener.close()
+        await self.listener.wait_closed()
+
+    async def connect(self):
+        inbox = asyncio.Queue()
+        client = await connect(inbox.put_nowait, "127.0.0.1", self.port)
+        self.addCleanup(client.close)
+        return client, inbox
+
+    @staticmethod
+    async def receive(inbox):
+        return await asyncio.wait_for(inbox.get(), 1)
+
+    async def seat_players(self):
+        first, second = await self.connect(), await self.connect()
+        for client, _ in (first, second):
+            client.send(Join())
+        for _, inbox in (first, second):
+            self.assertIsInstance(await self.receive(inbox), Joined)
+        return first, second
+
+    async def test_players_get_the_table_once_seated(self):
+        (_, first_inbox), (_, second_inbox) = await self.seat_players()
+
+        first_state, second_state = await self.receive(first_inbox), await self.receive(second_inbox)
+        self.assertIsInstance(first_state, TableState)
+        self.assertTrue(first_state.your_turn)
+        self.assertFalse(second_state.your_turn)
+        self.assertEqual(len(self.server.tables), 1)
+
+    async def test_move_is_validated_and_turn_passes(self):
+        (first, first_inbox), (second, second_inbox) = await self.seat_players()
+        await self.receive(first_inbox), await self.receive(second_inbox)
+
+        second.send(MoveMessage.from_move(Move(Move.Kind.PLACE)))
+        self.assertEqual(await self.receive(second_inbox), Rejected(Rejected.Reason.NOT_YOUR_TURN))
+        first.send(MoveMessage.from_move(Move(Move.Kind.DISCARD)))
+        self.assertEqual(await self.receive(first_inbox), Rejected(Rejected.Reason.ILLEGAL_MOVE))
+
+        first.send(MoveMessage.from_move(Move(Move.Kind.PLACE, 0, Player.Position.BOTTOM, Caravan.Position.LEFT)))
+        first_delta, second_delta = await self.receive(first_inbox), await self.receive(second_inbox)
+        self.assertIsInstance(first_delta, DeltaMessage)
+        self.assertEqual(first_delta.sequence, 1)
+        # each player sees their own caravans at the bottom.
+        self.assertEqual(first_delta.player, index_of(Player.Position.BOTTOM))
+        self.assertEqual(second_delta.player, index_of(Player.Position.TOP))
+
+    async def test_deltas_keep_the_tables_of_players_up_to_date(self):
+        (first, first_inbox), (second, second_inbox) = await self.seat_players()
+        tables = RemoteTable(), RemoteTable()
+        for table, inbox in zip(tables, (first_inbox, second_inbox)):
+            table.receive(await self.receive(inbox))
+
+        # top player places on their own left caravan, which they see at the bottom too.
+        for client in (first, second):
+            client.send(MoveMessage.from_move(Move(Move.Kind.PLACE, 0, Player.Position.BOTTOM, Caravan.Position.LEFT)))
+            for table, table_inbox in zip(tables, (first_inbox, second_inbox)):
+                while (delta := await self.receive(table_inbox)).kind != index_of(RoundDelta.Kind.TURN_PASSED):
+                    table.receive(delta)
+                table.receive(delta)
+
+        server_table = next(iter(self.server.tables.values()))
+        for table, seat in zip(tables, (Player.Position.BOTTOM, Player.Position.TOP)):
+            self.assertEqual(table.state(), server_table.state_for(seat))
+        self.assertTrue(tables[0].your_turn)
+        self.assertEqual(tables[0].caravans[0], tables[1].caravans[3])
+        # bottom seat sees the table as it is.
+        self.assertEqual(moves.legal_moves(tables[0].round_manager()), moves.legal_moves(server_table.round_manager))
+
+    async def test_whole_table_is_sent_on_resync(self):
+        (first, first_inbox), (_, second_inbox) = await self.seat_players()
+        state = await self.receive(first_inbox)
+
+        first.send(Resync(state.sequence))
+        self.assertEqual(await self.receive(first_inbox), state)
+
+    async def test_chat_is_relayed_to_the_opponent(self):
+        (first, first_inbox), (_, second_inbox) = await self.seat_players()
+        await self.receive(first_inbox), await self.receive(second_inbox)
+
+        first.send(Chat("good luck"))
+        self.assertEqual(await self.receive(second_inbox), Chat("good luck"))
+
+    async def test_burst_of_messages_is_handled_within_the_inbox(self):
+        (first, first_inbox), (_, second_inbox) = await self.seat_players()
+        await self.receive(first_inbox), await self.receive(second_inbox)
+        table, = self.server.tables.values()
+
+        # all of the frames arrive in a single read, far more than fit into the inbox.
+        chats = [Chat(str(index)) for index in range(5 * INBOX_SIZE)]
+        first.transport.write(b"".join(map(encode, chats)))
+        for chat in chats:
+            self.assertEqual(await self.receive(second_inbox), chat)
+            self.assertLessEqual(table.inbox.qsize(), INBOX_SIZE)
+        self.assertEqual((table.inbox.maxsize, table.paused), (INBOX_SIZE, set()))
+
+    async def test_lockstep_peers_get_each_others_messages(self):
+        (bottom, bottom_inbox), (top, top_inbox) = await self.connect(), await self.connect()
+        for client in (bottom, top):
+            client.send(Join(lockstep=True))
+        bottom_joined, top_joined = await self.receive(bottom_inbox), await self.receive(top_inbox)
+        self.assertEqual(top_joined.seat, index_of(Player.Position.TOP))
+        # top seat is taken, bottom peer learns the round starts.
+        self.assertEqual(await self.receive(bottom_inbox), top_joined)
+
+        peers = Peer(Player.Position.BOTTOM), Peer(Player.Position.TOP)
+        bottom.send(peers[0].commit())
+        self.assertEqual(await self.receive(top_inbox), peers[0].commit())
+        top.send(peers[1].receive(peers[0].commit()))
+        self.assertEqual(await self.receive(bottom_inbox), Nonce(peers[1].nonce))
+        self.assertFalse(hasattr(self.server.tables[bottom_joined.table_id], "round_manager"))
+
+    async def test_table_is_closed_when_player_leaves(self):
+        (first, first_inbox), (second, second_inbox) = await self.seat_players()
+        await self.receive(first_inbox), await self.receive(second_inbox)
+
+        first.close()
+        await asyncio.wait_for(second.closed, 1)
+        self.assertEqual(self.server.tables, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,17 @@
+# -*- encoding: utf-8 -*-
+
+"""
+This module exposes summary statistics shared by the profilers of the client and the server:
+    - percentiles   -- nearest rank percentiles of timing samples.
+"""
+
+# STD lib imports
+import math
+
+
+def percentiles(samples: list[float], ranks: tuple[int, ...] = (50, 95, 99)) -> tuple[float, ...]:
+    """Nearest rank percentiles of the samples, NaN entries are skipped."""
+    ordered = sorted(_ for _ in samples if not math.isnan(_))
+    if not ordered:
+        return tuple(math.nan for _ in ranks)
+    return tuple(ordered[min(len(ordered) - 1, math.ceil(rank / 100 * len(ordered)) - 1)] for rank in ranks)
@@ -0,0 +1,24 @@
+# -*- encoding: utf-8 -*-
+
+import math
+import unittest
+
+from utils.stats import percentiles
+
+
+class PercentilesTestCase(unittest.TestCase):
+    def test_nearest_rank(self):
+        samples = [float(_) for _ in range(1, 101)]
+
+        self.assertEqual(percentiles(samples), (50.0, 95.0, 99.0))
+        self.assertEqual(percentiles(samples, (1, 100)), (1.0, 100.0))
+        self.assertEqual(percentiles([3.0, 1.0, 2.0], (50,)), (2.0,))
+
+    def test_nan_samples_are_skipped(self):
+        self.assertEqual(percentiles([7.0, math.nan]), (7.0, 7.0, 7.0))
+        self.assertTrue(all(map(math.isnan, percentiles([]))))
+        self.assertTrue(all(map(math.isnan, percentiles([math.nan]))))
+
+
+if __name__ == '__main__':
+    unittest.main()